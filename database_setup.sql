@@ -15,10 +15,14 @@ CREATE TABLE IF NOT EXISTS games (
     id INT AUTO_INCREMENT PRIMARY KEY,
     
     -- Séquence des coups joués (ex: '431256')
-    coups VARCHAR(500) NOT NULL,
+    -- ASCII binaire : 1 octet par caractère, comparaison octet par octet,
+    -- colonne assez courte pour être indexée entièrement
+    coups VARCHAR(255) CHARACTER SET ascii COLLATE ascii_bin NOT NULL,
     
-    -- Séquence symétrique calculée (ex: '679854' pour coups='431256')
-    coups_symetrique VARCHAR(500) NOT NULL,
+    -- Séquence symétrique (ex: '679854' pour coups='431256'), calculée par le
+    -- serveur : colonne c -> 10 - c, via des lettres intermédiaires (b..j)
+    coups_symetrique VARCHAR(255) CHARACTER SET ascii COLLATE ascii_bin
+        AS (REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(coups, '1', 'b'), '2', 'c'), '3', 'd'), '4', 'e'), '6', 'g'), '7', 'h'), '8', 'i'), '9', 'j'), 'b', '9'), 'c', '8'), 'd', '7'), 'e', '6'), 'g', '4'), 'h', '3'), 'i', '2'), 'j', '1')) STORED,
     
     -- Chaînage : ID de la partie précédente (tri par coups)
     id_antecedent INT DEFAULT NULL,
@@ -32,8 +36,8 @@ CREATE TABLE IF NOT EXISTS games (
     -- Statut : 'EN_COURS', 'TERMINEE', 'ABANDONNEE'
     statut VARCHAR(50) DEFAULT 'EN_COURS',
     
-    -- Coordonnées de l'alignement gagnant (format JSON)
-    ligne_gagnante TEXT DEFAULT NULL,
+    -- Coordonnées de l'alignement gagnant (JSON validé par le serveur)
+    ligne_gagnante JSON DEFAULT NULL,
     
     -- Numéro optionnel de la partie
     numero INT DEFAULT NULL,
@@ -41,9 +45,12 @@ CREATE TABLE IF NOT EXISTS games (
     -- Date de création
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     
-    -- Index pour optimiser les recherches et le tri
-    INDEX idx_coups (coups(255)),
-    INDEX idx_coups_sym (coups_symetrique(255)),
+    -- Forme canonique : une partie et son symétrique partagent la même valeur
+    canon VARCHAR(255) CHARACTER SET ascii COLLATE ascii_bin AS (LEAST(coups, coups_symetrique)) STORED,
+    
+    -- Index : unicité des séquences (et des symétriques via canon), tri par date
+    UNIQUE KEY uq_coups (coups),
+    UNIQUE KEY uq_canon (canon),
     INDEX idx_created (created_at)
     
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
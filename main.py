@@ -6,6 +6,8 @@ Usage:
     python main.py
 """
 
+import logging
+
 from src.views.pygame_view import PygameView
 from src.controllers.game_controller import GameController
 from src.utils.settings_manager import SettingsManager
@@ -26,6 +28,10 @@ def main() -> None:
     3. Partie
     4. Retour au menu
     """
+    # Journalisation : seuls les avertissements et erreurs sont affichés
+    # (passer à logging.DEBUG pour suivre les coups du plateau)
+    logging.basicConfig(level=logging.WARNING, format="[%(name)s %(levelname)s] %(message)s")
+    
     # Initialisation du gestionnaire de paramètres
     settings_manager = SettingsManager()
     
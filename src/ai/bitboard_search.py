@@ -0,0 +1,156 @@
+"""
+Module de recherche Alpha-Beta sur bitboards.
+Noyau de recherche sans objet Board : la position est codée par deux entiers.
+
+Codage (identique à Board) : H = rows + 1 bits par colonne, la case
+(row, col) correspond au bit col * H + row ; le bit supplémentaire au-dessus
+de chaque colonne reste toujours à 0 et sépare les colonnes.
+
+API optionnelle, exposée par Game.best_move() : MinimaxAI ne l'utilise pas
+(elle garde son évaluation heuristique). La recherche ne détecte que les
+victoires et défaites forcées à l'horizon.
+"""
+
+from functools import lru_cache
+from typing import Optional
+
+from ..utils.constants import WIN_LENGTH
+
+
+# Score d'une victoire (augmenté de la profondeur restante : gagner vite vaut plus)
+WIN_SCORE: int = 1_000_000
+
+
+@lru_cache(maxsize=None)
+def _layout(rows: int, cols: int) -> tuple[tuple[int, ...], tuple[int, ...], tuple[int, ...], tuple[int, ...]]:
+    """
+    Précalcule les constantes du codage pour un plateau rows x cols.
+    
+    Args:
+        rows: Nombre de lignes du plateau
+        cols: Nombre de colonnes du plateau
+    
+    Returns:
+        Tuple (ordre des colonnes, bit du bas par colonne,
+        masque par colonne, décalages des 4 directions)
+    """
+    height = rows + 1
+    
+    # Colonnes centrales d'abord : meilleurs coups en premier, plus d'élagage
+    order = tuple(sorted(range(cols), key=lambda col: abs(2 * col - (cols - 1))))
+    bottom = tuple(1 << (col * height) for col in range(cols))
+    column = tuple(((1 << rows) - 1) << (col * height) for col in range(cols))
+    shifts = (height, 1, height + 1, height - 1)
+    
+    return order, bottom, column, shifts
+
+
+def _is_win(bits: int, shifts: tuple[int, ...]) -> bool:
+    """
+    Teste si un bitboard contient WIN_LENGTH pions alignés.
+    
+    Args:
+        bits: Pions d'un joueur
+        shifts: Décalages des 4 directions
+    
+    Returns:
+        True si un alignement gagnant est présent
+    """
+    for shift in shifts:
+        m = bits
+        for _ in range(WIN_LENGTH - 1):
+            m &= m >> shift
+        if m:
+            return True
+    
+    return False
+
+
+def alphabeta(
+    own: int,
+    mask: int,
+    depth: int,
+    alpha: int,
+    beta: int,
+    rows: int,
+    cols: int
+) -> int:
+    """
+    Recherche Alpha-Beta (forme negamax) sur bitboards.
+    
+    Le score est toujours exprimé du point de vue du joueur au trait :
+    WIN_SCORE + profondeur restante pour une victoire, l'opposé pour une
+    défaite, 0 pour une égalité ou une position non résolue à l'horizon.
+    
+    Args:
+        own: Pions du joueur au trait
+        mask: Pions des deux joueurs (cases occupées)
+        depth: Profondeur restante (en demi-coups)
+        alpha: Borne inférieure de la fenêtre de recherche
+        beta: Borne supérieure de la fenêtre de recherche
+        rows: Nombre de lignes du plateau
+        cols: Nombre de colonnes du plateau
+    
+    Returns:
+        Score de la position pour le joueur au trait
+    """
+    order, bottom, column, shifts = _layout(rows, cols)
+    
+    # Coups jouables : bit de la prochaine case libre de chaque colonne non pleine
+    moves = []
+    for col in order:
+        move = (mask + bottom[col]) & column[col]
+        if move:
+            # Victoire immédiate : inutile d'explorer plus loin
+            if _is_win(own | move, shifts):
+                return WIN_SCORE + depth
+            moves.append(move)
+    
+    if not moves or depth == 0:
+        return 0
+    
+    opponent = own ^ mask
+    for move in moves:
+        # Après le coup, l'adversaire devient le joueur au trait
+        score = -alphabeta(opponent, mask | move, depth - 1, -beta, -alpha, rows, cols)
+        if score > alpha:
+            alpha = score
+            if alpha >= beta:
+                break  # Élagage : l'adversaire évitera cette branche
+    
+    return alpha
+
+
+def best_move(own: int, other: int, rows: int, cols: int, depth: int) -> Optional[int]:
+    """
+    Choisit la meilleure colonne pour le joueur au trait.
+    
+    Args:
+        own: Pions du joueur au trait
+        other: Pions de l'adversaire
+        rows: Nombre de lignes du plateau
+        cols: Nombre de colonnes du plateau
+        depth: Profondeur de recherche (en demi-coups, minimum 1)
+    
+    Returns:
+        Index de la colonne choisie, ou None si aucun coup n'est possible
+    """
+    order, bottom, column, shifts = _layout(rows, cols)
+    mask = own | other
+    best_col = None
+    alpha = -WIN_SCORE - depth - 1
+    
+    for col in order:
+        move = (mask + bottom[col]) & column[col]
+        if not move:
+            continue
+        if _is_win(own | move, shifts):
+            return col
+        
+        # Appel de la racine sur le coup joué : même règle que dans alphabeta
+        score = -alphabeta(other, mask | move, depth - 1, -WIN_SCORE - depth - 1, -alpha, rows, cols)
+        if best_col is None or score > alpha:
+            alpha = score
+            best_col = col
+    
+    return best_col
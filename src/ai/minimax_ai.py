@@ -7,6 +7,8 @@ import random
 from typing import Optional, Tuple
 from copy import deepcopy
 
+import numpy as np
+
 from ..models.board import Board
 from ..utils.constants import EMPTY, PLAYER1, PLAYER2, WIN_LENGTH
 
@@ -51,48 +53,9 @@ class MinimaxAI:
             piece: PLAYER1 ou PLAYER2
         """
         self.piece = piece
-        self.opponent_piece = PLAYER1 if piece == PLAYER2 else PLAYER2
+        self.opponent_piece = 3 - piece  # PLAYER1 + PLAYER2 == 3
         print(f"[MINIMAX AI] Configuration : IA = Joueur {self.piece}, Adversaire = Joueur {self.opponent_piece}")
     
-    def evaluate_window(self, window: list[int], piece: int) -> int:
-        """
-        Évalue une fenêtre de 4 cases et retourne un score.
-        
-        Cette fonction attribue des points en fonction de la composition de la fenêtre :
-        - 4 pions alignés : victoire (+100)
-        - 3 pions + 1 vide : très bon (+5)
-        - 2 pions + 2 vides : prometteur (+2)
-        - 3 pions adverses + 1 vide : danger, il faut bloquer (-4)
-        
-        Args:
-            window: Liste de 4 valeurs (EMPTY, PLAYER1, ou PLAYER2)
-            piece: Le joueur pour lequel on évalue (self.piece)
-            
-        Returns:
-            Score de la fenêtre (positif = bon pour 'piece', négatif = bon pour l'adversaire)
-        """
-        score = 0
-        opponent = self.opponent_piece
-        
-        # Comptage des pions dans la fenêtre
-        piece_count = window.count(piece)
-        empty_count = window.count(EMPTY)
-        opponent_count = window.count(opponent)
-        
-        # Évaluation selon la composition
-        if piece_count == 4:
-            score += 100  # Victoire !
-        elif piece_count == 3 and empty_count == 1:
-            score += 5    # Presque gagné, très prometteur
-        elif piece_count == 2 and empty_count == 2:
-            score += 2    # Début d'alignement
-        
-        # Pénalité si l'adversaire est menaçant
-        if opponent_count == 3 and empty_count == 1:
-            score -= 4    # L'adversaire peut gagner au prochain coup, c'est critique !
-        
-        return score
-    
     def score_position(self, board: Board, piece: int) -> int:
         """
         Évalue l'état global du plateau pour un joueur donné.
@@ -107,46 +70,29 @@ class MinimaxAI:
         Returns:
             Score total du plateau (plus élevé = meilleur pour 'piece')
         """
-        score = 0
-        rows = board.rows
-        cols = board.cols
+        grid = board.grid
         
         # === BONUS CENTRE ===
         # Les pions au centre offrent plus de possibilités d'alignements
-        center_col = cols // 2
-        center_array = [int(board.grid[row][center_col]) for row in range(rows)]
-        center_count = center_array.count(piece)
-        score += center_count * 3  # Bonus de 3 points par pion au centre
-        
-        # === ÉVALUATION HORIZONTALE ===
-        # Parcourt chaque ligne et crée des fenêtres de 4 cases
-        for row in range(rows):
-            row_array = [int(board.grid[row][col]) for col in range(cols)]
-            for col in range(cols - 3):
-                window = row_array[col:col + WIN_LENGTH]
-                score += self.evaluate_window(window, piece)
-        
-        # === ÉVALUATION VERTICALE ===
-        # Parcourt chaque colonne et crée des fenêtres de 4 cases
-        for col in range(cols):
-            col_array = [int(board.grid[row][col]) for row in range(rows)]
-            for row in range(rows - 3):
-                window = col_array[row:row + WIN_LENGTH]
-                score += self.evaluate_window(window, piece)
-        
-        # === ÉVALUATION DIAGONALE ASCENDANTE (/) ===
-        # Diagonales qui montent de gauche à droite
-        for row in range(rows - 3):
-            for col in range(cols - 3):
-                window = [board.grid[row + i][col + i] for i in range(WIN_LENGTH)]
-                score += self.evaluate_window(window, piece)
-        
-        # === ÉVALUATION DIAGONALE DESCENDANTE (\) ===
-        # Diagonales qui descendent de gauche à droite
-        for row in range(3, rows):
-            for col in range(cols - 3):
-                window = [board.grid[row - i][col + i] for i in range(WIN_LENGTH)]
-                score += self.evaluate_window(window, piece)
+        center_count = int(np.count_nonzero(grid[:, board.cols // 2] == piece))
+        score = center_count * 3  # Bonus de 3 points par pion au centre
+        
+        # === ÉVALUATION DE TOUTES LES FENÊTRES EN UNE PASSE ===
+        # Comptages par fenêtre (une indexation numpy, aucune boucle Python par case)
+        windows = board.get_line_windows()
+        piece_count = np.count_nonzero(windows == piece, axis=1)
+        empty_count = np.count_nonzero(windows == EMPTY, axis=1)
+        opponent_count = np.count_nonzero(windows == self.opponent_piece, axis=1)
+        
+        # Barème par fenêtre de 4 cases, appliqué à toutes les fenêtres :
+        # - WIN_LENGTH pions alignés : victoire (+100)
+        # - 3 pions + 1 vide : très bon (+5)
+        # - 2 pions + 2 vides : prometteur (+2)
+        # - 3 pions adverses + 1 vide : danger, il faut bloquer (-4)
+        score += 100 * int(np.count_nonzero(piece_count == WIN_LENGTH))
+        score += 5 * int(np.count_nonzero((piece_count == 3) & (empty_count == 1)))
+        score += 2 * int(np.count_nonzero((piece_count == 2) & (empty_count == 2)))
+        score -= 4 * int(np.count_nonzero((opponent_count == 3) & (empty_count == 1)))
         
         return score
     
@@ -209,24 +155,32 @@ class MinimaxAI:
                 # Profondeur maximale atteinte : évaluation heuristique
                 return (None, self.score_position(board, self.piece))
         
+        # Méthodes liées une fois pour toutes : la boucle de simulation
+        # n'effectue plus de recherche d'attribut à chaque coup
+        get_next_open_row = board.get_next_open_row
+        drop_piece = board.drop_piece
+        undo_last_move = board.undo_last_move
+        minimax = self.minimax
+        
         # === CAS RÉCURSIF : Joueur MAX (IA) ===
         if maximizing_player:
+            piece = self.piece
             value = float('-inf')
             # Sélection aléatoire d'une colonne valide par défaut
             column = random.choice(valid_locations)
             
             for col in valid_locations:
                 # Simulation du coup
-                row = board.get_next_open_row(col)
+                row = get_next_open_row(col)
                 if row is None:
                     continue
                 
-                # Copie du plateau pour simulation
-                temp_board = board.copy()
-                temp_board.drop_piece(row, col, self.piece)
+                # Simulation en place : jouer, explorer, annuler (pas de copie)
+                drop_piece(row, col, piece)
                 
                 # Appel récursif pour l'adversaire (MIN)
-                new_score = self.minimax(temp_board, depth - 1, alpha, beta, False)[1]
+                new_score = minimax(board, depth - 1, alpha, beta, False)[1]
+                undo_last_move()
                 
                 # Mise à jour du meilleur score
                 if new_score > value:
@@ -242,21 +196,22 @@ class MinimaxAI:
         
         # === CAS RÉCURSIF : Joueur MIN (Adversaire) ===
         else:
+            piece = self.opponent_piece
             value = float('inf')
             column = random.choice(valid_locations)
             
             for col in valid_locations:
                 # Simulation du coup
-                row = board.get_next_open_row(col)
+                row = get_next_open_row(col)
                 if row is None:
                     continue
                 
-                # Copie du plateau pour simulation
-                temp_board = board.copy()
-                temp_board.drop_piece(row, col, self.opponent_piece)
+                # Simulation en place : jouer, explorer, annuler (pas de copie)
+                drop_piece(row, col, piece)
                 
                 # Appel récursif pour l'IA (MAX)
-                new_score = self.minimax(temp_board, depth - 1, alpha, beta, True)[1]
+                new_score = minimax(board, depth - 1, alpha, beta, True)[1]
+                undo_last_move()
                 
                 # Mise à jour du pire score (du point de vue de l'IA)
                 if new_score < value:
@@ -295,14 +250,19 @@ class MinimaxAI:
             print("[MINIMAX AI] ❌ Aucun coup valide disponible")
             return None
         
+        # Une seule copie à la racine : toute la recherche joue/annule en
+        # place sur ce plateau de travail, le plateau de la partie reste intact
+        board = board.copy()
+        
         # === DÉTECTION VICTOIRE IMMÉDIATE ===
         # Si l'IA peut gagner en un coup, jouer immédiatement sans calcul
         for col in valid_locations:
             row = board.get_next_open_row(col)
             if row is not None:
-                temp_board = board.copy()
-                temp_board.drop_piece(row, col, self.piece)
-                if temp_board.check_win(self.piece):
+                board.drop_piece(row, col, self.piece)
+                is_winning = board.check_win_last(row, col, self.piece)
+                board.undo_last_move()
+                if is_winning:
                     print(f"[MINIMAX AI] 🎯 Coup gagnant détecté : colonne {col}")
                     return col
         
@@ -311,9 +271,10 @@ class MinimaxAI:
         for col in valid_locations:
             row = board.get_next_open_row(col)
             if row is not None:
-                temp_board = board.copy()
-                temp_board.drop_piece(row, col, self.opponent_piece)
-                if temp_board.check_win(self.opponent_piece):
+                board.drop_piece(row, col, self.opponent_piece)
+                is_threat = board.check_win_last(row, col, self.opponent_piece)
+                board.undo_last_move()
+                if is_threat:
                     print(f"[MINIMAX AI] 🛡️ Blocage nécessaire : colonne {col}")
                     return col
         
@@ -322,9 +283,9 @@ class MinimaxAI:
         for col in valid_locations:
             row = board.get_next_open_row(col)
             if row is not None:
-                temp_board = board.copy()
-                temp_board.drop_piece(row, col, self.piece)
-                score = self.score_position(temp_board, self.piece)
+                board.drop_piece(row, col, self.piece)
+                score = self.score_position(board, self.piece)
+                board.undo_last_move()
                 self.last_scores[col] = score
         
         # Lancement de l'algorithme Minimax
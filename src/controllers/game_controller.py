@@ -5,20 +5,33 @@ Gère une machine à états (Menu -> Jeu -> Retour au Menu).
 """
 
 from typing import Optional
+from itertools import islice
 import pygame
 import sys
 import time
 import subprocess
 import platform
+import json
+import ast
 
 from ..models.game import Game
+from ..models.board import Board
 from ..views.pygame_view import PygameView
 from ..ai.random_ai import RandomAI
 from ..ai.minimax_ai import MinimaxAI
-from ..utils.enums import AppState
+from ..utils.enums import AppState, GameMode, GameState
 from ..utils import data_manager
 from ..utils.config_manager import ConfigManager
 from ..utils.settings_manager import SettingsManager
+from ..utils.constants import SQUARESIZE, HEADER_HEIGHT
+
+# mysql-connector est optionnel : sans lui le jeu reste jouable hors ligne,
+# seules les fonctions de base de données (sauvegarde, historique, replay,
+# import) sont désactivées
+try:
+    from ..utils.db_manager import DatabaseManager
+except ImportError:
+    DatabaseManager = None
 
 
 class GameController:
@@ -39,7 +52,7 @@ class GameController:
         view: Instance de la vue Pygame
         game: Instance du modèle de jeu (créée au lancement d'une partie)
         state: État actuel de l'application (AppState)
-        gamemode: Mode de jeu ("PvP" ou "PvAI")
+        gamemode: Mode de jeu (GameMode)
         ai: Instance de l'IA (None si mode PvP)
         ai_player: Numéro du joueur contrôlé par l'IA (2 par défaut)
     """
@@ -54,7 +67,7 @@ class GameController:
         self.view: PygameView = view
         self.game: Optional[Game] = None
         self.state: AppState = AppState.MENU  # Démarrage sur le menu
-        self.gamemode: str = "PvP"
+        self.gamemode: GameMode = GameMode.PVP
         self.ai: Optional[RandomAI] = None
         self.ai_player: int = 2
         self.ai2: Optional[RandomAI] = None  # Deuxième IA pour le mode AIvsAI
@@ -63,6 +76,7 @@ class GameController:
         self.fps: int = 60  # Limite de rafraîchissement
         self.config_manager: ConfigManager = ConfigManager()  # Gestionnaire de configuration
         self.settings_manager: SettingsManager = SettingsManager()  # Gestionnaire de paramètres
+        self._db: Optional["DatabaseManager"] = None  # Connexion MySQL réutilisée entre les parties
         
         print("[CONTROLLER DEBUG] Contrôleur initialisé - État : MENU")
     
@@ -88,7 +102,7 @@ class GameController:
                 self.run_settings()
             
             elif self.state == AppState.GAME:
-                print(f"[CONTROLLER DEBUG] État : GAME (Mode: {self.gamemode})")
+                print(f"[CONTROLLER DEBUG] État : GAME (Mode: {self.gamemode.label})")
                 self.run_game()
             
             elif self.state == AppState.GAME_OVER:
@@ -105,6 +119,7 @@ class GameController:
         
         # Fermeture propre
         print("\n[CONTROLLER DEBUG] === FERMETURE DE L'APPLICATION ===")
+        self._close_db()
         self.view.quit()
     
     def _refresh_game_display(self, mouse_x: Optional[int] = None) -> None:
@@ -118,18 +133,27 @@ class GameController:
         Args:
             mouse_x: Position X de la souris (optionnel) pour afficher le pion fantôme
         """
-        self.view.draw_board(self.game.board, mouse_x, self.game.get_current_player())
+        self.view.draw_board(self.game.board, mouse_x, self.game.current_player)
         
         # Affichage des informations de la partie (ID et nombre de coups)
-        move_count = len(self.game.move_history)
+        move_count = self.game.move_count
         self.view.draw_game_info(self.game.game_id, move_count)
         
         # Affichage du sélecteur de profondeur en mode PvAI
-        if self.gamemode == "PvAI" and hasattr(self.ai, 'depth'):
+        if self.gamemode is GameMode.PVAI and hasattr(self.ai, 'depth'):
             self.depth_selector_rects = self.view.draw_depth_selector(self.ai.depth)
         
         self.view.update_display()
     
+    def _is_ai_turn(self) -> bool:
+        """
+        Indique si c'est au tour de l'IA de jouer en mode PvAI.
+        
+        Returns:
+            True si mode PvAI et que le joueur courant est celui de l'IA
+        """
+        return self.gamemode is GameMode.PVAI and self.game.current_player == self.ai_player
+    
     def _select_import_file(self) -> Optional[str]:
         """
         Ouvre un explorateur de fichiers pour sélectionner un fichier .txt à importer.
@@ -192,9 +216,6 @@ class GameController:
         """
         menu_active = True
         
-        # Import du DatabaseManager pour l'importation
-        from ..utils.db_manager import DatabaseManager
-        
         while menu_active and self.state == AppState.MENU:
             self.clock.tick(self.fps)
             
@@ -217,7 +238,7 @@ class GameController:
                     # Clic sur "Joueur vs Joueur"
                     if pvp_rect.collidepoint(mouse_pos):
                         print("[CONTROLLER DEBUG] Mode sélectionné : PvP")
-                        self.gamemode = "PvP"
+                        self.gamemode = GameMode.PVP
                         self.ai = None
                         self.ai2 = None
                         self.state = AppState.GAME
@@ -226,7 +247,7 @@ class GameController:
                     # Clic sur "Joueur vs IA"
                     elif pvai_rect.collidepoint(mouse_pos):
                         print("[CONTROLLER DEBUG] Mode sélectionné : PvAI")
-                        self.gamemode = "PvAI"
+                        self.gamemode = GameMode.PVAI
                         # Utilisation de MinimaxAI avec profondeur 4 (configurable)
                         ai_depth = 4  # Peut être récupéré depuis la config si besoin
                         self.ai = MinimaxAI(depth=ai_depth, name="Minimax AI")
@@ -238,7 +259,7 @@ class GameController:
                     # Clic sur "MODE DÉMO (IA vs IA)"
                     elif demo_rect.collidepoint(mouse_pos):
                         print("[CONTROLLER DEBUG] Mode sélectionné : AIvsAI (MODE DÉMO)")
-                        self.gamemode = "AIvsAI"
+                        self.gamemode = GameMode.AI_VS_AI
                         # Création de deux IAs : IA1 (Joueur 1) et IA2 (Joueur 2)
                         self.ai = MinimaxAI(depth=4, name="Minimax IA Rouge")
                         self.ai_player = 1
@@ -263,6 +284,14 @@ class GameController:
                     elif import_rect.collidepoint(mouse_pos):
                         print("[CONTROLLER DEBUG] Bouton IMPORTER cliqué")
                         
+                        # Import impossible sans le pilote MySQL
+                        if DatabaseManager is None:
+                            print("[DB] ⚠️ mysql-connector non installé : import désactivé")
+                            self.view.draw_status_message("Base de données indisponible", "error")
+                            self.view.update_display()
+                            time.sleep(3)
+                            continue
+                        
                         # Ouverture de l'explorateur de fichiers
                         file_path = self._select_import_file()
                         
@@ -318,10 +347,7 @@ class GameController:
                         
                         # Fermeture de la connexion MySQL si elle existe
                         try:
-                            db = DatabaseManager()
-                            if db.connection and db.connection.is_connected():
-                                db.disconnect()
-                                print("[CONTROLLER DEBUG] Connexion MySQL fermée")
+                            self._close_db()
                         except Exception as e:
                             print(f"[CONTROLLER DEBUG] Note : {e}")
                         
@@ -347,19 +373,30 @@ class GameController:
         - Fermeture de la fenêtre -> QUIT
         """
         settings_active = True
+        dirty = True  # Redessin nécessaire (premier affichage)
         
         while settings_active and self.state == AppState.SETTINGS:
-            self.clock.tick(self.fps)
-            
-            # Récupération de la configuration actuelle
-            config = self.config_manager.get_config()
+            # Redessin uniquement après un événement (écran statique)
+            if dirty:
+                self.clock.tick(self.fps)
+                
+                # Récupération de la configuration actuelle
+                config = self.config_manager.get_config()
+                
+                # Affichage de l'écran de paramètres
+                rects = self.view.draw_settings(config)
+                self.view.update_display()
+                dirty = False
             
-            # Affichage de l'écran de paramètres
-            rects = self.view.draw_settings(config)
-            self.view.update_display()
+            # Aucune entrée : courte attente, l'écran statique reste affiché
+            events = pygame.event.get()
+            if not events:
+                pygame.time.wait(10)
+                continue
+            dirty = True
             
             # Gestion des événements
-            for event in pygame.event.get():
+            for event in events:
                 # Fermeture de la fenêtre
                 if event.type == pygame.QUIT:
                     self.state = AppState.QUIT
@@ -399,7 +436,7 @@ class GameController:
                     # Bouton RETOUR
                     elif rects['back'].collidepoint(mouse_pos):
                         print("[SETTINGS DEBUG] Sauvegarde de la configuration et retour au menu")
-                        self.config_manager.save_config()
+                        self.config_manager.save_config_async()
                         self.state = AppState.MENU
                         settings_active = False
     
@@ -430,7 +467,6 @@ class GameController:
         self.depth_selector_rects = None
         
         # Redimensionnement de la fenêtre si nécessaire
-        from ..utils.constants import SQUARESIZE, HEADER_HEIGHT
         new_width = cols * SQUARESIZE
         new_height = rows * SQUARESIZE + HEADER_HEIGHT
         
@@ -443,12 +479,12 @@ class GameController:
         # Initialisation d'une nouvelle partie avec les paramètres configurés
         self.game = Game(rows=rows, cols=cols, start_player=start_player)
         
-        print(f"\n[CONTROLLER DEBUG] === NOUVELLE PARTIE ({self.gamemode}) ===")
+        print(f"\n[CONTROLLER DEBUG] === NOUVELLE PARTIE ({self.gamemode.label}) ===")
         print(f"[CONTROLLER DEBUG] Configuration : {rows}x{cols}, Joueur {start_player} commence")
-        if self.gamemode == "PvAI":
+        if self.gamemode is GameMode.PVAI:
             print(f"[CONTROLLER DEBUG] IA : {self.ai.name}")
             print(f"[CONTROLLER DEBUG] IA contrôle le joueur {self.ai_player}\n")
-        elif self.gamemode == "AIvsAI":
+        elif self.gamemode is GameMode.AI_VS_AI:
             print(f"[CONTROLLER DEBUG] MODE DÉMO - IA1 : {self.ai.name} (Joueur {self.ai_player})")
             print(f"[CONTROLLER DEBUG] MODE DÉMO - IA2 : {self.ai2.name} (Joueur {self.ai2_player})\n")
         
@@ -464,8 +500,8 @@ class GameController:
             self.clock.tick(self.fps)
             
             # === GESTION DU MODE AI VS AI (DÉMO) ===
-            if self.gamemode == "AIvsAI":
-                current_player = self.game.get_current_player()
+            if self.gamemode is GameMode.AI_VS_AI:
+                current_player = self.game.current_player
                 print(f"\n[CONTROLLER DEBUG] === TOUR DE L'IA (Joueur {current_player}) ===")
                 
                 # Sélection de l'IA appropriée
@@ -514,7 +550,7 @@ class GameController:
                         self._refresh_game_display()
                         
                         # Vérification de la fin de partie
-                        if self.game.is_game_over():
+                        if self.game.state is GameState.FINISHED:
                             self._handle_game_over()
                             game_over = True
                             continue
@@ -522,7 +558,7 @@ class GameController:
                     print(f"[CONTROLLER DEBUG] ERREUR : {current_ai.name} n'a pas pu choisir de coup")
             
             # === GESTION DU TOUR DE L'IA (MODE PvAI) ===
-            elif self.gamemode == "PvAI" and self.game.get_current_player() == self.ai_player:
+            elif self._is_ai_turn():
                 print(f"\n[CONTROLLER DEBUG] === TOUR DE L'IA ===")
                 print(f"[CONTROLLER DEBUG] Profondeur actuelle : {self.ai.depth}")
                 
@@ -554,7 +590,7 @@ class GameController:
                             self.game.board,
                             ai_scores=column_scores,
                             ai_player=self.ai_player,
-                            current_player=self.game.get_current_player()
+                            current_player=self.game.current_player
                         )
                         # Affichage du sélecteur de profondeur
                         if hasattr(self.ai, 'depth'):
@@ -573,7 +609,7 @@ class GameController:
                         self._refresh_game_display()
                         
                         # Vérification de la fin de partie
-                        if self.game.is_game_over():
+                        if self.game.state is GameState.FINISHED:
                             self._handle_game_over()
                             game_over = True
                             continue
@@ -606,9 +642,9 @@ class GameController:
                 # Mouvement de la souris : affichage du pion fantôme (uniquement pour le joueur humain)
                 if event.type == pygame.MOUSEMOTION:
                     # Ne pas afficher le pion fantôme en mode AIvsAI ou pendant le tour de l'IA
-                    if self.gamemode == "AIvsAI":
+                    if self.gamemode is GameMode.AI_VS_AI:
                         continue
-                    if self.gamemode == "PvAI" and self.game.get_current_player() == self.ai_player:
+                    if self._is_ai_turn():
                         continue
                     
                     # Rafraîchissement avec pion fantôme intégré
@@ -619,10 +655,25 @@ class GameController:
                 if event.type == pygame.MOUSEBUTTONDOWN:
                     mouse_pos = event.pos
                     
+                    # Rects des boutons liés en variables locales (évite les
+                    # doubles accès self.view.X à chaque test de branche)
+                    view = self.view
+                    undo_rect = view.undo_button_rect
+                    save_rect = view.save_button_rect
+                    load_rect = view.load_button_rect
+                    restart_rect = view.restart_button_rect
+                    menu_rect = view.menu_button_rect
+                    
+                    # Clic hors de la bande verticale des boutons (cas courant :
+                    # clic sur le plateau) : un seul test remplace les 5 collidepoint
+                    band = view.button_band
+                    if band is None or not (band[0] <= mouse_pos[1] < band[1]):
+                        undo_rect = save_rect = load_rect = restart_rect = menu_rect = None
+                    
                     # ========================================
                     # BRANCHE 0 : CLIC SUR SÉLECTEUR DE PROFONDEUR (PvAI uniquement)
                     # ========================================
-                    if self.gamemode == "PvAI" and self.depth_selector_rects:
+                    if self.gamemode is GameMode.PVAI and self.depth_selector_rects:
                         # Clic sur bouton [ + ]
                         if self.depth_selector_rects['plus'].collidepoint(mouse_pos):
                             if self.ai.depth < 7:  # Limite max
@@ -642,33 +693,32 @@ class GameController:
                     # ========================================
                     # BRANCHE 1 : CLIC SUR BOUTON UNDO
                     # ========================================
-                    if self.view.undo_button_rect and self.view.undo_button_rect.collidepoint(mouse_pos):
+                    if undo_rect and undo_rect.collidepoint(mouse_pos):
                         print("\n[CONTROLLER DEBUG] === CLIC SUR BOUTON UNDO ===")
                         
                         # Garde-fou : vérifier qu'il y a au moins un coup à annuler
-                        if len(self.game.board.history) == 0:
+                        if self.game.board.hist_len == 0:
                             print("[CONTROLLER DEBUG] Impossible d'annuler : aucun coup joué")
                         else:
                             # Logique selon le mode de jeu
-                            if self.gamemode == "PvP":
+                            if self.gamemode is GameMode.PVP:
                                 # Mode PvP : annuler 1 seul coup
                                 print("[CONTROLLER DEBUG] Mode PvP : annulation de 1 coup")
                                 self.game.undo()
                             
-                            elif self.gamemode == "PvAI":
+                            elif self.gamemode is GameMode.PVAI:
                                 # Mode PvAI : annuler 2 coups (IA + Joueur)
                                 print("[CONTROLLER DEBUG] Mode PvAI : annulation de 2 coups")
                                 
-                                # Premier undo : coup du joueur
-                                if self.game.undo():
-                                    print("[CONTROLLER DEBUG] Coup joueur annulé")
-                                    
-                                    # Second undo : coup de l'IA (si existe)
-                                    if len(self.game.board.history) > 0:
-                                        self.game.undo()
-                                        print("[CONTROLLER DEBUG] Coup IA annulé")
-                                    else:
-                                        print("[CONTROLLER DEBUG] Pas de coup IA à annuler")
+                                # Un seul appel : coup du joueur + coup de l'IA (si existe)
+                                reversed_count = self.game.undo(n=2)
+                                
+                                if reversed_count == 0:
+                                    print("[CONTROLLER DEBUG] Aucun coup annulé")
+                                elif reversed_count == 1:
+                                    print("[CONTROLLER DEBUG] Coup joueur annulé (pas de coup IA à annuler)")
+                                else:
+                                    print("[CONTROLLER DEBUG] Coups joueur et IA annulés")
                             
                             # Rafraîchissement complet de l'écran
                             self._refresh_game_display()
@@ -678,7 +728,7 @@ class GameController:
                     # ========================================
                     # BRANCHE 2 : CLIC SUR BOUTON SAUVER
                     # ========================================
-                    elif self.view.save_button_rect and self.view.save_button_rect.collidepoint(mouse_pos):
+                    elif save_rect and save_rect.collidepoint(mouse_pos):
                         print("\n[CONTROLLER DEBUG] === CLIC SUR BOUTON SAUVER ===")
                         
                         # Sauvegarde de la partie
@@ -694,7 +744,7 @@ class GameController:
                     # ========================================
                     # BRANCHE 3 : CLIC SUR BOUTON CHARGER
                     # ========================================
-                    elif self.view.load_button_rect and self.view.load_button_rect.collidepoint(mouse_pos):
+                    elif load_rect and load_rect.collidepoint(mouse_pos):
                         print("\n[CONTROLLER DEBUG] === CLIC SUR BOUTON CHARGER ===")
                         
                         # Chargement de la partie
@@ -715,7 +765,7 @@ class GameController:
                     # ========================================
                     # BRANCHE 4 : CLIC SUR BOUTON RECOMMENCER
                     # ========================================
-                    elif self.view.restart_button_rect and self.view.restart_button_rect.collidepoint(mouse_pos):
+                    elif restart_rect and restart_rect.collidepoint(mouse_pos):
                         print("\n[CONTROLLER DEBUG] === CLIC SUR BOUTON RECOMMENCER ===")
                         
                         # Réinitialisation de la partie
@@ -726,7 +776,7 @@ class GameController:
                     # ========================================
                     # BRANCHE 5 : CLIC SUR BOUTON MENU (RETOUR)
                     # ========================================
-                    elif self.view.menu_button_rect and self.view.menu_button_rect.collidepoint(mouse_pos):
+                    elif menu_rect and menu_rect.collidepoint(mouse_pos):
                         print("\n[CONTROLLER DEBUG] === CLIC SUR BOUTON MENU ===")
                         print("[CONTROLLER DEBUG] Retour au menu principal (partie interrompue)")
                         self.state = AppState.MENU
@@ -743,36 +793,39 @@ class GameController:
                             continue
                         
                         # Ignorer les clics en mode AIvsAI (démo automatique)
-                        if self.gamemode == "AIvsAI":
+                        if self.gamemode is GameMode.AI_VS_AI:
                             print("[CONTROLLER DEBUG] Clic ignoré - Mode DÉMO (AIvsAI)")
                             continue
                         
                         # Ignorer les clics pendant le tour de l'IA
-                        if self.gamemode == "PvAI" and self.game.get_current_player() == self.ai_player:
+                        if self._is_ai_turn():
                             print("[CONTROLLER DEBUG] Clic ignoré - C'est le tour de l'IA")
                             continue
                         
-                        # Effacement du pion fantôme et redessin
-                        self._refresh_game_display()
-                        
                         # Récupération de la colonne cliquée
                         x_pos = mouse_pos[0]
-                        col = self.view.get_column_from_mouse_pos(x_pos)
+                        col = view.get_column_from_mouse_pos(x_pos)
                         
-                        if col is not None:
-                            print(f"[CONTROLLER DEBUG] Tentative de jouer en colonne {col}")
-                            
-                            # Tentative de jouer le coup
-                            success = self.game.play_turn(col)
+                        # Clic hors des colonnes : rien n'a changé, pas de redessin
+                        if col is None:
+                            continue
+                        
+                        print(f"[CONTROLLER DEBUG] Tentative de jouer en colonne {col}")
+                        
+                        # Tentative de jouer le coup
+                        success = self.game.play_turn(col)
+                        
+                        if success:
+                            # Mise à jour de l'affichage (efface aussi le pion fantôme)
+                            self._refresh_game_display()
                             
-                            if success:
-                                # Mise à jour de l'affichage
-                                self._refresh_game_display()
-                                
-                                # Vérification de la fin de partie
-                                if self.game.is_game_over():
-                                    self._handle_game_over()
-                                    # game_over = True  # Commenté: on reste dans la boucle pour gérer l'affichage
+                            # Vérification de la fin de partie
+                            if self.game.state is GameState.FINISHED:
+                                self._handle_game_over()
+                                # game_over = True  # Commenté: on reste dans la boucle pour gérer l'affichage
+                        else:
+                            # Coup refusé : seul le pion fantôme doit disparaître
+                            view.clear_ghost()
         
         # Note : La gestion des touches ECHAP et R continue même après game over
         # Cette ligne n'est exécutée que si la partie est interrompue sans game over
@@ -865,7 +918,7 @@ class GameController:
         self._save_game_to_database()
         
         # Force un dernier rafraîchissement du plateau avec ligne gagnante
-        winner = self.game.get_winner()
+        winner = self.game.winner
         winning_line = self.game.get_winning_positions()
         
         # Affichage du plateau final avec overlay de victoire
@@ -891,38 +944,32 @@ class GameController:
         pour insertion avec chaînage automatique.
         """
         try:
-            from ..utils.db_manager import DatabaseManager
-            import json
-            
             # Conversion de l'historique en chaîne de colonnes
-            coups = ''.join(str(col + 1) for col, _ in self.game.move_history)
+            coups = self.game.get_coups()
             
             # Détermination du statut
             statut = 'TERMINEE'
             
-            # Préparation de la ligne gagnante au format JSON
-            ligne_gagnante = None
-            if self.game.winner is not None:
-                ligne_gagnante = json.dumps(self.game.winning_line)
-            
-            # Connexion et sauvegarde
-            db = DatabaseManager()
-            db.connect()
-            db.create_tables()
+            # Ligne gagnante transmise telle quelle (encodée en JSON par le DatabaseManager)
+            ligne_gagnante = self.game.winning_line if self.game.winner is not None else None
             
-            game_id = db.insert_game(
-                coups=coups,
-                mode_jeu=self.gamemode,
-                statut=statut,
-                ligne_gagnante=ligne_gagnante
-            )
+            # Sauvegarde via la connexion partagée (schéma vérifié à la connexion)
+            db = self._get_db()
             
-            db.disconnect()
-            
-            if game_id:
-                print(f"[DB] ✅ Partie sauvegardée avec l'ID {game_id}")
+            if db is None:
+                print("[DB] ⚠️ mysql-connector non installé : partie non sauvegardée")
             else:
-                print(f"[DB] ⚠️ Partie non sauvegardée (doublon possible)")
+                game_id = db.insert_game(
+                    coups=coups,
+                    mode_jeu=self.gamemode.label,
+                    statut=statut,
+                    ligne_gagnante=ligne_gagnante
+                )
+                
+                if game_id:
+                    print(f"[DB] ✅ Partie sauvegardée avec l'ID {game_id}")
+                else:
+                    print(f"[DB] ⚠️ Partie non sauvegardée (doublon possible)")
                 
         except Exception as e:
             print(f"[DB] ❌ Erreur lors de la sauvegarde : {e}")
@@ -931,34 +978,77 @@ class GameController:
         self.state = AppState.GAME_OVER
         print("[CONTROLLER DEBUG] Transition vers l'état GAME_OVER")
     
+    def _get_db(self) -> Optional["DatabaseManager"]:
+        """
+        Retourne la connexion MySQL partagée, en la (re)créant si nécessaire.
+        
+        La connexion est conservée d'une partie à l'autre pour éviter un
+        connect/CREATE TABLE/disconnect à chaque sauvegarde.
+        
+        Returns:
+            Instance de DatabaseManager connectée, ou None si mysql-connector
+            n'est pas installé
+        """
+        if DatabaseManager is None:
+            return None
+        
+        if self._db is None:
+            self._db = DatabaseManager()
+        
+        if not self._db.is_connected():
+            if self._db.connect():
+                self._db.create_tables()
+        
+        return self._db
+    
+    def _close_db(self) -> None:
+        """
+        Ferme la connexion MySQL partagée si elle est ouverte.
+        """
+        if self._db is not None:
+            self._db.disconnect()
+            self._db = None
+            print("[CONTROLLER DEBUG] Connexion MySQL fermée")
+    
     def run_history_menu(self) -> None:
         """
         Affiche la liste des parties enregistrées dans la base de données.
         Permet de sélectionner une partie pour la visualiser en mode replay.
         """
-        from ..utils.db_manager import DatabaseManager
-        
         print("\n[CONTROLLER DEBUG] === CHARGEMENT HISTORIQUE ===")
         
-        # Chargement des parties depuis la base de données
-        db = DatabaseManager()
-        db.connect()
-        games = db.get_all_games()
-        db.disconnect()
+        # Chargement des parties depuis la base de données (liste vide hors ligne)
+        games = []
+        if DatabaseManager is not None:
+            db = DatabaseManager()
+            db.connect()
+            games = db.get_all_games()
+            db.disconnect()
         
         print(f"[CONTROLLER DEBUG] {len(games)} partie(s) chargée(s)")
         
         history_active = True
+        dirty = True  # Redessin nécessaire (premier affichage)
         
         while history_active and self.state == AppState.HISTORY_MENU:
-            self.clock.tick(self.fps)
+            # Redessin uniquement après un événement (écran statique)
+            if dirty:
+                self.clock.tick(self.fps)
+                
+                # Affichage de l'historique
+                rects = self.view.draw_history_menu(games)
+                self.view.update_display()
+                dirty = False
             
-            # Affichage de l'historique
-            rects = self.view.draw_history_menu(games)
-            self.view.update_display()
+            # Aucune entrée : courte attente, l'écran statique reste affiché
+            events = pygame.event.get()
+            if not events:
+                pygame.time.wait(10)
+                continue
+            dirty = True
             
             # Gestion des événements
-            for event in pygame.event.get():
+            for event in events:
                 if event.type == pygame.QUIT:
                     self.state = AppState.QUIT
                     history_active = False
@@ -981,10 +1071,11 @@ class GameController:
                         break
                     
                     # Clic sur une partie
-                    for i in range(len(games[:10])):
-                        if i in rects and rects[i].collidepoint(mouse_pos):
-                            print(f"[CONTROLLER DEBUG] Partie {games[i]['id']} sélectionnée")
-                            self._load_replay(games[i])
+                    for i, game_data in enumerate(islice(games, 10)):
+                        game_rect = rects.get(i)
+                        if game_rect and game_rect.collidepoint(mouse_pos):
+                            print(f"[CONTROLLER DEBUG] Partie {game_data['id']} sélectionnée")
+                            self._load_replay(game_data)
                             history_active = False
                             break
     
@@ -1002,7 +1093,6 @@ class GameController:
         self.replay_auto_play = False
         
         # Création d'un plateau vide
-        from ..models.board import Board
         config = self.config_manager.get_config()
         self.replay_board = Board(rows=config['rows'], cols=config['cols'])
         
@@ -1046,9 +1136,6 @@ class GameController:
             # Affichage de la ligne gagnante si on est à la fin
             if self.replay_current_move == total_moves and self.replay_game_data['ligne_gagnante']:
                 try:
-                    import json
-                    import ast
-                    
                     # Parsing robuste depuis la base de données
                     coords_brutes = self.replay_game_data['ligne_gagnante']
                     
@@ -1178,20 +1265,15 @@ class GameController:
         self.replay_show_symmetric = not self.replay_show_symmetric
         print(f"[REPLAY DEBUG] Mode symétrique: {self.replay_show_symmetric}")
         
-        # Réinitialiser le plateau et rejouer avec la nouvelle séquence
-        config = self.config_manager.get_config()
-        from ..models.board import Board
-        self.replay_board = Board(rows=config['rows'], cols=config['cols'])
+        # Vider le plateau en place et rejouer avec la nouvelle séquence
+        self.replay_board.clear()
         
         coups = self.replay_game_data['coups_symetrique'] if self.replay_show_symmetric else self.replay_game_data['coups']
         moves_list = [int(c) - 1 for c in coups]
         
-        # Rejouer tous les coups jusqu'à la position actuelle
+        # Rejouer tous les coups jusqu'à la position actuelle en un seul lot
         current_pos = self.replay_current_move
-        self.replay_current_move = 0
-        
-        for i in range(current_pos):
-            self._replay_play_move(moves_list[i])
+        self.replay_current_move = self.replay_board.replay_batch(moves_list[:current_pos])
     
     def _load_neighbor_game(self, direction: str) -> None:
         """
@@ -1200,8 +1282,6 @@ class GameController:
         Args:
             direction: 'prev' pour id_antecedent, 'next' pour id_suivant
         """
-        from ..utils.db_manager import DatabaseManager
-        
         neighbor_id = None
         if direction == 'prev':
             neighbor_id = self.replay_game_data['id_antecedent']
@@ -1212,6 +1292,10 @@ class GameController:
             print(f"[REPLAY DEBUG] Pas de partie {direction}")
             return
         
+        if DatabaseManager is None:
+            print("[REPLAY DEBUG] mysql-connector non installé : navigation désactivée")
+            return
+        
         # Chargement de la partie voisine
         db = DatabaseManager()
         db.connect()
@@ -1234,24 +1318,35 @@ class GameController:
         settings_active = True
         showing_confirmation = False
         confirmation_rects = None
+        dirty = True  # Redessin nécessaire (premier affichage)
         
         while settings_active and self.state == AppState.SETTINGS:
-            self.clock.tick(self.fps)
-            
-            # Affichage du menu des paramètres
-            rects = self.view.draw_settings_menu(self.settings_manager)
-            
-            # Si une confirmation est en cours, afficher le dialogue par-dessus
-            if showing_confirmation:
-                yes_rect, no_rect = self.view.draw_confirmation_dialog(
-                    "Voulez-vous vraiment effacer tout l'historique des parties ?"
-                )
-                confirmation_rects = (yes_rect, no_rect)
+            # Redessin uniquement après un événement (écran statique)
+            if dirty:
+                self.clock.tick(self.fps)
+                
+                # Affichage du menu des paramètres
+                rects = self.view.draw_settings_menu(self.settings_manager)
+                
+                # Si une confirmation est en cours, afficher le dialogue par-dessus
+                if showing_confirmation:
+                    yes_rect, no_rect = self.view.draw_confirmation_dialog(
+                        "Voulez-vous vraiment effacer tout l'historique des parties ?"
+                    )
+                    confirmation_rects = (yes_rect, no_rect)
+                
+                self.view.update_display()
+                dirty = False
             
-            self.view.update_display()
+            # Aucune entrée : courte attente, l'écran statique reste affiché
+            events = pygame.event.get()
+            if not events:
+                pygame.time.wait(10)
+                continue
+            dirty = True
             
             # Gestion des événements
-            for event in pygame.event.get():
+            for event in events:
                 # Fermeture de la fenêtre
                 if event.type == pygame.QUIT:
                     self.state = AppState.QUIT
@@ -1269,12 +1364,13 @@ class GameController:
                         if yes_rect.collidepoint(mouse_pos):
                             # Confirmation : vider la BDD
                             print("[SETTINGS DEBUG] Réinitialisation de la BDD confirmée")
-                            from ..utils.db_manager import DatabaseManager
                             
-                            db = DatabaseManager()
-                            db.connect()
-                            success = db.truncate_games()
-                            db.disconnect()
+                            success = False
+                            if DatabaseManager is not None:
+                                db = DatabaseManager()
+                                db.connect()
+                                success = db.truncate_games()
+                                db.disconnect()
                             
                             if success:
                                 self.view.draw_status_message(
@@ -1344,3 +1440,6 @@ class GameController:
                             new_volume = max(0, min(100, new_volume))
                             
                             self.settings_manager.update_setting("volume", "master", new_volume)
+        
+        # Paramètres modifiés pendant l'écran (volume...) : une seule écriture en sortie
+        self.settings_manager.flush()
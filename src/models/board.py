@@ -6,18 +6,112 @@ CONVENTION STRICTE : Row 0 = BAS physique du plateau, Row ROWS-1 = HAUT
 """
 
 from typing import Optional
+from functools import lru_cache
+import logging
 import numpy as np
 from numpy.typing import NDArray
 
-from ..utils.constants import EMPTY, WIN_LENGTH, DIRECTIONS
+from ..utils.constants import DIRECTIONS, EMPTY, PLAYER1, PLAYER2, WIN_LENGTH
+from ..utils.enums import MoveResult
+
+
+# Journal du module : les messages de débogage sont ignorés hors niveau DEBUG
+logger = logging.getLogger(__name__)
+
+
+def _doubling_offsets(shift: int) -> tuple[int, ...]:
+    """
+    Calcule les décalages successifs pour détecter WIN_LENGTH bits alignés.
+    
+    Après m &= m >> k, chaque bit de m couvre une séquence plus longue ;
+    en doublant la longueur couverte à chaque étape, il suffit de
+    ceil(log2(WIN_LENGTH)) opérations au lieu de WIN_LENGTH - 1.
+    
+    Args:
+        shift: Décalage d'une case dans la direction testée
+    
+    Returns:
+        Tuple des décalages à appliquer dans l'ordre
+    """
+    offsets = []
+    covered = 1
+    
+    while covered < WIN_LENGTH:
+        step = min(covered, WIN_LENGTH - covered)
+        offsets.append(step * shift)
+        covered += step
+    
+    return tuple(offsets)
+
+
+# Cache borné : une entrée (clé entière, tuple de plans, nœud LRU) coûte de
+# l'ordre de 200 octets, soit ~13 Mo pour 1 << 16 positions
+@lru_cache(maxsize=1 << 16)
+def _has_alignment(bitboard: int, plans: tuple[tuple[int, ...], ...]) -> bool:
+    """
+    Teste si un bitboard contient WIN_LENGTH pions alignés.
+    
+    Fonction pure du bitboard d'un joueur : le résultat est mémorisé par
+    position, de sorte qu'une position atteinte par des ordres de coups
+    différents (transposition, fréquente dans Minimax) n'est testée qu'une
+    fois. Les entrées restent valides d'une partie à l'autre ; les moins
+    récemment utilisées sont évincées.
+    
+    Args:
+        bitboard: Pions d'un joueur (codage bitboard du plateau)
+        plans: Décalages par direction (Board._win_plans)
+    
+    Returns:
+        True si au moins un alignement gagnant est présent, False sinon
+    """
+    for plan in plans:
+        m = bitboard
+        for offset in plan:
+            m &= m >> offset
+        if m:
+            return True
+    
+    return False
+
+
+@lru_cache(maxsize=None)
+def _win_line_indices(rows: int, cols: int) -> tuple[NDArray[np.intp], NDArray[np.intp]]:
+    """
+    Énumère une fois pour toutes les lignes gagnantes d'un plateau rows x cols.
+    
+    Une ligne = WIN_LENGTH cases alignées (horizontale, verticale ou
+    diagonale) entièrement dans le plateau ; 69 lignes pour un 6x7.
+    Résultat mis en cache par dimensions.
+    
+    Args:
+        rows: Nombre de lignes du plateau
+        cols: Nombre de colonnes du plateau
+    
+    Returns:
+        Tuple (lignes, colonnes) de deux tableaux (nombre de lignes x WIN_LENGTH)
+    """
+    line_rows = []
+    line_cols = []
+    span = WIN_LENGTH - 1
+    
+    for drow, dcol in DIRECTIONS:
+        for row in range(rows):
+            for col in range(cols):
+                end_row = row + span * drow
+                end_col = col + span * dcol
+                if 0 <= end_row < rows and 0 <= end_col < cols:
+                    line_rows.append([row + i * drow for i in range(WIN_LENGTH)])
+                    line_cols.append([col + i * dcol for i in range(WIN_LENGTH)])
+    
+    return np.array(line_rows, dtype=np.intp), np.array(line_cols, dtype=np.intp)
 
 
 class Board:
     """
     Représente le plateau de jeu Puissance 4.
     
-    CONVENTION : self.grid[0][col] = bas du plateau (fond)
-                 self.grid[rows-1][col] = haut du plateau (sommet)
+    CONVENTION : self.grid[0, col] = bas du plateau (fond)
+                 self.grid[rows-1, col] = haut du plateau (sommet)
     
     Gère la grille de jeu, le placement des pions avec gravité,
     et la détection des conditions de victoire dans toutes les directions.
@@ -26,6 +120,13 @@ class Board:
         rows: Nombre de lignes du plateau
         cols: Nombre de colonnes du plateau
         grid: Matrice numpy (rows x cols) représentant l'état du plateau
+        bitboards: Un entier par joueur [PLAYER1, PLAYER2], un bit par case
+    
+    BITBOARDS : chaque colonne occupe (rows + 1) bits consécutifs, le bit
+    supplémentaire (sentinelle, toujours à 0) empêche les alignements de
+    « déborder » d'une colonne à l'autre. La case (row, col) correspond au
+    bit col * (rows + 1) + row. La grille numpy reste tenue à jour pour
+    l'affichage, l'IA et la sérialisation.
     """
     
     def __init__(self, rows: int = 6, cols: int = 7) -> None:
@@ -41,9 +142,52 @@ class Board:
         """
         self.rows: int = rows
         self.cols: int = cols
-        self.grid: NDArray[np.int_] = np.zeros((rows, cols), dtype=np.int_)
-        self.history: list[tuple[int, int]] = []  # Historique (row, col) pour undo
-        print(f"[BOARD DEBUG] Plateau initialisé : {rows} lignes x {cols} colonnes")
+        self.grid: NDArray[np.int8] = np.zeros((rows, cols), dtype=np.int8)
+        # Historique pour undo : indices row*cols+col dans un tableau préalloué
+        # (une case par cellule du plateau), hist_len = nombre de coups posés
+        self.history: NDArray[np.int16] = np.empty(rows * cols, dtype=np.int16)
+        self.hist_len: int = 0
+        self.bitboards: list[int] = [0, 0]  # Pions de PLAYER1 et PLAYER2
+        self.col_heights: list[int] = [0] * cols  # Nombre de pions par colonne
+        self._init_bitboard_layout()
+        logger.debug("Plateau initialisé : %d lignes x %d colonnes", rows, cols)
+    
+    def _init_bitboard_layout(self) -> None:
+        """
+        Précalcule les constantes du codage bitboard pour ces dimensions.
+        
+        Décalages des 4 directions, dans l'ordre de DIRECTIONS (horizontale
+        d'abord) : horizontal (H), vertical (1), diagonale montante (H + 1)
+        et diagonale descendante (H - 1), avec H = rows + 1 bits par colonne.
+        """
+        height = self.rows + 1
+        self._col_height: int = height
+        self._win_shifts: tuple[int, ...] = (height, 1, height + 1, height - 1)
+        self._win_steps: tuple[tuple[int, int], ...] = ((0, 1), (1, 0), (1, 1), (-1, 1))  # (drow, dcol) associés
+        
+        # Décalages précalculés par direction (doublement : 1, 2, ... cases),
+        # ex: WIN_LENGTH=4 -> (s, 2s), soit 2 ET au lieu de 3 par direction
+        self._win_plans: tuple[tuple[int, ...], ...] = tuple(
+            _doubling_offsets(shift) for shift in self._win_shifts
+        )
+        
+        # Bits de la ligne du HAUT de chaque colonne (plateau plein ssi tous occupés)
+        self._top_mask: int = sum(1 << (col * height + self.rows - 1) for col in range(self.cols))
+    
+    def _rebuild_bitboards(self) -> None:
+        """
+        Reconstruit les bitboards et les hauteurs de colonnes à partir de la grille numpy.
+        
+        Utilisé après un remplacement complet de la grille (copie, chargement).
+        """
+        height = self._col_height
+        bitboards = [0, 0]
+        
+        for row, col in zip(*np.nonzero(self.grid)):
+            bitboards[int(self.grid[row, col]) - 1] |= 1 << (int(col) * height + int(row))
+        
+        self.bitboards = bitboards
+        self.col_heights = np.count_nonzero(self.grid, axis=0).tolist()
     
     def is_valid_location(self, col: int) -> bool:
         """
@@ -51,7 +195,7 @@ class Board:
         
         LOGIQUE CRITIQUE : 
         - Convention : grid[rows-1] = ligne du HAUT
-        - Une colonne est valide si la case du HAUT (grid[rows-1][col]) est vide (0)
+        - Une colonne est valide si la case du HAUT (grid[rows-1, col]) est vide (0)
         
         Args:
             col: Index de la colonne à vérifier (0-indexed)
@@ -61,13 +205,11 @@ class Board:
         """
         # Vérification des bornes
         if col < 0 or col >= self.cols:
-            print(f"[BOARD DEBUG] is_valid_location({col}) : FAUX (hors limites)")
             return False
         
-        # CORRECTION CRITIQUE : La colonne est valide si le HAUT (rows-1) est vide
-        is_valid = self.grid[self.rows - 1][col] == EMPTY
-        print(f"[BOARD DEBUG] is_valid_location({col}) : {is_valid} (grid[{self.rows-1}][{col}] = {self.grid[self.rows-1][col]})")
-        return is_valid
+        # CORRECTION CRITIQUE : La colonne est valide si le HAUT (rows-1) est vide,
+        # c'est-à-dire si la pile de la colonne n'a pas atteint rows pions
+        return self.col_heights[col] < self.rows
     
     def get_next_open_row(self, col: int) -> Optional[int]:
         """
@@ -75,8 +217,8 @@ class Board:
         
         LOGIQUE CRITIQUE :
         - Convention : row=0 = BAS physique (fond), row=rows-1 = HAUT
-        - Parcourt de row=0 (fond) vers row=rows-1 (haut)
-        - Retourne le PREMIER r où grid[r][col] == 0 (vide)
+        - Retourne le PREMIER r (depuis le fond) où grid[r, col] == 0 (vide),
+          c'est-à-dire la hauteur courante de la colonne (col_heights)
         
         Args:
             col: Index de la colonne
@@ -84,116 +226,164 @@ class Board:
         Returns:
             L'index de la ligne vide la plus basse, ou None si la colonne est pleine
         """
-        print(f"[BOARD DEBUG] get_next_open_row({col}) : recherche case vide...")
+        # Les pions d'une colonne sont contigus depuis le bas (gravité) :
+        # la prochaine ligne libre est la hauteur de la pile
+        row = self.col_heights[col]
         
-        # PARCOURS CRUCIAL : De 0 (bas) vers rows-1 (haut)
-        for row in range(self.rows):
-            if self.grid[row][col] == EMPTY:
-                print(f"[BOARD DEBUG] -> Trouvé case vide : row={row}")
-                return row
+        if row >= self.rows:
+            return None
         
-        print(f"[BOARD DEBUG] -> Colonne {col} PLEINE (aucune case vide)")
-        return None
+        return row
     
     def drop_piece(self, row: int, col: int, piece: int) -> None:
         """
         Place un pion dans la grille à la position spécifiée.
         Enregistre automatiquement le coup dans l'historique.
         
+        Avec undo_last_move(), forme l'API de simulation en place utilisée
+        par Minimax (jouer, explorer, annuler) à la place de copy().
+        
         Args:
             row: Index de la ligne
             col: Index de la colonne
             piece: Valeur du joueur (PLAYER1 ou PLAYER2)
         """
         # Enregistrement dans l'historique AVANT placement
-        self.history.append((row, col))
+        self.history[self.hist_len] = row * self.cols + col
+        self.hist_len += 1
         
-        # DEBUG : Affichage avant placement
-        print(f"\n[BOARD DEBUG] === drop_piece APPELÉ ===")
-        print(f"[BOARD DEBUG] Position : row={row}, col={col}, piece={piece}")
-        print(f"[BOARD DEBUG] Valeur AVANT placement : grid[{row}][{col}] = {self.grid[row][col]}")
+        # Placement du pion (grille + bitboard du joueur)
+        self.grid[row, col] = piece
+        self.bitboards[piece - 1] |= 1 << (col * self._col_height + row)
+        self.col_heights[col] = row + 1
         
-        # Placement du pion
-        self.grid[row][col] = piece
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("drop_piece : row=%d, col=%d, piece=%d", row, col, piece)
+    
+    def try_drop_and_check(self, col: int, piece: int) -> tuple[Optional[int], MoveResult]:
+        """
+        Joue un coup et détermine son issue en une seule opération.
+        
+        Regroupe validation de la colonne, recherche de la ligne libre,
+        placement, test de victoire limité aux lignes passant par le pion
+        posé et test de plateau plein (nombre de pions posés = hist_len).
+        
+        Args:
+            col: Index de la colonne (0-indexed)
+            piece: Valeur du joueur (PLAYER1 ou PLAYER2)
+        
+        Returns:
+            Tuple (row, résultat) ; row vaut None si le coup est INVALID
+        """
+        if col < 0 or col >= self.cols:
+            return None, MoveResult.INVALID
+        
+        row = self.col_heights[col]
+        if row >= self.rows:
+            return None, MoveResult.INVALID
         
-        # DEBUG : Affichage après placement
-        print(f"[BOARD DEBUG] Valeur APRÈS placement : grid[{row}][{col}] = {self.grid[row][col]}")
+        self.drop_piece(row, col, piece)
         
-        # DEBUG : Affichage de l'état complet de la colonne (de bas en haut)
-        column_state = [self.grid[r][col] for r in range(self.rows)]
-        print(f"[BOARD DEBUG] État colonne {col} (bas->haut) : {column_state}")
-        print(f"[BOARD DEBUG] Historique complet : {self.history}")
-        print(f"[BOARD DEBUG] === drop_piece TERMINÉ ===\n")
+        if self.check_win_last(row, col, piece):
+            return row, MoveResult.WIN
+        if self.hist_len == self.rows * self.cols:
+            return row, MoveResult.DRAW
+        return row, MoveResult.CONTINUE
     
-    def check_win(self, piece: int) -> bool:
+    def _find_win(self, piece: int) -> Optional[list[tuple[int, int]]]:
         """
-        Vérifie si le joueur spécifié a gagné la partie.
+        Recherche un alignement gagnant du joueur en une seule passe.
+        
+        Teste les 4 directions sur le bitboard du joueur par décalages et ET
+        logiques : un bit reste à 1 dans m si WIN_LENGTH pions consécutifs
+        commencent à cette case dans la direction testée.
+        - Horizontale (décalage H)
+        - Verticale (décalage 1)
+        - Diagonale montante (décalage H + 1)
+        - Diagonale descendante (décalage H - 1)
         
-        Parcourt toutes les positions possibles et vérifie dans les 4 directions :
-        - Horizontale (→)
-        - Verticale (↓)
-        - Diagonale descendante (\)
-        - Diagonale montante (/)
+        Le bit le plus faible de m donne la case de départ de l'alignement,
+        les autres cases s'en déduisent par pas (drow, dcol) de la direction.
         
         Args:
             piece: Valeur du joueur à vérifier (PLAYER1 ou PLAYER2)
             
         Returns:
-            True si le joueur a aligné WIN_LENGTH pions, False sinon
+            Coordonnées (row, col) des WIN_LENGTH pions alignés, None sinon
         """
-        # Parcours de chaque cellule de la grille
-        for row in range(self.rows):
-            for col in range(self.cols):
-                # Si la cellule contient le pion du joueur
-                if self.grid[row][col] == piece:
-                    # Vérification dans les 4 directions
-                    for dy, dx in DIRECTIONS:
-                        if self._check_direction(row, col, dy, dx, piece):
-                            return True
+        b = self.bitboards[piece - 1]
+        win = WIN_LENGTH
         
-        return False
+        for plan, (drow, dcol) in zip(self._win_plans, self._win_steps):
+            m = b
+            for offset in plan:
+                m &= m >> offset
+            
+            if m:
+                height = self._col_height
+                start = (m & -m).bit_length() - 1
+                row, col = start % height, start // height
+                return [(row + i * drow, col + i * dcol) for i in range(win)]
+        
+        return None
     
-    def _check_direction(
-        self, 
-        start_row: int, 
-        start_col: int, 
-        dy: int, 
-        dx: int, 
-        piece: int
-    ) -> bool:
+    def check_win(self, piece: int) -> bool:
         """
-        Vérifie l'alignement de WIN_LENGTH pions dans une direction donnée.
+        Vérifie si le joueur spécifié a gagné la partie.
         
-        Méthode privée utilisée par check_win pour éviter la duplication de code.
+        Args:
+            piece: Valeur du joueur à vérifier (PLAYER1 ou PLAYER2)
+        
+        Returns:
+            True si le joueur a aligné WIN_LENGTH pions, False sinon
+        """
+        # Test mémorisé par bitboard (table de transpositions), sans calcul
+        # des coordonnées de la ligne gagnante
+        return _has_alignment(self.bitboards[piece - 1], self._win_plans)
+    
+    def check_win_last(self, row: int, col: int, piece: int) -> bool:
+        """
+        Vérifie si le pion posé en (row, col) complète un alignement gagnant.
+        
+        Un alignement gagnant contient forcément le dernier pion joué : il
+        suffit de compter, dans chacune des 4 directions, les pions consécutifs
+        du joueur de part et d'autre de (row, col) au lieu de tester tout le
+        plateau. Les bits de garde au-dessus de chaque colonne (toujours à 0)
+        arrêtent le parcours au bord vertical, et un indice négatif ou au-delà
+        de la dernière colonne donne un bit nul.
         
         Args:
-            start_row: Ligne de départ
-            start_col: Colonne de départ
-            dy: Déplacement vertical (-1, 0, ou 1)
-            dx: Déplacement horizontal (-1, 0, ou 1)
-            piece: Valeur du joueur à vérifier
-            
+            row: Ligne du dernier pion posé
+            col: Colonne du dernier pion posé
+            piece: Valeur du joueur qui vient de jouer
+        
         Returns:
-            True si WIN_LENGTH pions consécutifs sont trouvés, False sinon
+            True si le pion complète un alignement de WIN_LENGTH, False sinon
         """
-        count = 0
+        # Liaisons locales : les boucles ci-dessous ne relisent ni attributs ni globales
+        b = self.bitboards[piece - 1]
+        pos = col * self._col_height + row
+        win = WIN_LENGTH
         
-        # Vérification des WIN_LENGTH positions consécutives dans la direction
-        for i in range(WIN_LENGTH):
-            row = start_row + i * dy
-            col = start_col + i * dx
+        for shift in self._win_shifts:
+            count = 1
             
-            # Vérification des limites du plateau
-            if row < 0 or row >= self.rows or col < 0 or col >= self.cols:
-                return False
+            # Parcours vers l'arrière jusqu'au début de l'alignement
+            p = pos - shift
+            while p >= 0 and (b >> p) & 1:
+                count += 1
+                p -= shift
             
-            # Vérification si le pion correspond
-            if self.grid[row][col] == piece:
+            # Parcours vers l'avant
+            p = pos + shift
+            while (b >> p) & 1:
                 count += 1
-            else:
-                return False
+                p += shift
+            
+            if count >= win:
+                return True
         
-        return count == WIN_LENGTH
+        return False
     
     def get_winning_positions(self, piece: int) -> list[tuple[int, int]]:
         """
@@ -209,75 +399,35 @@ class Board:
             Liste des coordonnées (row, col) des WIN_LENGTH pions alignés,
             ou liste vide si aucun alignement gagnant n'est trouvé
         """
-        # Parcours de chaque cellule de la grille
-        for row in range(self.rows):
-            for col in range(self.cols):
-                # Si la cellule contient le pion du joueur
-                if self.grid[row][col] == piece:
-                    # Vérification dans les 4 directions
-                    for dy, dx in DIRECTIONS:
-                        positions = self._get_positions_in_direction(
-                            row, col, dy, dx, piece
-                        )
-                        if positions:
-                            return positions
-        
-        return []
-    
-    def _get_positions_in_direction(
-        self,
-        start_row: int,
-        start_col: int,
-        dy: int,
-        dx: int,
-        piece: int
-    ) -> list[tuple[int, int]]:
-        """
-        Collecte les positions d'un alignement gagnant dans une direction.
-        
-        Méthode privée utilisée par get_winning_positions.
-        
-        Args:
-            start_row: Ligne de départ
-            start_col: Colonne de départ
-            dy: Déplacement vertical
-            dx: Déplacement horizontal
-            piece: Valeur du joueur
-            
-        Returns:
-            Liste des coordonnées si WIN_LENGTH pions sont alignés, liste vide sinon
-        """
-        positions: list[tuple[int, int]] = []
-        
-        for i in range(WIN_LENGTH):
-            row = start_row + i * dy
-            col = start_col + i * dx
-            
-            # Vérification des limites
-            if row < 0 or row >= self.rows or col < 0 or col >= self.cols:
-                return []
-            
-            # Vérification du pion
-            if self.grid[row][col] == piece:
-                positions.append((row, col))
-            else:
-                return []
-        
-        return positions if len(positions) == WIN_LENGTH else []
+        return self._find_win(piece) or []
     
     def is_full(self) -> bool:
         """
         Vérifie si le plateau est complètement rempli (cas d'égalité).
         
         Convention : row=0 = BAS, row=ROWS-1 = HAUT.
-        Le plateau est plein si la ligne du HAUT (row=ROWS-1) ne contient aucune case vide,
-        ou plus sûrement, si AUCUNE case du plateau entier ne contient EMPTY (0).
+        Avec la gravité, le plateau est plein dès que la ligne du HAUT
+        (row=ROWS-1) ne contient aucune case vide : un seul ET sur le
+        masque d'occupation, sans tableau temporaire.
         
         Returns:
             True si toutes les cases sont remplies, False sinon
         """
-        # Méthode robuste : vérifier qu'il n'existe aucun 0 dans toute la grille
-        return not (self.grid == EMPTY).any()
+        mask = self.bitboards[0] | self.bitboards[1]
+        return mask & self._top_mask == self._top_mask
+    
+    def get_line_windows(self) -> NDArray[np.int8]:
+        """
+        Retourne le contenu de toutes les lignes gagnantes possibles.
+        
+        Une seule indexation numpy sur les indices précalculés par
+        _win_line_indices() (utile aux heuristiques d'évaluation de l'IA).
+        
+        Returns:
+            Tableau (nombre de lignes x WIN_LENGTH) des valeurs des cases
+        """
+        line_rows, line_cols = _win_line_indices(self.rows, self.cols)
+        return self.grid[line_rows, line_cols]
     
     def get_valid_locations(self) -> list[int]:
         """
@@ -288,7 +438,8 @@ class Board:
         Returns:
             Liste des indices de colonnes valides
         """
-        return [col for col in range(self.cols) if self.is_valid_location(col)]
+        rows = self.rows
+        return [col for col, height in enumerate(self.col_heights) if height < rows]
     
     def undo_last_move(self) -> bool:
         """
@@ -296,49 +447,152 @@ class Board:
         
         Récupère les coordonnées du dernier pion placé depuis l'historique,
         remet la case à EMPTY, et supprime l'entrée de l'historique.
+        Inverse exact de drop_piece() (grille, bitboards et historique).
         
         Returns:
             True si l'annulation a réussi, False si l'historique était vide
         """
         # Vérification : historique non vide
-        if not self.history:
-            print("[BOARD DEBUG] Impossible d'annuler : historique vide")
+        if not self.hist_len:
             return False
         
         # Récupération du dernier coup
-        row, col = self.history.pop()
+        self.hist_len -= 1
+        row, col = divmod(int(self.history[self.hist_len]), self.cols)
         
-        print(f"[BOARD DEBUG] Annulation du coup : row={row}, col={col}")
-        print(f"[BOARD DEBUG] Valeur AVANT annulation : grid[{row}][{col}] = {self.grid[row][col]}")
+        # Retrait du pion (grille + bitboard du joueur)
+        piece = self.grid[row, col]
+        self.grid[row, col] = EMPTY
+        self.bitboards[piece - 1] &= ~(1 << (col * self._col_height + row))
+        self.col_heights[col] = row
         
-        # Retrait du pion
-        self.grid[row][col] = EMPTY
-        
-        print(f"[BOARD DEBUG] Valeur APRÈS annulation : grid[{row}][{col}] = {self.grid[row][col]}")
-        print(f"[BOARD DEBUG] Historique restant : {self.history}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("undo_last_move : row=%d, col=%d", row, col)
         
         return True
     
+    def undo_last_moves(self, n: int) -> int:
+        """
+        Annule les n derniers coups en une seule opération.
+        
+        Les entrées sont lues dans l'historique en une seule tranche
+        (au lieu de n appels successifs à undo_last_move).
+        
+        Args:
+            n: Nombre de coups à annuler
+        
+        Returns:
+            Nombre de coups réellement annulés (min(n, taille de l'historique))
+        """
+        count = min(n, self.hist_len)
+        if count <= 0:
+            return 0
+        
+        # Retrait des pions de la grille puis de l'historique
+        grid = self.grid
+        bitboards = self.bitboards
+        col_heights = self.col_heights
+        cols = self.cols
+        height = self._col_height
+        empty = EMPTY
+        start = self.hist_len - count
+        # Du plus récent au plus ancien : chaque colonne retombe à la hauteur
+        # de son pion le plus bas retiré
+        for cell in reversed(self.history[start:self.hist_len].tolist()):
+            row, col = divmod(cell, cols)
+            piece = grid[row, col]
+            grid[row, col] = empty
+            bitboards[piece - 1] &= ~(1 << (col * height + row))
+            col_heights[col] = row
+        self.hist_len = start
+        
+        return count
+    
     def reset(self) -> None:
         """
         Réinitialise le plateau à l'état initial (toutes cellules vides).
+        
+        La grille est vidée en place (fill) plutôt que réallouée : le même
+        tableau numpy est réutilisé d'une partie à l'autre, et les références
+        éventuellement détenues ailleurs restent valides.
+        """
+        self.grid.fill(EMPTY)
+        self.hist_len = 0
+        self.bitboards = [0, 0]
+        self.col_heights = [0] * self.cols
+    
+    def clear(self) -> None:
+        """
+        Vide le plateau en place, sans réallouer la grille.
+        
+        Équivalent à reset().
+        """
+        self.reset()
+    
+    def replay_batch(self, moves: list[int]) -> int:
         """
-        self.grid = np.zeros((self.rows, self.cols), dtype=np.int_)
-        self.history.clear()
+        Rejoue une séquence de coups en alternant les joueurs.
+        
+        Équivalent à une boucle get_next_open_row() + drop_piece(), mais sans
+        appel de méthode ni log par coup : les hauteurs de colonnes
+        (col_heights) sont lues et mises à jour directement.
+        Le joueur est déduit de la parité du nombre de pions déjà posés.
+        Les coups invalides (hors limites ou colonne pleine) sont ignorés.
+        
+        Args:
+            moves: Colonnes jouées dans l'ordre (0-indexed)
+        
+        Returns:
+            Nombre de coups réellement joués
+        """
+        grid = self.grid
+        history = self.history
+        bitboards = self.bitboards
+        rows = self.rows
+        cols = self.cols
+        height = self._col_height
+        
+        # Hauteur de chaque colonne (row 0 = bas, donc hauteur = prochaine ligne libre)
+        heights = self.col_heights
+        hist_len = self.hist_len
+        parity = hist_len & 1
+        played = 0
+        
+        for col in moves:
+            if col < 0 or col >= cols or heights[col] >= rows:
+                continue
+            
+            row = heights[col]
+            piece = PLAYER2 if (parity + played) & 1 else PLAYER1
+            grid[row, col] = piece
+            bitboards[piece - 1] |= 1 << (col * height + row)
+            history[hist_len + played] = row * cols + col
+            heights[col] = row + 1
+            played += 1
+        
+        self.hist_len = hist_len + played
+        return played
     
     def copy(self) -> 'Board':
         """
         Crée une copie profonde du plateau.
         
-        Utile pour l'algorithme Minimax qui doit simuler des coups
-        sans modifier le plateau réel.
+        Réservé aux instantanés (ex: plateau de travail à la racine de
+        Minimax) ; pour simuler un coup, préférer drop_piece() puis
+        undo_last_move() sur le même plateau.
         
         Returns:
             Nouvelle instance de Board avec l'état identique
         """
-        new_board = Board(rows=self.rows, cols=self.cols)
-        new_board.grid = np.copy(self.grid)
+        # Pas de passage par __init__ : évite l'allocation d'une grille et
+        # d'un historique vides aussitôt remplacés et le recalcul du codage
+        # bitboard (constantes immuables, partagées avec l'original)
+        new_board = Board.__new__(Board)
+        new_board.__dict__.update(self.__dict__)
+        new_board.grid = self.grid.copy()
         new_board.history = self.history.copy()
+        new_board.bitboards = self.bitboards.copy()
+        new_board.col_heights = self.col_heights.copy()
         return new_board
     
     def to_dict(self) -> dict:
@@ -346,11 +600,12 @@ class Board:
         Convertit le plateau en dictionnaire pour la sérialisation JSON.
         
         Returns:
-            Dictionnaire contenant la grille et l'historique
+            Dictionnaire contenant la grille et l'historique [[row, col], ...]
         """
+        rows, cols = np.divmod(self.history[:self.hist_len], self.cols)
         return {
             'grid': self.grid.tolist(),  # Conversion numpy array -> liste
-            'history': self.history
+            'history': np.column_stack((rows, cols)).tolist()
         }
     
     @classmethod
@@ -364,10 +619,17 @@ class Board:
         Returns:
             Nouvelle instance de Board avec les données restaurées
         """
-        board = cls()
-        board.grid = np.array(data['grid'], dtype=np.int_)
-        board.history = [tuple(item) for item in data['history']]  # Conversion liste -> tuple
-        print(f"[BOARD DEBUG] Plateau restauré : {len(board.history)} coups dans l'historique")
+        grid = np.array(data['grid'], dtype=np.int8)
+        rows, cols = grid.shape  # Dimensions réelles de la grille sauvegardée
+        board = cls(rows=rows, cols=cols)
+        board.grid = grid
+        board._rebuild_bitboards()
+        
+        # Historique sérialisé en paires [row, col] -> indices row*cols+col (en un bloc)
+        pairs = np.asarray(data['history'], dtype=np.int16).reshape(-1, 2)
+        board.hist_len = len(pairs)
+        board.history[:board.hist_len] = pairs[:, 0] * cols + pairs[:, 1]
+        logger.debug("Plateau restauré : %d coups dans l'historique", board.hist_len)
         return board
     
     def __str__(self) -> str:
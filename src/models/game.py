@@ -4,16 +4,55 @@ Orchestre les tours, les états de partie et les conditions de fin.
 """
 
 from typing import Optional
-import time
+from functools import lru_cache
+import base64
+import logging
+import random
+
+import numpy as np
 
 from .board import Board
+from ..ai.bitboard_search import best_move as _bitboard_best_move
 from ..utils.constants import PLAYER1, PLAYER2
-from ..utils.enums import GameState
+from ..utils.enums import GameState, MoveResult
+
 
+# Journal du module : les messages de débogage sont ignorés hors niveau DEBUG
+logger = logging.getLogger(__name__)
 
 # Compteur global pour générer des IDs de partie uniques
 _game_counter = 0
 
+# États mis en cache au niveau du module : comparaison par identité (is),
+# sans accès à l'attribut de l'Enum ni appel à __eq__
+_IN_PROGRESS = GameState.IN_PROGRESS
+_FINISHED = GameState.FINISHED
+
+# Clé Zobrist du trait (XORée à chaque coup : encode le joueur à jouer)
+_ZOBRIST_SIDE: int = random.getrandbits(64)
+
+
+@lru_cache(maxsize=None)
+def _zobrist_keys(rows: int, cols: int) -> tuple[tuple[tuple[int, ...], ...], ...]:
+    """
+    Génère les clés Zobrist d'un plateau rows x cols.
+    
+    Une clé aléatoire de 64 bits par (joueur, ligne, colonne) ; le hash d'une
+    position est le XOR des clés de ses pions. Tables mises en cache par
+    dimensions (partagées par toutes les parties de même taille).
+    
+    Args:
+        rows: Nombre de lignes du plateau
+        cols: Nombre de colonnes du plateau
+    
+    Returns:
+        Clés indexées par [joueur - 1][row][col]
+    """
+    return tuple(
+        tuple(tuple(random.getrandbits(64) for _ in range(cols)) for _ in range(rows))
+        for _ in (PLAYER1, PLAYER2)
+    )
+
 
 class Game:
     """
@@ -29,9 +68,23 @@ class Game:
         current_player: Joueur dont c'est le tour (PLAYER1 ou PLAYER2)
         state: État actuel de la partie (GameState)
         winner: Joueur gagnant si la partie est terminée, None sinon
-        move_history: Historique des coups joués [(col, player), ...]
+        move_history: Historique des coups joués [(col, player), ...] (lecture seule,
+            construit à la demande depuis les tableaux _move_cols/_move_players)
+        move_count: Nombre de coups joués
+        zobrist: Hash Zobrist de la position, mis à jour à chaque coup/annulation
+    
+    Undo/Redo : deux piles. board.history sert de pile d'annulation, et
+    _redo_stack reçoit les coups annulés [(col, player), ...] pour pouvoir
+    les rejouer. Jouer un nouveau coup vide la pile de rétablissement.
     """
     
+    # Attributs fixes : pas de __dict__ par instance, accès par emplacement
+    __slots__ = (
+        'game_id', 'game_status', 'board', 'current_player', 'state', 'game_state',
+        'winner', '_move_cols', '_move_players', 'move_count', 'winning_line',
+        '_redo_stack', '_zobrist_keys', 'zobrist',
+    )
+    
     def __init__(self, rows: int = 6, cols: int = 7, start_player: int = PLAYER1) -> None:
         """
         Initialise une nouvelle partie avec des paramètres configurables.
@@ -50,20 +103,28 @@ class Game:
         # Initialisation du plateau et de l'état de jeu
         self.board: Board = Board(rows=rows, cols=cols)
         self.current_player: int = start_player
-        self.state: GameState = GameState.IN_PROGRESS
+        self.state: GameState = _IN_PROGRESS
         self.game_state: str = "PLAYING"  # PLAYING ou FINISHED
         self.winner: Optional[int] = None
-        self.move_history: list[tuple[int, int]] = []  # Historique (col, player)
+        # Historique des coups préalloué (une case par cellule du plateau) :
+        # colonnes et joueurs dans deux tableaux, move_count = coups joués
+        self._move_cols: np.ndarray = np.zeros(rows * cols, dtype=np.uint8)
+        self._move_players: np.ndarray = np.zeros(rows * cols, dtype=np.uint8)
+        self.move_count: int = 0
         self.winning_line: list[tuple[int, int]] = []  # Coordonnées de la ligne gagnante
+        self._redo_stack: list[tuple[int, int]] = []  # Coups annulés (col, player) pour redo
+        self._zobrist_keys = _zobrist_keys(rows, cols)
+        self.zobrist: int = 0  # Hash de la position (0 = plateau vide)
         
-        print(f"[GAME DEBUG] Nouvelle partie créée - ID: {self.game_id}")
+        logger.debug("Nouvelle partie créée - ID: %d", self.game_id)
     
     def play_turn(self, col: int) -> bool:
         """
         Tente de jouer un coup dans la colonne spécifiée.
         
         Exécute le coup si la colonne est valide, vérifie les conditions de fin,
-        et change de joueur si le jeu continue.
+        et change de joueur si le jeu continue. Un nouveau coup invalide
+        les coups annulés (la pile de rétablissement est vidée).
         
         Args:
             col: Index de la colonne où jouer (0-indexed)
@@ -72,70 +133,118 @@ class Game:
             True si le coup a été joué avec succès, False sinon
             (colonne invalide ou partie terminée)
         """
-        # === DEBUG LOG ===
-        print(f"\n[DEBUG] play_turn appelé : col={col}, joueur={self.current_player}")
-        
-        # Vérification : la partie doit être en cours
-        if self.state != GameState.IN_PROGRESS:
-            print(f"[DEBUG] Partie déjà terminée (état={self.state.name})")
+        if not self._apply_move(col):
             return False
         
-        # Vérification : la colonne doit être valide
-        if not self.board.is_valid_location(col):
-            print(f"[DEBUG] Colonne {col} invalide (pleine ou hors limites)")
+        self._redo_stack.clear()
+        return True
+    
+    def _apply_move(self, col: int) -> bool:
+        """
+        Joue un coup sans toucher à la pile de rétablissement.
+        
+        Méthode privée partagée par play_turn() et redo().
+        
+        Args:
+            col: Index de la colonne où jouer (0-indexed)
+        
+        Returns:
+            True si le coup a été joué avec succès, False sinon
+        """
+        # Vérification : la partie doit être en cours
+        if self.state:  # IN_PROGRESS == 0 : tout autre état est vrai
             return False
         
-        # Placement du pion avec gravité
-        row = self.board.get_next_open_row(col)
-        if row is None:
-            print(f"[DEBUG] Erreur : get_next_open_row a retourné None")
-            return False  # Sécurité supplémentaire
+        # Validation, placement avec gravité et issue du coup en un seul appel
+        row, result = self.board.try_drop_and_check(col, self.current_player)
+        if result is MoveResult.INVALID:
+            return False  # Colonne hors limites ou pleine
         
-        print(f"[DEBUG] Placement du pion : row={row}, col={col}, player={self.current_player}")
-        self.board.drop_piece(row, col, self.current_player)
+        self._toggle_zobrist(row, col, self.current_player)
         
-        # Enregistrement du coup dans l'historique
-        self.move_history.append((col, self.current_player))
-        print(f"[DEBUG] Coup enregistré. Total coups joués : {len(self.move_history)}")
+        # Enregistrement du coup dans l'historique (aucune allocation)
+        count = self.move_count
+        self._move_cols[count] = col
+        self._move_players[count] = self.current_player
+        self.move_count = count + 1
         
-        # Vérification de la victoire
-        has_won = self.board.check_win(self.current_player)
-        print(f"[DEBUG] Vérification victoire pour joueur {self.current_player} : {has_won}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Coup joué : row=%d, col=%d, joueur=%d (%d coups)",
+                         row, col, self.current_player, self.move_count)
         
-        if has_won:
-            self.state = GameState.FINISHED
+        # Victoire : seules les lignes passant par le dernier pion ont été testées
+        if result is MoveResult.WIN:
+            self.state = _FINISHED
             self.game_state = "FINISHED"
             self.winner = self.current_player
             self.winning_line = self.board.get_winning_positions(self.current_player)
-            print(f"[DEBUG] 🎉 VICTOIRE détectée pour le joueur {self.current_player}")
-            print(f"[DEBUG] Ligne gagnante : {self.winning_line}")
+            logger.debug("Victoire du joueur %d : %s", self.current_player, self.winning_line)
             return True
         
-        # Vérification de l'égalité (plateau plein)
-        is_draw = self.board.is_full()
-        print(f"[DEBUG] Vérification plateau plein : {is_draw}")
-        
-        if is_draw:
-            self.state = GameState.FINISHED
+        # Égalité (plateau plein)
+        if result is MoveResult.DRAW:
+            self.state = _FINISHED
             self.game_state = "FINISHED"
             self.winner = None  # Aucun gagnant en cas d'égalité
-            print(f"[DEBUG] 🤝 ÉGALITÉ détectée (plateau plein)")
+            logger.debug("Égalité (plateau plein)")
             return True
         
         # Changement de joueur pour le prochain tour
-        print(f"[DEBUG] Changement de joueur : {self.current_player} -> ", end="")
         self._switch_player()
-        print(f"{self.current_player}")
         
         return True
     
+    @property
+    def move_history(self) -> list[tuple[int, int]]:
+        """
+        Historique des coups joués, du plus ancien au plus récent.
+        
+        Returns:
+            Liste de tuples (col, player)
+        """
+        count = self.move_count
+        return list(zip(self._move_cols[:count].tolist(), self._move_players[:count].tolist()))
+    
+    def _toggle_zobrist(self, row: int, col: int, player: int) -> None:
+        """
+        Ajoute ou retire un pion du hash Zobrist (le XOR est son propre inverse).
+        
+        Args:
+            row: Ligne du pion
+            col: Colonne du pion
+            player: Joueur propriétaire du pion
+        """
+        self.zobrist ^= self._zobrist_keys[player - 1][row][col] ^ _ZOBRIST_SIDE
+    
+    def _rebuild_zobrist(self) -> None:
+        """
+        Recalcule le hash Zobrist à partir de la grille (après restauration).
+        """
+        self.zobrist = 0
+        grid = self.board.grid
+        for row, col in zip(*np.nonzero(grid)):
+            self._toggle_zobrist(int(row), int(col), int(grid[row, col]))
+    
+    def get_hash(self) -> int:
+        """
+        Retourne le hash Zobrist de la position courante.
+        
+        Deux ordres de coups menant à la même position donnent le même hash :
+        clé adaptée à une table de transpositions.
+        
+        Returns:
+            Hash 64 bits de la position
+        """
+        return self.zobrist
+    
     def _switch_player(self) -> None:
         """
         Alterne entre PLAYER1 et PLAYER2.
         
         Méthode privée appelée après chaque coup valide.
         """
-        self.current_player = PLAYER2 if self.current_player == PLAYER1 else PLAYER1
+        # PLAYER1 + PLAYER2 == 3 : une soustraction, sans comparaison ni branche
+        self.current_player = 3 - self.current_player
     
     def get_current_player(self) -> int:
         """
@@ -144,7 +253,7 @@ class Game:
         Returns:
             PLAYER1 ou PLAYER2
         """
-        return self.current_player
+        return self.current_player  # deprecated: use .current_player
     
     def get_winner(self) -> Optional[int]:
         """
@@ -153,7 +262,7 @@ class Game:
         Returns:
             PLAYER1, PLAYER2 si victoire, None si égalité ou partie en cours
         """
-        return self.winner
+        return self.winner  # deprecated: use .winner
     
     def is_game_over(self) -> bool:
         """
@@ -162,7 +271,7 @@ class Game:
         Returns:
             True si la partie est terminée, False sinon
         """
-        return self.state == GameState.FINISHED
+        return self.state is _FINISHED  # deprecated: use .state is GameState.FINISHED
     
     def get_winning_positions(self) -> list[tuple[int, int]]:
         """
@@ -174,40 +283,84 @@ class Game:
         """
         return self.winning_line
     
-    def undo(self) -> bool:
+    def undo(self, n: int = 1) -> int:
         """
-        Annule le dernier coup joué.
+        Annule les n derniers coups joués.
         
-        Appelle Board.undo_last_move() pour retirer le pion de la grille,
-        puis inverse le tour pour revenir au joueur précédent.
+        Appelle Board.undo_last_moves() pour retirer les pions de la grille en une
+        seule opération, puis recalcule une seule fois le joueur courant et l'état.
         Réinitialise également l'état de la partie si elle était terminée.
         
+        Args:
+            n: Nombre de coups à annuler (par défaut 1, 2 en mode PvAI)
+        
         Returns:
-            True si l'annulation a réussi, False si impossible (historique vide)
+            Nombre de coups réellement annulés (0 si l'historique était vide)
+        """
+        # Annulation groupée sur le plateau
+        count = self.board.undo_last_moves(n)
+        
+        if count == 0:
+            return 0
+        
+        # Synchronisation de l'historique des coups de la partie
+        end = self.move_count
+        start = end - count
+        undone_moves = list(zip(self._move_cols[start:end].tolist(), self._move_players[start:end].tolist()))
+        self.move_count = start
+        
+        # Retrait des pions du hash : les coups annulés se réempilent,
+        # du plus ancien au plus récent, sur les hauteurs restaurées
+        heights = self.board.col_heights.copy()
+        for col, player in undone_moves:
+            self._toggle_zobrist(heights[col], col, player)
+            heights[col] += 1
+        
+        # Empilement sur la pile de rétablissement (le plus ancien au sommet)
+        self._redo_stack.extend(reversed(undone_moves))
+        
+        # Le joueur courant redevient l'auteur du plus ancien coup annulé
+        self.current_player = undone_moves[0][1]
+        
+        # Réinitialisation de l'état si la partie était terminée
+        if self.state is _FINISHED:
+            self.state = _IN_PROGRESS
+            self.game_state = "PLAYING"
+            self.winner = None
+            self.winning_line = []
+        
+        logger.debug("Undo de %d coup(s), joueur courant : %d", count, self.current_player)
+        return count
+    
+    def redo(self, n: int = 1) -> int:
         """
-        print(f"\n[GAME DEBUG] === UNDO APPELÉ ===")
-        print(f"[GAME DEBUG] Joueur actuel AVANT undo : {self.current_player}")
-        print(f"[GAME DEBUG] État de la partie : {self.state.name}")
+        Rejoue les n derniers coups annulés par undo().
         
-        # Tentative d'annulation sur le plateau
-        success = self.board.undo_last_move()
+        Returns:
+            Nombre de coups réellement rejoués (0 si rien à rétablir)
+        """
+        count = 0
         
-        if success:
-            # Changement de joueur (retour au joueur précédent)
-            self._switch_player()
+        while count < n and self._redo_stack:
+            col, player = self._redo_stack[-1]
             
-            # Réinitialisation de l'état si la partie était terminée
-            if self.state == GameState.FINISHED:
-                self.state = GameState.IN_PROGRESS
-                self.winner = None
-                print(f"[GAME DEBUG] Partie réactivée (était terminée)")
+            # Sécurité : le coup doit correspondre au joueur courant
+            if player != self.current_player or not self._apply_move(col):
+                break
             
-            print(f"[GAME DEBUG] Joueur actuel APRÈS undo : {self.current_player}")
-            print(f"[GAME DEBUG] === UNDO RÉUSSI ===\n")
-            return True
-        else:
-            print(f"[GAME DEBUG] === UNDO ÉCHOUÉ ===\n")
-            return False
+            self._redo_stack.pop()
+            count += 1
+        
+        return count
+    
+    def can_redo(self) -> bool:
+        """
+        Indique si des coups annulés peuvent être rejoués.
+        
+        Returns:
+            True si la pile de rétablissement n'est pas vide
+        """
+        return bool(self._redo_stack)
     
     def get_valid_moves(self) -> list[int]:
         """
@@ -229,22 +382,26 @@ class Game:
         Returns:
             True si l'annulation a réussi, False si aucun coup à annuler
         """
-        if not self.move_history:
+        if not self.move_count:
             return False
         
         # Récupération du dernier coup
-        col, player = self.move_history.pop()
+        self.move_count -= 1
+        col = int(self._move_cols[self.move_count])
+        player = int(self._move_players[self.move_count])
         
-        # Recherche de la case à vider (la plus haute dans la colonne)
-        for row in range(len(self.board.grid)):
-            if self.board.grid[row][col] != 0:
-                self.board.grid[row][col] = 0
-                break
+        # Retrait du pion via le plateau (grille, bitboards et historique) ;
+        # la hauteur restaurée de la colonne est la ligne du pion retiré
+        self.board.undo_last_move()
+        row = self.board.col_heights[col]
+        self._toggle_zobrist(row, col, player)
         
         # Restauration de l'état de la partie
         self.current_player = player
-        self.state = GameState.IN_PROGRESS
+        self.state = _IN_PROGRESS
+        self.game_state = "PLAYING"
         self.winner = None
+        self.winning_line = []
         
         return True
     
@@ -259,7 +416,7 @@ class Game:
         if self.game_status == 'EN_COURS':
             old_id = self.game_id
             self.game_status = 'ABANDONNEE'
-            print(f"[GAME DEBUG] Partie {old_id} marquée comme ABANDONNEE")
+            logger.debug("Partie %d marquée comme ABANDONNEE", old_id)
         
         # Génération d'un nouvel ID
         global _game_counter
@@ -267,26 +424,96 @@ class Game:
         self.game_id = _game_counter
         self.game_status = 'EN_COURS'
         
-        # Réinitialisation du plateau et de l'état
-        self.board.reset()
+        # Réinitialisation du plateau (en place, sans réallocation) et de l'état
+        self.board.clear()
         self.current_player = PLAYER1
-        self.state = GameState.IN_PROGRESS
+        self.state = _IN_PROGRESS
+        self.game_state = "PLAYING"
         self.winner = None
-        self.move_history = []
+        self.winning_line = []
+        self.move_count = 0
+        self._redo_stack.clear()
+        self.zobrist = 0
         
-        print(f"[GAME DEBUG] Nouvelle partie démarrée - ID: {self.game_id}")
+        logger.debug("Nouvelle partie démarrée - ID: %d", self.game_id)
     
     def get_board_copy(self) -> Board:
         """
         Retourne une copie du plateau actuel.
         
-        Utile pour l'IA qui doit simuler des coups sans modifier le jeu réel.
+        Réservé aux instantanés (aperçu graphique, racine d'une recherche) :
+        pour simuler des coups, utiliser make_move() / unmake_move().
         
         Returns:
             Copie profonde du plateau actuel
         """
         return self.board.copy()
     
+    def make_move(self, col: int) -> tuple[int, int]:
+        """
+        Joue un coup de simulation, sans validation ni test de fin de partie.
+        
+        Forme avec unmake_move() la paire jouer/annuler des recherches
+        (Minimax, Alpha-Beta) : ni copie du plateau, ni log, ni mise à jour
+        de l'historique de la partie ou de la pile de rétablissement.
+        L'appelant doit avoir vérifié que la colonne est jouable.
+        
+        Args:
+            col: Index de la colonne où jouer (0-indexed)
+        
+        Returns:
+            Tuple (row, col) du pion posé, à passer à unmake_move()
+        """
+        player = self.current_player
+        row = self.board.col_heights[col]
+        self.board.drop_piece(row, col, player)
+        self._toggle_zobrist(row, col, player)
+        self.current_player = 3 - player
+        return row, col
+    
+    def unmake_move(self, row: int, col: int) -> None:
+        """
+        Annule le dernier coup joué par make_move().
+        
+        Args:
+            row: Ligne du pion retourné par make_move()
+            col: Colonne du pion retourné par make_move()
+        """
+        player = 3 - self.current_player
+        self.board.undo_last_move()
+        self._toggle_zobrist(row, col, player)
+        self.current_player = player
+    
+    def to_bitboards(self) -> tuple[int, int]:
+        """
+        Retourne la position sous forme de bitboards.
+        
+        Returns:
+            Tuple (pions de PLAYER1, pions de PLAYER2), codage de Board
+        """
+        return self.board.bitboards[0], self.board.bitboards[1]
+    
+    def best_move(self, depth: int = 6) -> Optional[int]:
+        """
+        Calcule le meilleur coup du joueur courant par Alpha-Beta sur bitboards.
+        
+        La recherche travaille sur deux entiers (aucune copie ni simulation
+        sur le plateau) : seules les victoires/défaites forcées à l'horizon
+        sont évaluées, sans heuristique de position.
+        
+        Args:
+            depth: Profondeur de recherche en demi-coups (par défaut 6)
+        
+        Returns:
+            Index de la colonne conseillée, ou None si la partie est terminée
+        """
+        if self.state is not _IN_PROGRESS:
+            return None
+        
+        own = self.board.bitboards[self.current_player - 1]
+        other = self.board.bitboards[2 - self.current_player]
+        return _bitboard_best_move(own, other, self.board.rows, self.board.cols, max(depth, 1))
+    
     def get_move_count(self) -> int:
         """
         Retourne le nombre de coups joués depuis le début de la partie.
@@ -294,21 +521,45 @@ class Game:
         Returns:
             Nombre de coups dans l'historique
         """
-        return len(self.move_history)
+        return self.move_count  # deprecated: use .move_count
+    
+    def get_coups(self) -> str:
+        """
+        Retourne la séquence des coups joués au format base de données.
+        
+        Colonnes 1-indexées concaténées (ex: "4554433"), construites en une
+        seule opération numpy à partir du miroir _move_cols.
+        
+        Returns:
+            Séquence des colonnes jouées
+        """
+        count = self.move_count
+        
+        # Au-delà de 9 colonnes, un coup peut s'écrire sur 2 caractères
+        if self.board.cols > 9:
+            return ''.join(str(col + 1) for col in self._move_cols[:count].tolist())
+        
+        return (self._move_cols[:count] + 49).tobytes().decode('ascii')
     
     def to_dict(self) -> dict:
         """
         Convertit le jeu en dictionnaire pour la sérialisation JSON.
         
+        L'historique des coups est stocké sous forme compacte : colonnes et
+        joueurs en octets (un par coup) encodés en base64, au lieu d'une
+        liste de paires [col, player].
+        
         Returns:
             Dictionnaire contenant l'état complet de la partie
         """
+        count = self.move_count
         return {
             'board': self.board.to_dict(),
             'current_player': self.current_player,
             'state': self.state.name,  # Conversion enum -> string
             'winner': self.winner,
-            'move_history': self.move_history
+            'move_cols': base64.b64encode(self._move_cols[:count].tobytes()).decode('ascii'),
+            'move_players': base64.b64encode(self._move_players[:count].tobytes()).decode('ascii')
         }
     
     @classmethod
@@ -316,19 +567,39 @@ class Game:
         """
         Crée une instance de Game à partir d'un dictionnaire.
         
+        Accepte aussi l'ancien format d'historique ('move_history' en
+        liste de paires [col, player]) des sauvegardes existantes.
+        
         Args:
             data: Dictionnaire contenant l'état complet de la partie
             
         Returns:
             Nouvelle instance de Game avec les données restaurées
         """
-        game = cls()
-        game.board = Board.from_dict(data['board'])
-        game.current_player = data['current_player']
+        board = Board.from_dict(data['board'])
+        
+        # Partie créée directement aux bonnes dimensions : tableaux d'historique
+        # et clés Zobrist déjà dimensionnés, seul le plateau est remplacé
+        game = cls(rows=board.rows, cols=board.cols, start_player=data['current_player'])
+        game.board = board
         game.state = GameState[data['state']]  # Conversion string -> enum
         game.winner = data['winner']
-        game.move_history = [tuple(item) for item in data['move_history']]
-        print(f"[GAME DEBUG] Partie restaurée : joueur {game.current_player}, état {game.state.name}")
+        
+        if 'move_cols' in data:
+            # Format compact : une copie d'octets par tableau, aucun objet par coup
+            cols = np.frombuffer(base64.b64decode(data['move_cols']), dtype=np.uint8)
+            players = np.frombuffer(base64.b64decode(data['move_players']), dtype=np.uint8)
+            game.move_count = len(cols)
+            game._move_cols[:len(cols)] = cols
+            game._move_players[:len(players)] = players
+        else:
+            moves = data['move_history']
+            game.move_count = len(moves)
+            if moves:
+                game._move_cols[:len(moves)], game._move_players[:len(moves)] = zip(*moves)
+        
+        game._rebuild_zobrist()
+        logger.debug("Partie restaurée : joueur %d, état %s", game.current_player, game.state.name)
         return game
     
     def __str__(self) -> str:
@@ -341,6 +612,6 @@ class Game:
         status = f"État: {self.state.name}"
         player = f"Joueur actuel: {self.current_player}"
         winner = f"Gagnant: {self.winner if self.winner else 'Aucun'}"
-        moves = f"Coups joués: {len(self.move_history)}"
+        moves = f"Coups joués: {self.move_count}"
         
         return f"{status} | {player} | {winner} | {moves}\n{self.board}"
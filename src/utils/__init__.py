@@ -7,7 +7,7 @@ from .constants import (
     SQUARESIZE, WIDTH, HEIGHT,
     BLUE, BLACK, RED, YELLOW, WHITE, GREEN
 )
-from .enums import GameState, AppState
+from .enums import GameState, AppState, GameMode, MoveResult
 
 __all__ = [
     "ROWS",
@@ -27,4 +27,6 @@ __all__ = [
     "GREEN",
     "GameState",
     "AppState",
+    "GameMode",
+    "MoveResult",
 ]
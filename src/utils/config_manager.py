@@ -3,9 +3,40 @@ Module de gestion de la configuration du jeu.
 Permet de charger, sauvegarder et manipuler les paramètres de jeu.
 """
 
+import atexit
 import json
+import logging
 import os
-from typing import Dict, Any
+import threading
+from functools import lru_cache
+from typing import Dict, Any, Optional
+
+from .file_io import atomic_write_bytes, dumps_json
+
+
+# Journal du module : les messages de débogage sont ignorés hors niveau DEBUG
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=8)
+def _read_config_file(filename: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Lit et décode un fichier de configuration JSON.
+    
+    Résultat mis en cache par (fichier, date de modification, taille) :
+    recharger un fichier inchangé ne relit ni ne redécode rien. Le
+    dictionnaire retourné est partagé et ne doit pas être modifié.
+    
+    Args:
+        filename: Chemin du fichier
+        mtime_ns: Date de modification (ns), invalide le cache si le fichier change
+        size: Taille du fichier en octets
+    
+    Returns:
+        Contenu JSON décodé
+    """
+    with open(filename, 'r', encoding='utf-8') as f:
+        return json.load(f)
 
 
 class ConfigManager:
@@ -22,6 +53,12 @@ class ConfigManager:
         filename: Nom du fichier de configuration
     """
     
+    # Attributs fixes : pas de __dict__ par instance, accès par emplacement
+    __slots__ = (
+        'filename', 'rows', 'cols', 'start_player',
+        '_save_lock', '_save_pending', '_save_thread',
+    )
+    
     # Valeurs par défaut
     DEFAULT_ROWS: int = 6
     DEFAULT_COLS: int = 7
@@ -33,25 +70,41 @@ class ConfigManager:
     MIN_COLS: int = 4
     MAX_COLS: int = 12
     
-    def __init__(self, filename: str = "config.json") -> None:
+    def __init__(self, filename: str = "config.json", autoload: bool = True) -> None:
         """
         Initialise le gestionnaire de configuration.
         
         Tente de charger le fichier de configuration existant.
         Si absent, utilise les valeurs par défaut.
         
+        Usage :
+        - ConfigManager() : configuration de l'application, chargée depuis le disque
+        - ConfigManager(autoload=False) : valeurs par défaut sans accès disque
+          (tests, configuration temporaire) ; load_config() reste appelable
+        
         Args:
             filename: Nom du fichier de configuration (par défaut: config.json)
+            autoload: Charger le fichier dès la construction (par défaut: True)
         """
         self.filename: str = filename
         self.rows: int = self.DEFAULT_ROWS
         self.cols: int = self.DEFAULT_COLS
         self.start_player: int = self.DEFAULT_START_PLAYER
         
+        # Sauvegarde en arrière-plan : demandes regroupées sous verrou
+        self._save_lock: threading.Lock = threading.Lock()
+        self._save_pending: bool = False
+        self._save_thread: Optional[threading.Thread] = None
+        # Le thread de sauvegarde est un démon : une sortie juste après une
+        # modification la perdrait sans ce point de synchronisation
+        atexit.register(self.flush)
+        
         # Chargement de la configuration existante si disponible
-        self.load_config()
+        if autoload:
+            self.load_config()
         
-        print(f"[CONFIG MANAGER] Configuration initialisée : {self.rows}×{self.cols}, Joueur {self.start_player} commence")
+        logger.debug("Configuration initialisée : %d×%d, Joueur %d commence",
+                     self.rows, self.cols, self.start_player)
     
     def load_config(self) -> bool:
         """
@@ -63,51 +116,109 @@ class ConfigManager:
         Returns:
             True si le chargement a réussi, False sinon
         """
-        if not os.path.exists(self.filename):
-            print(f"[CONFIG MANAGER] Fichier {self.filename} introuvable, utilisation des paramètres par défaut")
+        # Un seul appel système : existence, date et taille du fichier
+        try:
+            stat = os.stat(self.filename)
+        except OSError:
+            logger.debug("Fichier %s introuvable, utilisation des paramètres par défaut", self.filename)
             return False
         
         try:
-            with open(self.filename, 'r', encoding='utf-8') as f:
-                data: Dict[str, Any] = json.load(f)
+            data: Dict[str, Any] = _read_config_file(self.filename, stat.st_mtime_ns, stat.st_size)
             
             # Chargement des valeurs avec validation
             self.rows = self._validate_rows(data.get('rows', self.DEFAULT_ROWS))
             self.cols = self._validate_cols(data.get('cols', self.DEFAULT_COLS))
             self.start_player = self._validate_player(data.get('start_player', self.DEFAULT_START_PLAYER))
             
-            print(f"[CONFIG MANAGER] Configuration chargée depuis {self.filename}")
+            logger.debug("Configuration chargée depuis %s", self.filename)
             return True
             
         except (json.JSONDecodeError, IOError, KeyError) as e:
-            print(f"[CONFIG MANAGER] ❌ Erreur lors du chargement : {e}")
-            print("[CONFIG MANAGER] Utilisation des paramètres par défaut")
+            logger.warning("Erreur lors du chargement de %s : %s (paramètres par défaut)", self.filename, e)
             return False
     
     def save_config(self) -> bool:
         """
         Sauvegarde la configuration actuelle dans le fichier JSON.
         
+        Le contenu est sérialisé en une fois puis écrit via atomic_write_bytes :
+        un arrêt en cours d'écriture laisse l'ancien config.json intact.
+        
         Returns:
             True si la sauvegarde a réussi, False sinon
         """
+        data: Dict[str, Any] = {
+            'rows': self.rows,
+            'cols': self.cols,
+            'start_player': self.start_player
+        }
+        payload = dumps_json(data, pretty=True)
+        
         try:
-            data: Dict[str, Any] = {
-                'rows': self.rows,
-                'cols': self.cols,
-                'start_player': self.start_player
-            }
-            
-            with open(self.filename, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            atomic_write_bytes(self.filename, payload)
             
-            print(f"[CONFIG MANAGER] ✅ Configuration sauvegardée dans {self.filename}")
+            logger.debug("Configuration sauvegardée dans %s", self.filename)
             return True
             
-        except IOError as e:
-            print(f"[CONFIG MANAGER] ❌ Erreur lors de la sauvegarde : {e}")
+        except OSError as e:
+            logger.error("Erreur lors de la sauvegarde de %s : %s", self.filename, e)
             return False
     
+    def save_config_async(self) -> None:
+        """
+        Sauvegarde la configuration dans un thread d'arrière-plan.
+        
+        La boucle Pygame ne bloque pas sur l'accès disque. Les demandes
+        rapprochées sont regroupées : tant qu'une sauvegarde est en cours,
+        les nouvelles demandes ne lancent pas de thread mais déclenchent une
+        seule réécriture supplémentaire avec les valeurs les plus récentes.
+        """
+        with self._save_lock:
+            self._save_pending = True
+            if self._save_thread is not None:
+                return  # Le thread en cours prendra la demande en compte
+            
+            self._save_thread = threading.Thread(
+                target=self._flush_pending_saves, name="config-save", daemon=True
+            )
+            self._save_thread.start()
+    
+    def _flush_pending_saves(self) -> None:
+        """
+        Corps du thread de sauvegarde : écrit tant que des demandes sont en attente.
+        """
+        while True:
+            with self._save_lock:
+                if not self._save_pending:
+                    self._save_thread = None
+                    return
+                self._save_pending = False
+            
+            self.save_config()
+    
+    def flush(self) -> bool:
+        """
+        Termine les sauvegardes lancées par save_config_async().
+        
+        Attend le thread de sauvegarde en cours, puis écrit directement une
+        éventuelle demande encore en attente. Appelée à la sortie du programme.
+        
+        Returns:
+            True si rien n'était à écrire ou si la dernière sauvegarde a réussi
+        """
+        with self._save_lock:
+            thread = self._save_thread
+        if thread is not None:
+            thread.join()
+        
+        with self._save_lock:
+            if not self._save_pending:
+                return True
+            self._save_pending = False
+        
+        return self.save_config()
+    
     def get_config(self) -> Dict[str, int]:
         """
         Retourne un dictionnaire avec les paramètres actuels.
@@ -199,7 +310,8 @@ class ConfigManager:
     
     def toggle_start_player(self) -> None:
         """Alterne le joueur qui commence (1 <-> 2)."""
-        self.start_player = 2 if self.start_player == 1 else 1
+        # 1 + 2 == 3 : une soustraction, sans comparaison ni branche
+        self.start_player = 3 - self.start_player
     
     def _validate_rows(self, rows: int) -> int:
         """Valide et borne le nombre de lignes."""
@@ -210,5 +322,5 @@ class ConfigManager:
         return max(self.MIN_COLS, min(self.MAX_COLS, cols))
     
     def _validate_player(self, player: int) -> int:
-        """Valide le numéro du joueur (1 ou 2)."""
-        return 1 if player == 1 else 2
+        """Valide le numéro du joueur (1 ou 2), valeur par défaut si invalide."""
+        return player if player in (1, 2) else self.DEFAULT_START_PLAYER
@@ -21,7 +21,8 @@ HEADER_HEIGHT: int = 100  # Hauteur de la zone d'en-tête (pour UI)
 WIDTH: int = COLS * SQUARESIZE  # Largeur de la fenêtre
 HEIGHT: int = 750  # Hauteur totale optimisée pour l'historique et les menus
 
-# Couleurs (RGB)
+# Couleurs (RGB) ; la vue Pygame les convertit une fois en pygame.Color,
+# ce module reste importable sans Pygame (modèles, IA, tests)
 BLUE: tuple[int, int, int] = (0, 100, 200)      # Fond du plateau
 BLACK: tuple[int, int, int] = (0, 0, 0)         # Arrière-plan
 RED: tuple[int, int, int] = (230, 50, 50)       # Joueur 1
@@ -31,9 +32,13 @@ GREEN: tuple[int, int, int] = (50, 200, 100)    # Surbrillance victoire
 
 # Directions de vérification pour la victoire (dy, dx)
 # Utilisées pour parcourir les 4 directions : horizontale, verticale, diagonales
-DIRECTIONS: list[tuple[int, int]] = [
+# Tuple figé (non modifiable) ; DR / DC donnent les mêmes pas composante
+# par composante, pour les boucles indexées par direction d
+DIRECTIONS: tuple[tuple[int, int], ...] = (
     (0, 1),   # Horizontale (droite)
     (1, 0),   # Verticale (bas)
     (1, 1),   # Diagonale descendante (\)
     (1, -1),  # Diagonale montante (/)
-]
+)
+DR: tuple[int, ...] = tuple(dy for dy, _ in DIRECTIONS)  # (0, 1, 1, 1)
+DC: tuple[int, ...] = tuple(dx for _, dx in DIRECTIONS)  # (1, 0, 1, -1)
@@ -3,20 +3,35 @@ Module de gestion de la persistance des données.
 Permet de sauvegarder et charger l'état d'une partie.
 """
 
-import json
 import os
 from typing import Optional
 
 from ..models.game import Game
+from .file_io import atomic_write_bytes, dumps_json, loads_json
 
+# Taille du tampon de lecture des sauvegardes (64 Ko)
+READ_BUFFER_SIZE = 1 << 16
 
-def save_game(game: Game, filename: str = "savegame.json") -> bool:
+
+def save_game(
+    game: Game,
+    filename: str = "savegame.json",
+    pretty: bool = False,
+    durable: bool = False
+) -> bool:
     """
     Sauvegarde l'état actuel de la partie dans un fichier JSON.
     
+    Le document est sérialisé en mémoire puis écrit en une seule fois,
+    au lieu de laisser json.dump émettre une multitude de petites écritures,
+    de manière atomique (voir atomic_write_bytes).
+    
     Args:
         game: Instance du jeu à sauvegarder
         filename: Nom du fichier de sauvegarde (par défaut: savegame.json)
+        pretty: Si True, JSON indenté (lisible) ; sinon JSON compact
+        durable: Si True, force l'écriture sur disque (fsync) avant la
+            substitution ; plus lent, réservé aux sauvegardes critiques
         
     Returns:
         True si la sauvegarde a réussi, False sinon
@@ -25,9 +40,10 @@ def save_game(game: Game, filename: str = "savegame.json") -> bool:
         # Conversion du jeu en dictionnaire
         game_data = game.to_dict()
         
-        # Écriture dans le fichier JSON
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(game_data, f, indent=2, ensure_ascii=False)
+        # Sérialisation en mémoire puis écriture en un seul appel
+        data = dumps_json(game_data, pretty)
+        
+        atomic_write_bytes(filename, data, durable)
         
         print(f"[DATA MANAGER] Partie sauvegardée dans {filename}")
         return True
@@ -53,9 +69,9 @@ def load_game(filename: str = "savegame.json") -> Optional[Game]:
             print(f"[DATA MANAGER] Fichier {filename} introuvable")
             return None
         
-        # Lecture du fichier JSON
-        with open(filename, 'r', encoding='utf-8') as f:
-            game_data = json.load(f)
+        # Lecture du fichier en un bloc puis décodage JSON
+        with open(filename, 'rb', buffering=READ_BUFFER_SIZE) as f:
+            game_data = loads_json(f.read())
         
         # Reconstruction de l'objet Game
         game = Game.from_dict(game_data)
@@ -3,13 +3,95 @@ Module de gestion de la base de données MySQL pour Connect Four.
 Gère l'enregistrement des parties avec chaînage intelligent.
 """
 
+import json
+import logging
 import os
-from typing import Optional, Dict, List
-import mysql.connector
-from mysql.connector import Error, MySQLConnection
+import queue
+import re
+import threading
+from collections import namedtuple
+from itertools import islice
+from typing import Any, Optional, Dict, Iterator, List
+import numpy as np
+from mysql.connector import Error, MySQLConnection, pooling
+from mysql.connector.constants import ClientFlag
 from dotenv import load_dotenv
 
 
+logger = logging.getLogger(__name__)
+
+
+# Codes d'erreur client d'une connexion perdue (CR_SERVER_GONE_ERROR,
+# CR_SERVER_LOST, CR_SERVER_LOST_EXTENDED)
+_LOST_CONNECTION_ERRNOS = frozenset({2006, 2013, 2055})
+
+
+# Ligne de la table 'games' lue par iter_all_games (un tuple, pas un dict par ligne)
+GameRow = namedtuple('GameRow', (
+    'id', 'coups', 'coups_symetrique', 'mode_jeu', 'statut',
+    'ligne_gagnante', 'id_antecedent', 'id_suivant', 'created_at'
+))
+
+
+# Type des séquences de coups : ASCII binaire, 1 octet par caractère
+_SEQUENCE_TYPE = "VARCHAR(255) CHARACTER SET ascii COLLATE ascii_bin"
+
+
+# Table de symétrie verticale (grille à 9 colonnes) : colonne c -> 10 - c
+_MIRROR = str.maketrans('123456789', '987654321')
+
+
+# Validation d'une séquence de coups : uniquement des chiffres 1 à 9, non vide
+_is_valid_sequence = re.compile(r'[1-9]+').fullmatch
+
+
+def _mirror_sql(column: str) -> str:
+    """
+    Construit l'expression SQL du symétrique d'une séquence (colonne c -> 10 - c).
+    
+    MySQL n'a pas d'équivalent à str.translate et une colonne générée ne peut
+    pas appeler de fonction stockée : on enchaîne des REPLACE, en passant par
+    des lettres intermédiaires pour ne pas retraduire un chiffre déjà converti.
+    
+    Args:
+        column: Nom de la colonne source
+    
+    Returns:
+        Expression SQL calculant la séquence symétrique
+    """
+    expr = column
+    digits = '12346789'  # '5' est son propre symétrique
+    for digit in digits:
+        expr = f"REPLACE({expr}, '{digit}', '{chr(ord('a') + int(digit))}')"
+    for digit in digits:
+        expr = f"REPLACE({expr}, '{chr(ord('a') + int(digit))}', '{10 - int(digit)}')"
+    return expr
+
+
+# Définitions des colonnes calculées par le serveur
+_SYMMETRIC_COLUMN = f"coups_symetrique {_SEQUENCE_TYPE} AS ({_mirror_sql('coups')}) STORED"
+_CANON_COLUMN = f"canon {_SEQUENCE_TYPE} AS (LEAST(coups, coups_symetrique)) STORED"
+
+
+def _encode_winning_line(ligne_gagnante: Any) -> Optional[str]:
+    """
+    Prépare la ligne gagnante pour la colonne JSON 'ligne_gagnante'.
+    
+    Le connecteur MySQL ne sait pas convertir une liste ou un dictionnaire :
+    les coordonnées sont encodées ici, en JSON compact, pour que les
+    appelants n'aient plus à le faire. Une chaîne est transmise telle quelle.
+    
+    Args:
+        ligne_gagnante: Coordonnées (liste de paires), chaîne JSON ou None
+    
+    Returns:
+        Chaîne JSON, ou None
+    """
+    if ligne_gagnante is None or isinstance(ligne_gagnante, str):
+        return ligne_gagnante
+    return json.dumps(ligne_gagnante, separators=(',', ':'))
+
+
 class DatabaseManager:
     """
     Gestionnaire de base de données MySQL pour Connect Four.
@@ -21,6 +103,45 @@ class DatabaseManager:
     - Import depuis fichiers .txt
     """
     
+    # Schéma déjà vérifié pendant ce processus (partagé entre instances)
+    _schema_ready: bool = False
+    
+    # Nombre maximal de lignes par requête groupée (IN / CASE)
+    BATCH_SIZE: int = 1000
+    
+    # Requêtes des chemins chauds, exécutées en instructions préparées
+    _INSERT_SQL = (
+        "INSERT INTO games (coups, mode_jeu, statut, ligne_gagnante) "
+        "VALUES (%s, %s, %s, %s) "
+        "ON DUPLICATE KEY UPDATE id = LAST_INSERT_ID(id)"
+    )
+    _SEL_NEIGHBORS = (
+        "(SELECT id, 0 AS cote FROM games WHERE coups < %s ORDER BY coups DESC LIMIT 1) "
+        "UNION ALL "
+        "(SELECT id, 1 AS cote FROM games WHERE coups > %s ORDER BY coups ASC LIMIT 1)"
+    )
+    _REBUILD_CHAINS_SQL = (
+        "UPDATE games AS g JOIN ("
+        "SELECT id, LAG(id) OVER w AS precedent, LEAD(id) OVER w AS suivant "
+        "FROM games WINDOW w AS (ORDER BY coups)"
+        ") AS t ON g.id = t.id "
+        "SET g.id_antecedent = t.precedent, g.id_suivant = t.suivant"
+    )
+    _UPD_CHAIN = (
+        "UPDATE games SET "
+        "id_antecedent = CASE id WHEN %s THEN %s WHEN %s THEN %s ELSE id_antecedent END, "
+        "id_suivant = CASE id WHEN %s THEN %s WHEN %s THEN %s ELSE id_suivant END "
+        "WHERE id IN (%s, %s, %s)"
+    )
+    _SEL_PAGE = (
+        "SELECT id, coups, coups_symetrique, mode_jeu, statut, "
+        "ligne_gagnante, id_antecedent, id_suivant, created_at "
+        "FROM games WHERE id > %s ORDER BY id ASC LIMIT %s"
+    )
+    
+    # Pools de connexions partagés entre instances, par configuration
+    _pools: Dict[tuple, pooling.MySQLConnectionPool] = {}
+    
     def __init__(self) -> None:
         """Initialise le gestionnaire de base de données."""
         load_dotenv()
@@ -30,68 +151,459 @@ class DatabaseManager:
         self.user = os.getenv('DB_USER', 'root')
         self.password = os.getenv('DB_PASSWORD', '')
         self.database = os.getenv('DB_NAME', 'connect4')
+        self.pool_size = int(os.getenv('DB_POOL', 8))
         
         self.connection: Optional[MySQLConnection] = None
+        # État de la connexion tenu localement : is_connected() du pilote envoie un ping
+        self._connected: bool = False
+        
+        # Curseurs préparés de la connexion courante, un par requête
+        self._statements: Dict[str, object] = {}
+        # Curseurs bufferisés réutilisés de la connexion courante (clé : dictionary)
+        self._cursors: Dict[bool, object] = {}
         
-        print(f"[DB_MANAGER DEBUG] Configuration chargée - Host: {self.host}, DB: {self.database}")
+        logger.debug("Configuration chargée - Host: %s, DB: %s", self.host, self.database)
     
-    def connect(self) -> bool:
-        """Établit la connexion à la base de données MySQL."""
-        try:
-            self.connection = mysql.connector.connect(
+    def _get_pool(self) -> pooling.MySQLConnectionPool:
+        """
+        Retourne le pool de connexions associé à la configuration courante.
+        
+        Le pool est créé au premier appel puis partagé par toutes les
+        instances : les connexions déjà authentifiées sont réutilisées au
+        lieu de refaire une poignée de main MySQL complète à chaque fois.
+        
+        Returns:
+            Pool de connexions MySQL
+        """
+        key = (self.host, self.port, self.user, self.database)
+        pool = DatabaseManager._pools.get(key)
+        
+        if pool is None:
+            pool = pooling.MySQLConnectionPool(
+                pool_name=f"c4_{len(DatabaseManager._pools)}",
+                pool_size=self.pool_size,
+                pool_reset_session=True,
                 host=self.host,
                 port=self.port,
                 user=self.user,
                 password=self.password,
-                database=self.database
+                database=self.database,
+                # rowcount = lignes modifiées (et non trouvées) : 0 signale un doublon
+                # dans INSERT ... ON DUPLICATE KEY UPDATE
+                client_flags=[-ClientFlag.FOUND_ROWS]
             )
+            DatabaseManager._pools[key] = pool
+            logger.debug("Pool de %s connexion(s) créé", self.pool_size)
+        
+        return pool
+    
+    def connect(self) -> bool:
+        """Emprunte une connexion au pool MySQL."""
+        # Une seule connexion empruntée par instance
+        if self.connection is not None:
+            self.disconnect()
+        
+        try:
+            # Le pool vérifie lui-même la connexion avant de la prêter
+            self.connection = self._get_pool().get_connection()
+            self._connected = True
             
-            if self.connection.is_connected():
-                db_info = self.connection.get_server_info()
-                print(f"[DB_MANAGER DEBUG] ✅ Connecté à MySQL Server version {db_info}")
-                return True
+            logger.debug("Connecté à MySQL Server version %s", self.connection.get_server_info())
+            return True
                 
         except Error as e:
-            print(f"[DB_MANAGER ERROR] Erreur de connexion : {e}")
+            logger.error("Erreur de connexion : %s", e)
             return False
     
+    def _prepared(self, sql: str):
+        """
+        Retourne le curseur préparé associé à une requête.
+        
+        Chaque requête garde son propre curseur : elle n'est analysée par le
+        serveur qu'une fois par connexion, puis exécutée via le protocole
+        binaire avec de nouveaux paramètres.
+        
+        Args:
+            sql: Texte de la requête (une des constantes _INSERT_SQL, _SEL_*, _UPD_CHAIN)
+        
+        Returns:
+            Curseur préparé de la connexion courante
+        """
+        cursor = self._statements.get(sql)
+        if cursor is None:
+            cursor = self.connection.cursor(prepared=True)
+            self._statements[sql] = cursor
+        return cursor
+    
+    def _cursor(self, dictionary: bool = False):
+        """
+        Retourne le curseur réutilisable de la connexion courante.
+        
+        Un curseur par type de ligne (tuple ou dictionnaire) est créé au
+        premier appel puis conservé jusqu'à disconnect(). Il est bufferisé :
+        chaque résultat est lu entièrement à l'exécution, le curseur peut
+        donc être réutilisé même si l'appelant ne lit qu'une ligne.
+        
+        Args:
+            dictionary: Si True, lignes sous forme de dictionnaires
+        
+        Returns:
+            Curseur bufferisé de la connexion courante
+        """
+        cursor = self._cursors.get(dictionary)
+        if cursor is None:
+            cursor = self.connection.cursor(buffered=True, dictionary=dictionary)
+            self._cursors[dictionary] = cursor
+        return cursor
+    
     def disconnect(self) -> None:
-        """Ferme la connexion à la base de données."""
-        if self.connection and self.connection.is_connected():
-            self.connection.close()
-            print("[DB_MANAGER DEBUG] 🔌 Connexion MySQL fermée")
+        """Rend la connexion au pool (close() ne ferme pas le socket)."""
+        # Libération des curseurs et instructions préparées avant de rendre la connexion
+        for cursor in (*self._statements.values(), *self._cursors.values()):
+            cursor.close()
+        self._statements.clear()
+        self._cursors.clear()
+        
+        if self.connection is not None:
+            try:
+                self.connection.close()
+                logger.debug("Connexion MySQL rendue au pool")
+            except Error as e:
+                logger.warning("Connexion perdue avant sa restitution au pool : %s", e)
+        self.connection = None
+        self._connected = False
+    
+    def is_connected(self) -> bool:
+        """
+        Indique si une connexion est empruntée et réputée vivante.
+        
+        Lecture d'un simple indicateur, sans aller-retour serveur : il est
+        remis à False par disconnect() ou lorsqu'une requête échoue sur une
+        connexion perdue.
+        
+        Returns:
+            True si la connexion est utilisable
+        """
+        return self._connected
     
-    def create_tables(self) -> None:
-        """Crée la table 'games' si elle n'existe pas."""
-        if not self.connection or not self.connection.is_connected():
-            print("[DB_MANAGER ERROR] Pas de connexion active")
-            return
+    def _mark_if_lost(self, error: Exception) -> None:
+        """
+        Marque la connexion comme perdue si l'erreur l'indique.
+        
+        Args:
+            error: Exception levée par une requête
+        """
+        if getattr(error, 'errno', None) in _LOST_CONNECTION_ERRNOS:
+            logger.warning("Connexion MySQL perdue : %s", error)
+            self._connected = False
+    
+    def create_tables(self) -> bool:
+        """
+        Crée la table 'games' si elle n'existe pas.
+        
+        Le CREATE TABLE n'est émis qu'une seule fois par processus : les
+        appels suivants retournent immédiatement sans aller-retour serveur.
+        'coups_symetrique' est une colonne générée, calculée par le serveur à
+        partir de 'coups'. La colonne générée 'canon' (plus petite séquence
+        entre la partie et son symétrique) porte un index UNIQUE : les doublons et symétriques
+        sont rejetés par InnoDB lui-même. Elle est ajoutée aux tables
+        existantes qui ne les ont pas encore.
+        Les séquences sont en ASCII binaire (1 octet par caractère, tri
+        octet par octet) : colonnes compactes et index complets, sans préfixe.
+        
+        Returns:
+            True si la table existe (créée ou déjà présente), False sinon
+        """
+        if DatabaseManager._schema_ready:
+            return True
+        
+        if not self._connected:
+            logger.error("Pas de connexion active")
+            return False
         
         try:
-            cursor = self.connection.cursor()
+            cursor = self._cursor()
             
-            create_table_query = """
+            create_table_query = f"""
             CREATE TABLE IF NOT EXISTS games (
                 id INT AUTO_INCREMENT PRIMARY KEY,
-                coups VARCHAR(255) NOT NULL UNIQUE,
-                coups_symetrique VARCHAR(255),
+                coups {_SEQUENCE_TYPE} NOT NULL UNIQUE,
+                {_SYMMETRIC_COLUMN},
                 mode_jeu VARCHAR(50),
                 statut VARCHAR(50),
-                ligne_gagnante TEXT,
+                ligne_gagnante JSON,
                 id_antecedent INT,
                 id_suivant INT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                {_CANON_COLUMN},
+                UNIQUE KEY uq_canon (canon)
             )
             """
             
             cursor.execute(create_table_query)
+            
+            # Migration des tables plus anciennes : symétrique calculé côté client,
+            # pas de 'canon', ligne gagnante en TEXT
+            cursor.execute(
+                """
+                SELECT COLUMN_NAME, EXTRA, DATA_TYPE FROM information_schema.COLUMNS
+                WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'games'
+                  AND COLUMN_NAME IN ('coups_symetrique', 'canon', 'ligne_gagnante')
+                """
+            )
+            columns = {name: (extra, data_type) for name, extra, data_type in cursor.fetchall()}
+            extras = {name: extra for name, (extra, _) in columns.items()}
+            if 'GENERATED' not in extras.get('coups_symetrique', '').upper():
+                cursor.execute(f"ALTER TABLE games MODIFY COLUMN {_SYMMETRIC_COLUMN}")
+                logger.debug("Colonne 'coups_symetrique' calculée par le serveur")
+            if 'canon' not in extras:
+                cursor.execute(f"ALTER TABLE games ADD COLUMN {_CANON_COLUMN}, ADD UNIQUE KEY uq_canon (canon)")
+                logger.debug("Colonne 'canon' ajoutée à la table 'games'")
+            if columns.get('ligne_gagnante', ('', 'json'))[1].lower() != 'json':
+                try:
+                    cursor.execute("ALTER TABLE games MODIFY COLUMN ligne_gagnante JSON NULL")
+                    logger.debug("Colonne 'ligne_gagnante' convertie en JSON")
+                except Error as e:
+                    # Anciennes lignes au format non JSON : la colonne reste en TEXT
+                    logger.warning("Conversion de 'ligne_gagnante' en JSON impossible : %s", e)
+            
             self.connection.commit()
-            cursor.close()
             
-            print("[DB_MANAGER DEBUG] ✅ Table 'games' créée ou déjà existante")
+            DatabaseManager._schema_ready = True
+            logger.debug("Table 'games' créée ou déjà existante")
+            return True
             
         except Error as e:
-            print(f"[DB_MANAGER ERROR] Erreur création table : {e}")
+            self._mark_if_lost(e)
+            logger.error("Erreur création table : %s", e)
+            return False
+    
+    def calculate_symmetric_sequence(self, coups: str) -> str:
+        """
+        Calcule la séquence symétrique (miroir vertical) d'une partie.
+        
+        Formule pour une grille à 9 colonnes : 10 - colonne.
+        La colonne 'coups_symetrique' est calculée par le serveur et aucun
+        chemin d'insertion n'appelle cette version client, conservée pour
+        l'affichage et les tests.
+        
+        Args:
+            coups: Séquence de colonnes jouées (ex: "125")
+        
+        Returns:
+            Séquence symétrique (ex: "985")
+        """
+        return coups.translate(_MIRROR)
+    
+    def find_chain_neighbors(self, coups: str) -> tuple[Optional[int], Optional[int]]:
+        """
+        Trouve les voisins d'une séquence dans l'ordre lexicographique.
+        
+        Les deux recherches d'index sont envoyées en une seule requête
+        (UNION ALL) : un seul aller-retour serveur au lieu de deux.
+        
+        Args:
+            coups: Séquence de la partie à positionner
+        
+        Returns:
+            Tuple (id_antecedent, id_suivant), None si absent
+        """
+        cursor = self._prepared(self._SEL_NEIGHBORS)
+        cursor.execute(self._SEL_NEIGHBORS, (coups, coups))
+        
+        # Jusqu'à deux lignes, distinguées par la colonne 'cote' (0 : avant, 1 : après)
+        neighbors: list[Optional[int]] = [None, None]
+        for game_id, cote in cursor.fetchall():
+            neighbors[cote] = game_id
+        
+        return neighbors[0], neighbors[1]
+    
+    def update_chain_links(self, game_id: int, id_antecedent: Optional[int], id_suivant: Optional[int]) -> None:
+        """
+        Insère une partie dans le chaînage entre ses deux voisins.
+        
+        Les trois mises à jour (nouvelle partie, antécédent, suivant) sont
+        faites par un seul UPDATE ... CASE : un aller-retour au lieu de trois.
+        Un voisin absent (None) ne correspond à aucune ligne.
+        Ne fait pas de commit : l'appelant valide la transaction.
+        
+        Args:
+            game_id: ID de la partie insérée
+            id_antecedent: ID de la partie précédente (ou None)
+            id_suivant: ID de la partie suivante (ou None)
+        """
+        self._prepared(self._UPD_CHAIN).execute(self._UPD_CHAIN, (
+            game_id, id_antecedent, id_suivant, game_id,
+            game_id, id_suivant, id_antecedent, game_id,
+            game_id, id_antecedent, id_suivant
+        ))
+    
+    def _insert_and_link(
+        self,
+        coups: str,
+        mode_jeu: str,
+        statut: str,
+        ligne_gagnante: Any
+    ) -> tuple[int, bool]:
+        """
+        Insère une partie et la chaîne à ses voisins, puis valide la transaction.
+        
+        La détection des doublons est faite par le serveur (index UNIQUE sur
+        'coups' et 'canon') dans la même requête que l'insertion : pas de
+        SELECT préalable.
+        
+        Args:
+            coups: Séquence de colonnes jouées
+            mode_jeu: 'PvP', 'PvAI', 'AIvsAI' ou 'Import'
+            statut: 'EN_COURS', 'TERMINEE' ou 'ABANDONNEE'
+            ligne_gagnante: Coordonnées de l'alignement gagnant (ou None)
+        
+        Returns:
+            Tuple (ID, inséré) : l'ID de la partie existante et False pour un
+            doublon (la transaction est alors annulée)
+        
+        Raises:
+            Error: En cas d'échec MySQL (la transaction n'est pas annulée)
+        """
+        # Doublon : la ligne existante est conservée et son ID renvoyé par lastrowid
+        cursor = self._prepared(self._INSERT_SQL)
+        cursor.execute(self._INSERT_SQL, (coups, mode_jeu, statut, _encode_winning_line(ligne_gagnante)))
+        game_id = cursor.lastrowid
+        
+        if cursor.rowcount != 1:
+            self.connection.rollback()
+            return game_id, False
+        
+        # Chaînage avec les voisins lexicographiques
+        id_antecedent, id_suivant = self.find_chain_neighbors(coups)
+        
+        # Aucun voisin (première partie) : les liens valent déjà NULL, pas d'UPDATE
+        if id_antecedent is not None or id_suivant is not None:
+            self.update_chain_links(game_id, id_antecedent, id_suivant)
+        
+        self.connection.commit()
+        return game_id, True
+    
+    def insert_game(
+        self,
+        coups: str,
+        mode_jeu: str = 'PvP',
+        statut: str = 'EN_COURS',
+        ligne_gagnante: Any = None
+    ) -> Optional[int]:
+        """
+        Insère une partie avec détection de symétrie et chaînage.
+        
+        La détection des doublons est faite par le serveur (index UNIQUE sur
+        'coups' et 'canon') dans la même requête que l'insertion.
+        
+        Args:
+            coups: Séquence de colonnes jouées (ex: "4554433")
+            mode_jeu: 'PvP', 'PvAI' ou 'AIvsAI'
+            statut: 'EN_COURS', 'TERMINEE' ou 'ABANDONNEE'
+            ligne_gagnante: Coordonnées de l'alignement gagnant (liste de
+                paires ou chaîne JSON), stockées dans une colonne JSON
+        
+        Returns:
+            ID de la partie insérée, ou None (doublon, symétrique ou erreur)
+        """
+        if not self._connected:
+            logger.error("Pas de connexion active")
+            return None
+        
+        try:
+            game_id, inserted = self._insert_and_link(coups, mode_jeu, statut, ligne_gagnante)
+            
+            if not inserted:
+                logger.debug("Doublon : partie déjà présente (ID %s)", game_id)
+                return None
+            
+            logger.debug("Partie '%s' insérée (ID %s)", coups, game_id)
+            return game_id
+        
+        except Error as e:
+            self._mark_if_lost(e)
+            logger.error("Erreur lors de l'insertion : %s", e)
+            self.connection.rollback()
+            return None
+    
+    def _insert_rows(self, games: List[tuple]) -> int:
+        """
+        Insère un lot de parties sans commit ni reconstruction du chaînage.
+        
+        Les doublons (séquence ou symétrique, en base ou dans le lot) sont
+        écartés par le serveur grâce aux index UNIQUE sur 'coups' et 'canon' :
+        un seul executemany, sans requête de vérification préalable.
+        
+        Args:
+            games: Liste de tuples (coups, mode_jeu, statut, ligne_gagnante)
+        
+        Returns:
+            Nombre de parties réellement insérées
+        
+        Raises:
+            Error: En cas d'échec MySQL (la transaction n'est pas annulée)
+        """
+        rows = [
+            (coups, mode_jeu, statut, _encode_winning_line(ligne_gagnante))
+            for coups, mode_jeu, statut, ligne_gagnante in games
+        ]
+        
+        # Sans CLIENT_FOUND_ROWS, un doublon (ligne inchangée) compte 0 ligne affectée
+        cursor = self._cursor()
+        cursor.executemany(self._INSERT_SQL, rows)
+        inserted = max(cursor.rowcount, 0)
+        
+        logger.debug("%s partie(s) insérée(s) en lot", inserted)
+        return inserted
+    
+    def _insert_batch(self, games: List[tuple]) -> int:
+        """
+        Insère un lot de parties (sans gestion d'erreur).
+        
+        Les lignes sont insérées dans une seule transaction et le chaînage
+        est reconstruit une seule fois à la fin.
+        
+        Args:
+            games: Liste de tuples (coups, mode_jeu, statut, ligne_gagnante)
+        
+        Returns:
+            Nombre de parties réellement insérées
+        
+        Raises:
+            Error: En cas d'échec MySQL (la transaction n'est pas annulée)
+        """
+        inserted = self._insert_rows(games)
+        if inserted:
+            self.connection.commit()
+            self._rebuild_chains()
+        return inserted
+    
+    def insert_games(self, games: List[tuple]) -> int:
+        """
+        Insère plusieurs parties en un nombre constant d'allers-retours.
+        
+        Args:
+            games: Liste de tuples (coups, mode_jeu, statut, ligne_gagnante)
+        
+        Returns:
+            Nombre de parties réellement insérées (0 en cas d'erreur)
+        """
+        if not games:
+            return 0
+        
+        if not self._connected:
+            logger.error("Pas de connexion active")
+            return 0
+        
+        try:
+            return self._insert_batch(games)
+        
+        except Error as e:
+            self._mark_if_lost(e)
+            logger.error("Erreur lors de l'insertion en lot : %s", e)
+            self.connection.rollback()
+            return 0
     
     def import_from_txt_file(self, file_path: str) -> dict:
         """
@@ -117,6 +629,10 @@ class DatabaseManager:
             'error': ''
         }
         
+        if not self._connected:
+            result['error'] = "Pas de connexion active"
+            return result
+        
         try:
             # Vérification que le fichier existe
             if not os.path.exists(file_path):
@@ -130,53 +646,123 @@ class DatabaseManager:
             coups = filename.replace('.txt', '')
             
             # Validation : que des chiffres entre 1 et 9
-            if not coups or not all(c.isdigit() and '1' <= c <= '9' for c in coups):
+            if not _is_valid_sequence(coups):
                 result['error'] = f"Nom de fichier invalide : {filename}. Doit contenir uniquement des chiffres 1-9."
                 return result
             
-            # Calcul du symétrique (miroir : 10 - colonne)
-            coups_symetrique = ''.join(str(10 - int(c)) for c in coups)
-            
-            # Vérification si la partie ou son symétrique existe déjà
-            cursor = self.connection.cursor(dictionary=True)
-            check_query = """
-                SELECT id FROM games 
-                WHERE coups = %s OR coups = %s
-                LIMIT 1
-            """
-            cursor.execute(check_query, (coups, coups_symetrique))
-            existing = cursor.fetchone()
-            cursor.close()
-            
-            if existing:
-                result['error'] = f"Doublon : cette partie existe déjà (ID {existing['id']})"
+            # Insertion directe : les index UNIQUE du serveur écartent les doublons
+            # (séquence ou symétrique) et l'ID existant est renvoyé
+            try:
+                game_id, inserted = self._insert_and_link(coups, 'Import', 'TERMINEE', None)
+            except Error as e:
+                self._mark_if_lost(e)
+                self.connection.rollback()
+                result['error'] = f"Échec de l'insertion de {filename} : {str(e)}"
                 return result
             
-            # Insertion de la nouvelle partie
-            cursor = self.connection.cursor()
-            insert_query = """
-                INSERT INTO games (coups, coups_symetrique, mode_jeu, statut)
-                VALUES (%s, %s, %s, %s)
-            """
-            cursor.execute(insert_query, (coups, coups_symetrique, 'Import', 'TERMINEE'))
-            self.connection.commit()
-            game_id = cursor.lastrowid
-            cursor.close()
-            
-            # Reconstruction des chaînages
-            print(f"[DB_IMPORT] ✅ Importé: {filename} -> ID {game_id}")
-            print(f"[DB_IMPORT] 🔗 Reconstruction des chaînages...")
-            self._rebuild_chains()
+            if not inserted:
+                result['error'] = f"Doublon : cette partie existe déjà (ID {game_id})"
+                return result
             
+            logger.info("Importé: %s -> ID %s", filename, game_id)
             result['success'] = True
             result['game_id'] = game_id
             
         except Exception as e:
+            self._mark_if_lost(e)
             result['error'] = f"Erreur : {str(e)}"
-            print(f"[DB_IMPORT] ❌ Erreur : {e}")
+            logger.error("Erreur lors de l'import de %s : %s", file_path, e)
         
         return result
     
+    @staticmethod
+    def _iter_import_rows(entries: Iterator[os.DirEntry], stats: dict) -> Iterator[tuple]:
+        """
+        Produit au fil de l'eau les lignes à importer depuis un dossier.
+        
+        Les fichiers .txt sont comptés dans stats['total_files'] et les noms
+        invalides sont comptés comme erreurs, sans jamais matérialiser la
+        liste complète des fichiers.
+        
+        Args:
+            entries: Entrées du dossier (résultat de os.scandir)
+            stats: Statistiques d'import mises à jour au passage
+        
+        Yields:
+            Tuples (coups, mode_jeu, statut, ligne_gagnante)
+        """
+        for entry in entries:
+            filename = entry.name
+            if not filename.endswith('.txt'):
+                continue
+            stats['total_files'] += 1
+            
+            # Extraction de la séquence depuis le nom du fichier
+            coups = filename[:-len('.txt')]
+            
+            # Validation basique : que des chiffres entre 1 et 9
+            if not _is_valid_sequence(coups):
+                # Détail conservé dans stats : trace par fichier au seul niveau DEBUG
+                logger.debug("Nom de fichier invalide: %s", filename)
+                stats['errors'] += 1
+                stats['error_details'].append(f"{filename}: format invalide")
+                continue
+            
+            yield (coups, 'Import', 'TERMINEE', None)
+    
+    def _read_batches_in_background(self, entries: Iterator[os.DirEntry], scan: dict) -> Iterator[List[tuple]]:
+        """
+        Parcourt et valide un dossier dans un thread, lot par lot.
+        
+        Le thread de lecture prépare le lot suivant pendant que l'appelant
+        insère le précédent : le parcours du dossier chevauche les échanges
+        avec MySQL, qui restent sur le thread appelant (une connexion
+        mysql-connector n'est pas partagée entre threads). La file est
+        bornée à deux lots pour garder une mémoire constante.
+        
+        Args:
+            entries: Entrées du dossier (résultat de os.scandir, fermé par le thread)
+            scan: Statistiques propres au parcours (total_files, errors,
+                error_details), écrites uniquement par le thread de lecture
+        
+        Yields:
+            Lots d'au plus BATCH_SIZE tuples (coups, mode_jeu, statut, ligne_gagnante)
+        
+        Raises:
+            OSError: Si la lecture du dossier échoue
+        """
+        batches: queue.Queue = queue.Queue(maxsize=2)
+        stop = threading.Event()
+        
+        def read() -> None:
+            try:
+                with entries:
+                    rows = self._iter_import_rows(entries, scan)
+                    while not stop.is_set() and (batch := list(islice(rows, self.BATCH_SIZE))):
+                        batches.put(batch)
+            except OSError as e:
+                batches.put(e)
+            finally:
+                batches.put(None)  # Fin du parcours
+        
+        reader = threading.Thread(target=read, name="import-scan", daemon=True)
+        reader.start()
+        
+        try:
+            while (batch := batches.get()) is not None:
+                if isinstance(batch, OSError):
+                    raise batch
+                yield batch
+        finally:
+            # Arrêt anticipé : le lecteur est débloqué en vidant la file
+            stop.set()
+            while reader.is_alive():
+                try:
+                    batches.get(timeout=0.05)
+                except queue.Empty:
+                    pass
+            reader.join()
+    
     def import_from_txt_files(self, folder_path: str) -> dict:
         """
         Importe des parties depuis des fichiers .txt dans un dossier.
@@ -204,148 +790,273 @@ class DatabaseManager:
             'error_details': []
         }
         
-        # Vérification que le dossier existe
-        if not os.path.exists(folder_path):
-            print(f"[DB_IMPORT] ⚠️  Dossier introuvable: {folder_path}")
+        if not self._connected:
+            logger.error("Pas de connexion active")
+            stats['error_details'].append("Pas de connexion active")
+            stats['errors'] = 1
+            return stats
+        
+        # Ouverture du dossier (scandir lève directement si le dossier n'existe pas)
+        try:
+            entries = os.scandir(folder_path)
+        except OSError:
+            logger.warning("Dossier introuvable: %s", folder_path)
             stats['error_details'].append(f"Dossier introuvable: {folder_path}")
             stats['errors'] = 1
             return stats
         
-        # Listage des fichiers .txt
+        # Transaction explicite pendant tout l'import : un commit par lot, jamais par ligne
+        autocommit = self.connection.autocommit
+        self.connection.autocommit = False
+        
+        # Statistiques du parcours, tenues par le thread de lecture puis fusionnées
+        scan = {'total_files': 0, 'errors': 0, 'error_details': []}
+        batches = self._read_batches_in_background(entries, scan)
+        
         try:
-            txt_files = [f for f in os.listdir(folder_path) if f.endswith('.txt')]
-            stats['total_files'] = len(txt_files)
-            
-            print(f"[DB_IMPORT] 📂 Trouvé {len(txt_files)} fichier(s) .txt dans {folder_path}")
-            
-            for filename in txt_files:
+            # Lecture et validation en arrière-plan, insertion par lots de BATCH_SIZE
+            for batch in batches:
                 try:
-                    # Extraction de la séquence depuis le nom du fichier
-                    coups = filename.replace('.txt', '')
-                    
-                    # Validation basique : que des chiffres entre 1 et 9
-                    if not coups or not all(c.isdigit() and '1' <= c <= '9' for c in coups):
-                        print(f"[DB_IMPORT] ⚠️  Nom de fichier invalide: {filename}")
-                        stats['errors'] += 1
-                        stats['error_details'].append(f"{filename}: format invalide")
-                        continue
-                    
-                    # Calcul du symétrique (miroir : 10 - colonne)
-                    coups_symetrique = ''.join(str(10 - int(c)) for c in coups)
-                    
-                    # Vérification si la partie ou son symétrique existe déjà
-                    cursor = self.connection.cursor(dictionary=True)
-                    check_query = """
-                        SELECT id FROM games 
-                        WHERE coups = %s OR coups = %s
-                        LIMIT 1
-                    """
-                    cursor.execute(check_query, (coups, coups_symetrique))
-                    existing = cursor.fetchone()
-                    cursor.close()
-                    
-                    if existing:
-                        stats['duplicates'] += 1
-                        print(f"[DB_IMPORT] ⏭️  Doublon ignoré: {filename}")
-                        continue
-                    
-                    # Insertion de la nouvelle partie
-                    cursor = self.connection.cursor()
-                    insert_query = """
-                        INSERT INTO games (coups, coups_symetrique, mode_jeu, statut)
-                        VALUES (%s, %s, %s, %s)
-                    """
-                    cursor.execute(insert_query, (coups, coups_symetrique, 'Import', 'TERMINEE'))
+                    imported = self._insert_rows(batch)
                     self.connection.commit()
-                    game_id = cursor.lastrowid
-                    cursor.close()
-                    
-                    stats['imported'] += 1
-                    print(f"[DB_IMPORT] ✅ Importé: {filename} -> ID {game_id}")
                 
-                except Exception as e:
-                    stats['errors'] += 1
-                    error_msg = f"{filename}: {str(e)}"
-                    stats['error_details'].append(error_msg)
-                    print(f"[DB_IMPORT] ❌ Erreur avec {filename}: {e}")
-            
-            # Reconstruction des chaînages après import
-            if stats['imported'] > 0:
-                print(f"\n[DB_IMPORT] 🔗 Reconstruction des chaînages...")
-                self._rebuild_chains()
+                except Error as e:
+                    self._mark_if_lost(e)
+                    self.connection.rollback()
+                    stats['errors'] += len(batch)
+                    stats['error_details'].append(f"Insertion du lot : {str(e)}")
+                    logger.error("Erreur lors de l'insertion du lot : %s", e)
+                    continue
+                
+                stats['imported'] += imported
+                stats['duplicates'] += len(batch) - imported
             
-            print(f"\n[DB_IMPORT] 📊 RÉSUMÉ:")
-            print(f"  - Fichiers traités: {stats['total_files']}")
-            print(f"  - Importés: {stats['imported']}")
-            print(f"  - Doublons: {stats['duplicates']}")
-            print(f"  - Erreurs: {stats['errors']}")
+            # Chaînage reconstruit une seule fois pour tout le dossier
+            if stats['imported']:
+                self._rebuild_chains()
             
         except Exception as e:
-            print(f"[DB_IMPORT] ❌ Erreur globale : {e}")
+            self._mark_if_lost(e)
+            logger.error("Erreur globale : %s", e)
+            self.connection.rollback()
             stats['errors'] += 1
             stats['error_details'].append(f"Erreur globale: {str(e)}")
         
+        finally:
+            # Thread de lecture arrêté avant de lire ses statistiques
+            batches.close()
+            stats['total_files'] = scan['total_files']
+            stats['errors'] += scan['errors']
+            stats['error_details'] = scan['error_details'] + stats['error_details']
+            self.connection.autocommit = autocommit
+        
+        logger.info(
+            "Import terminé : %d fichier(s), %d importé(s), %d doublon(s), %d erreur(s)",
+            stats['total_files'], stats['imported'], stats['duplicates'], stats['errors']
+        )
         return stats
     
-    def _rebuild_chains(self) -> None:
-        """Reconstruit les chaînages (id_antecedent et id_suivant) pour toute la table."""
-        try:
-            cursor = self.connection.cursor(dictionary=True)
+    def _rebuild_chains_batched(self) -> None:
+        """
+        Reconstruit les chaînages par tranches (serveurs sans fonctions de fenêtre).
+        
+        Les identifiants triés par 'coups' sont lus une fois, puis les liens
+        sont écrits par un UPDATE ... CASE par tranche de BATCH_SIZE parties.
+        Ne fait pas de commit : l'appelant valide la transaction.
+        """
+        cursor = self._cursor()
+        cursor.execute("SELECT id FROM games ORDER BY coups ASC")
+        ids = [game_id for (game_id,) in cursor.fetchall()]
+        last = len(ids) - 1
+        
+        for start in range(0, len(ids), self.BATCH_SIZE):
+            stop = min(start + self.BATCH_SIZE, len(ids))
+            chunk = ids[start:stop]
             
-            # Récupération de TOUTES les parties triées par 'coups'
-            cursor.execute("SELECT id, coups FROM games ORDER BY coups ASC")
-            all_games = cursor.fetchall()
+            previous_params: list = []
+            following_params: list = []
+            for i in range(start, stop):
+                previous_params += (ids[i], ids[i - 1] if i > 0 else None)
+                following_params += (ids[i], ids[i + 1] if i < last else None)
             
-            print(f"[DB_REBUILD] 🔄 Reconstruction des chaînages pour {len(all_games)} parties...")
+            when_clauses = ' '.join(['WHEN %s THEN %s'] * len(chunk))
+            placeholders = ', '.join(['%s'] * len(chunk))
+            update_query = f"""
+                UPDATE games
+                SET id_antecedent = CASE id {when_clauses} END,
+                    id_suivant = CASE id {when_clauses} END
+                WHERE id IN ({placeholders})
+            """
+            cursor.execute(update_query, previous_params + following_params + chunk)
+    
+    def _rebuild_chains(self) -> None:
+        """
+        Reconstruit les chaînages (id_antecedent et id_suivant) pour toute la table.
+        
+        Une seule requête ensembliste (LAG/LEAD, MySQL 8+) calcule et écrit
+        tous les liens côté serveur ; repli sur des UPDATE par tranches si
+        les fonctions de fenêtre ne sont pas disponibles.
+        """
+        try:
+            cursor = self._cursor()
             
-            # Mise à jour des liens
-            for i, game in enumerate(all_games):
-                id_antecedent = all_games[i - 1]['id'] if i > 0 else None
-                id_suivant = all_games[i + 1]['id'] if i < len(all_games) - 1 else None
-                
-                update_query = """
-                    UPDATE games
-                    SET id_antecedent = %s, id_suivant = %s
-                    WHERE id = %s
-                """
-                cursor.execute(update_query, (id_antecedent, id_suivant, game['id']))
+            try:
+                cursor.execute(self._REBUILD_CHAINS_SQL)
+            except Error as e:
+                logger.debug("Fonctions de fenêtre indisponibles (%s), reconstruction par tranches", e)
+                self._rebuild_chains_batched()
             
             self.connection.commit()
-            cursor.close()
             
-            print(f"[DB_REBUILD] ✅ Chaînages reconstruits avec succès")
+            logger.debug("Chaînages reconstruits avec succès")
             
         except Exception as e:
-            print(f"[DB_REBUILD] ❌ Erreur : {e}")
+            self._mark_if_lost(e)
+            logger.error("Erreur lors de la reconstruction des chaînages : %s", e)
             if self.connection:
                 self.connection.rollback()
     
-    def get_all_games(self) -> list:
+    @staticmethod
+    def _all_games_query(order_by: str) -> str:
         """
-        Récupère toutes les parties de la base de données triées par coups.
+        Construit la requête de lecture de toutes les parties.
+        
+        Args:
+            order_by: Colonne de tri ('coups', 'id' ou 'created_at')
+        
+        Returns:
+            Requête SELECT triée
+        """
+        # Liste blanche : le nom de colonne ne peut pas être paramétré
+        if order_by not in ('coups', 'id', 'created_at'):
+            order_by = 'coups'
+        
+        return f"""
+            SELECT id, coups, coups_symetrique, mode_jeu, statut, 
+                   ligne_gagnante, id_antecedent, id_suivant, created_at
+            FROM games
+            ORDER BY {order_by} ASC
+        """
+    
+    def iter_games(self, order_by: str = 'coups') -> Iterator[dict]:
+        """
+        Parcourt les parties une par une via un curseur non bufferisé.
+        
+        Les lignes sont lues au fil de l'itération : la mémoire reste
+        constante et la première partie est disponible immédiatement.
+        La connexion est occupée tant que l'itération n'est pas terminée
+        (ou le générateur fermé).
+        
+        Args:
+            order_by: Colonne de tri ('coups', 'id' ou 'created_at')
+        
+        Yields:
+            Dictionnaire contenant les informations d'une partie
+        """
+        cursor = self.connection.cursor(buffered=False, dictionary=True)
+        try:
+            cursor.execute(self._all_games_query(order_by))
+            while (row := cursor.fetchone()) is not None:
+                yield row
+        finally:
+            # Itération interrompue : lignes restantes à vider avant de fermer
+            if self.connection.unread_result:
+                self.connection.consume_results()
+            cursor.close()
+    
+    def iter_all_games(self, batch_size: int = BATCH_SIZE) -> Iterator[GameRow]:
+        """
+        Parcourt toutes les parties par pages successives, dans l'ordre des IDs.
+        
+        Pagination par clé (WHERE id > dernier ID ... LIMIT) : chaque page est
+        une recherche sur la clé primaire, quelle que soit sa position, et la
+        connexion reste libre entre deux pages, contrairement à iter_games.
+        Les lignes sont des tuples nommés plutôt que des dictionnaires.
+        
+        Args:
+            batch_size: Nombre de parties lues par requête
+        
+        Yields:
+            Partie sous forme de GameRow
+        """
+        cursor = self._prepared(self._SEL_PAGE)
+        last_id = 0
+        
+        while True:
+            cursor.execute(self._SEL_PAGE, (last_id, batch_size))
+            # Page lue entièrement avant de rendre la main : l'appelant peut
+            # lancer d'autres requêtes pendant l'itération
+            rows = cursor.fetchall()
+            
+            for row in rows:
+                yield GameRow._make(row)
+            
+            if len(rows) < batch_size:
+                return
+            last_id = rows[-1][0]
+    
+    def get_all_games(self, order_by: str = 'coups') -> list:
+        """
+        Récupère toutes les parties de la base de données.
+        
+        Pour de gros volumes, préférer iter_games (lecture en flux) ou
+        iter_all_games (pages successives).
+        
+        Args:
+            order_by: Colonne de tri ('coups', 'id' ou 'created_at')
         
         Returns:
             Liste de dictionnaires contenant les informations des parties
         """
         try:
-            cursor = self.connection.cursor(dictionary=True)
-            query = """
-                SELECT id, coups, coups_symetrique, mode_jeu, statut, 
-                       ligne_gagnante, id_antecedent, id_suivant, created_at
-                FROM games
-                ORDER BY coups ASC
-            """
-            cursor.execute(query)
+            cursor = self._cursor(dictionary=True)
+            cursor.execute(self._all_games_query(order_by))
             games = cursor.fetchall()
-            cursor.close()
             
-            print(f"[DB_MANAGER DEBUG] 📋 {len(games)} parties récupérées")
+            logger.debug("%s parties récupérées", len(games))
             return games
             
         except Exception as e:
-            print(f"[DB_MANAGER ERROR] Erreur lors de la récupération : {e}")
+            self._mark_if_lost(e)
+            logger.error("Erreur lors de la récupération : %s", e)
             return []
     
+    def get_all_games_columnar(self) -> Dict[str, np.ndarray]:
+        """
+        Récupère toutes les parties au format colonnes (un tableau par champ).
+        
+        Destiné aux statistiques (ouvertures, taux de victoire par colonne...) :
+        un parcours ne lit que les colonnes dont il a besoin. L'affichage
+        continue d'utiliser get_all_games (une liste de dictionnaires).
+        
+        Returns:
+            Dictionnaire {'id': int64, 'coups', 'mode_jeu', 'statut': object},
+            tableaux vides en cas d'erreur
+        """
+        columns = ('id', 'coups', 'mode_jeu', 'statut')
+        
+        try:
+            cursor = self._cursor()
+            cursor.execute("SELECT id, coups, mode_jeu, statut FROM games ORDER BY id ASC")
+            rows = cursor.fetchall()
+        
+        except Exception as e:
+            self._mark_if_lost(e)
+            logger.error("Erreur lors de la récupération en colonnes : %s", e)
+            rows = []
+        
+        # Tableaux préalloués, remplis colonne par colonne
+        n = len(rows)
+        data: Dict[str, np.ndarray] = {'id': np.empty(n, dtype=np.int64)}
+        for name in columns[1:]:
+            data[name] = np.empty(n, dtype=object)
+        
+        if n:
+            for name, values in zip(columns, zip(*rows)):
+                data[name][:] = values
+        
+        return data
+    
     def get_game_by_id(self, game_id: int) -> Optional[dict]:
         """
         Récupère une partie spécifique par son ID.
@@ -356,12 +1067,12 @@ class DatabaseManager:
         Returns:
             Dictionnaire contenant les informations de la partie, ou None si non trouvée
         """
-        if not self.connection or not self.connection.is_connected():
-            print("[DB_MANAGER ERROR] Pas de connexion active")
+        if not self._connected:
+            logger.error("Pas de connexion active")
             return None
         
         try:
-            cursor = self.connection.cursor(dictionary=True)
+            cursor = self._cursor(dictionary=True)
             query = """
                 SELECT id, coups, coups_symetrique, mode_jeu, statut, 
                        ligne_gagnante, id_antecedent, id_suivant, created_at
@@ -370,19 +1081,81 @@ class DatabaseManager:
             """
             cursor.execute(query, (game_id,))
             game = cursor.fetchone()
-            cursor.close()
             
             if game:
-                print(f"[DB_MANAGER DEBUG] 📥 Partie {game_id} récupérée")
+                logger.debug("Partie %s récupérée", game_id)
             else:
-                print(f"[DB_MANAGER DEBUG] ⚠️ Partie {game_id} non trouvée")
+                logger.debug("Partie %s non trouvée", game_id)
             
             return game
             
         except Exception as e:
-            print(f"[DB_MANAGER ERROR] Erreur lors de la récupération de la partie {game_id} : {e}")
+            self._mark_if_lost(e)
+            logger.error("Erreur lors de la récupération de la partie %s : %s", game_id, e)
             return None
     
+    def get_game_count(self) -> int:
+        """
+        Compte le nombre de parties enregistrées.
+        
+        Returns:
+            Nombre de parties (0 en cas d'erreur)
+        """
+        try:
+            cursor = self._cursor()
+            cursor.execute("SELECT COUNT(*) FROM games")
+            (count,) = cursor.fetchone()
+            return count
+        
+        except Exception as e:
+            self._mark_if_lost(e)
+            logger.error("Erreur lors du comptage : %s", e)
+            return 0
+    
+    def delete_game(self, game_id: int) -> bool:
+        """
+        Supprime une partie et relie directement ses deux voisins.
+        
+        Args:
+            game_id: ID de la partie à supprimer
+        
+        Returns:
+            True si la partie a été supprimée, False sinon
+        """
+        game = self.get_game_by_id(game_id)
+        if game is None:
+            return False
+        
+        try:
+            cursor = self._cursor()
+            
+            id_antecedent = game['id_antecedent']
+            id_suivant = game['id_suivant']
+            
+            if id_antecedent is not None:
+                cursor.execute(
+                    "UPDATE games SET id_suivant = %s WHERE id = %s",
+                    (id_suivant, id_antecedent)
+                )
+            
+            if id_suivant is not None:
+                cursor.execute(
+                    "UPDATE games SET id_antecedent = %s WHERE id = %s",
+                    (id_antecedent, id_suivant)
+                )
+            
+            cursor.execute("DELETE FROM games WHERE id = %s", (game_id,))
+            self.connection.commit()
+            
+            logger.debug("Partie %s supprimée", game_id)
+            return True
+        
+        except Error as e:
+            self._mark_if_lost(e)
+            logger.error("Erreur lors de la suppression : %s", e)
+            self.connection.rollback()
+            return False
+    
     def truncate_games(self) -> bool:
         """
         Vide complètement la table games et réinitialise les auto-increment.
@@ -392,23 +1165,23 @@ class DatabaseManager:
         Returns:
             True si la réinitialisation a réussi, False sinon
         """
-        if not self.connection or not self.connection.is_connected():
-            print("[DB_MANAGER ERROR] Pas de connexion active")
+        if not self._connected:
+            logger.error("Pas de connexion active")
             return False
         
         try:
-            cursor = self.connection.cursor()
+            cursor = self._cursor()
             
             # Vider la table
             cursor.execute("TRUNCATE TABLE games")
             self.connection.commit()
-            cursor.close()
             
-            print("[DB_MANAGER DEBUG] 🗑️ Table 'games' vidée et IDs réinitialisés")
+            logger.debug("Table 'games' vidée et IDs réinitialisés")
             return True
             
         except Error as e:
-            print(f"[DB_MANAGER ERROR] Erreur lors de la réinitialisation : {e}")
+            self._mark_if_lost(e)
+            logger.error("Erreur lors de la réinitialisation : %s", e)
             if self.connection:
                 self.connection.rollback()
             return False
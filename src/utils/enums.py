@@ -3,21 +3,26 @@
 Fournit un typage fort pour les différentes phases de la partie.
 """
 
-from enum import Enum, auto
+from enum import Enum, IntEnum, auto
 
 
-class GameState(Enum):
+class GameState(IntEnum):
     """
     Représente l'état actuel de la partie.
     
+    IntEnum avec IN_PROGRESS = 0 : les comparaisons sont des comparaisons
+    d'entiers, et « state » est faux si et seulement si la partie est en
+    cours (test de véracité dans la boucle de jeu). La sérialisation passe
+    par le nom du membre et reste inchangée.
+    
     Attributes:
-        NOT_STARTED: La partie n'a pas encore commencé
         IN_PROGRESS: La partie est en cours
         FINISHED: La partie est terminée (victoire ou égalité)
+        NOT_STARTED: La partie n'a pas encore commencé
     """
-    NOT_STARTED = auto()
-    IN_PROGRESS = auto()
-    FINISHED = auto()
+    IN_PROGRESS = 0
+    FINISHED = 1
+    NOT_STARTED = 2
 
 
 class AppState(Enum):
@@ -44,15 +49,53 @@ class AppState(Enum):
     QUIT = auto()
 
 
-class GameMode(Enum):
+class GameMode(IntEnum):
     """
     Représente le mode de jeu sélectionné.
     
+    IntEnum : les comparaisons dans la boucle de jeu sont des comparaisons
+    d'entiers (ou d'identité) plutôt que des comparaisons de chaînes.
+    Le libellé historique ("PvP", "PvAI", "AIvsAI") reste disponible via
+    l'attribut label (affichage et colonne mode_jeu de la base).
+    
     Attributes:
         PVP: Joueur vs Joueur (2 humains)
         PVAI: Joueur vs IA (1 humain vs 1 IA)
         AI_VS_AI: IA vs IA (mode démo, 0 humain)
     """
-    PVP = "PvP"
-    PVAI = "PvAI"
-    AI_VS_AI = "AIvsAI"
+    PVP = 0
+    PVAI = 1
+    AI_VS_AI = 2
+    
+    @property
+    def label(self) -> str:
+        """
+        Libellé textuel du mode, tel qu'enregistré en base.
+        
+        Returns:
+            "PvP", "PvAI" ou "AIvsAI"
+        """
+        return _GAME_MODE_LABELS[self]
+
+
+_GAME_MODE_LABELS: dict[GameMode, str] = {
+    GameMode.PVP: "PvP",
+    GameMode.PVAI: "PvAI",
+    GameMode.AI_VS_AI: "AIvsAI",
+}
+
+
+class MoveResult(IntEnum):
+    """
+    Résultat d'un coup joué par Board.try_drop_and_check().
+    
+    Attributes:
+        INVALID: Coup refusé (colonne hors limites ou pleine), rien n'est joué
+        CONTINUE: Coup joué, la partie continue
+        WIN: Coup joué, il complète un alignement gagnant
+        DRAW: Coup joué, le plateau est plein sans vainqueur
+    """
+    INVALID = 0
+    CONTINUE = 1
+    WIN = 2
+    DRAW = 3
@@ -0,0 +1,77 @@
+"""
+Module d'entrée/sortie fichiers partagé par les gestionnaires de persistance.
+Fournit la sérialisation JSON et l'écriture atomique utilisées pour la
+configuration, les paramètres et les sauvegardes de partie.
+"""
+
+import json
+import os
+from typing import Any, Union
+
+# orjson (extension native) est optionnel : repli sur le module json standard
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps_json(data: Any, pretty: bool = False) -> bytes:
+    """
+    Sérialise un objet en JSON encodé UTF-8.
+    
+    Args:
+        data: Données à sérialiser
+        pretty: Si True, JSON indenté sur 2 espaces ; sinon JSON compact
+    
+    Returns:
+        Document JSON sous forme d'octets
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    
+    if pretty:
+        text = json.dumps(data, indent=2, ensure_ascii=False)
+    else:
+        text = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+    return text.encode('utf-8')
+
+
+# Désérialisation : json.loads accepte aussi directement des octets UTF-8
+loads_json = orjson.loads if orjson is not None else json.loads
+
+
+def atomic_write_bytes(path: Union[str, os.PathLike], payload: bytes, durable: bool = False) -> None:
+    """
+    Écrit un fichier de manière atomique.
+    
+    Le contenu est écrit dans un fichier temporaire (path + ".tmp") puis
+    substitué au fichier final (os.replace) : un arrêt en cours d'écriture
+    laisse l'ancien fichier intact. En cas d'échec, le fichier temporaire
+    est supprimé.
+    
+    Args:
+        path: Chemin du fichier final
+        payload: Contenu complet du fichier
+        durable: Si True, force l'écriture sur disque (fsync) avant la
+            substitution ; plus lent, réservé aux sauvegardes critiques
+    
+    Raises:
+        OSError: Si l'écriture ou la substitution échoue
+    """
+    path = os.fspath(path)
+    tmp_path = path + ".tmp"
+    
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        # Pas de fichier temporaire orphelin (l'original reste intact)
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
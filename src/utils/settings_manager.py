@@ -5,29 +5,43 @@ Gère le chargement, la sauvegarde et la modification des paramètres utilisateu
 (couleurs, volume, etc.) via un fichier JSON.
 """
 
+import atexit
 import json
-import os
-from typing import Any, Dict
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
+
+from .file_io import atomic_write_bytes, dumps_json, loads_json
+
+
+# Paramètres par défaut
+_DEFAULT_SETTINGS: Dict[str, Dict[str, Any]] = {
+    "colors": {
+        "player1": (255, 0, 0),      # Rouge
+        "player2": (255, 255, 0),    # Jaune
+        "grid": (0, 0, 255),         # Bleu
+        "background": (0, 0, 0),     # Noir
+        "empty_slot": (255, 255, 255)  # Blanc
+    },
+    "volume": {
+        "master": 50,
+        "sfx": 50,
+        "music": 50
+    }
+}
+
+# Valeurs par défaut sérialisées une fois : chaque copie modifiable est un
+# simple décodage JSON, sans copie profonde récursive
+_DEFAULTS_JSON = json.dumps(_DEFAULT_SETTINGS)
 
 
 class SettingsManager:
     """Gère les paramètres de l'application."""
     
-    # Paramètres par défaut
-    DEFAULT_SETTINGS = {
-        "colors": {
-            "player1": (255, 0, 0),      # Rouge
-            "player2": (255, 255, 0),    # Jaune
-            "grid": (0, 0, 255),         # Bleu
-            "background": (0, 0, 0),     # Noir
-            "empty_slot": (255, 255, 255)  # Blanc
-        },
-        "volume": {
-            "master": 50,
-            "sfx": 50,
-            "music": 50
-        }
-    }
+    # Paramètres par défaut, en lecture seule (modèle jamais modifié)
+    DEFAULT_SETTINGS: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+        category: MappingProxyType(values) for category, values in _DEFAULT_SETTINGS.items()
+    })
     
     def __init__(self, settings_file: str = "settings.json"):
         """
@@ -38,6 +52,13 @@ class SettingsManager:
         """
         self.settings_file = settings_file
         self.settings = self.load_settings()
+        
+        # Couleurs déjà validées, par clé (vidé à chaque modification des couleurs)
+        self._colors: Dict[str, tuple[int, int, int]] = {}
+        
+        # Modifications en mémoire pas encore écrites sur disque (voir flush)
+        self._dirty: bool = False
+        atexit.register(self.flush)
     
     def load_settings(self) -> Dict[str, Any]:
         """
@@ -46,35 +67,55 @@ class SettingsManager:
         Returns:
             Dictionnaire des paramètres (ou paramètres par défaut si le fichier n'existe pas)
         """
-        if os.path.exists(self.settings_file):
-            try:
-                with open(self.settings_file, 'r', encoding='utf-8') as f:
-                    loaded_settings = json.load(f)
-                    # Fusion avec les paramètres par défaut pour les clés manquantes
-                    return self._merge_settings(self.DEFAULT_SETTINGS.copy(), loaded_settings)
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"[SETTINGS] Erreur lors du chargement : {e}")
-                return self.DEFAULT_SETTINGS.copy()
-        else:
+        # Lecture en un seul appel (ouverture, lecture, fermeture), sans test
+        # d'existence préalable : l'absence du fichier lève FileNotFoundError
+        try:
+            loaded_settings = loads_json(Path(self.settings_file).read_bytes())
+        except FileNotFoundError:
             print("[SETTINGS] Fichier de paramètres introuvable, utilisation des valeurs par défaut")
-            return self.DEFAULT_SETTINGS.copy()
+            return self._fresh_defaults()
+        except (json.JSONDecodeError, OSError) as e:
+            print(f"[SETTINGS] Erreur lors du chargement : {e}")
+            return self._fresh_defaults()
+        
+        # Fusion avec les paramètres par défaut pour les clés manquantes
+        return self._merge_settings(self._fresh_defaults(), loaded_settings)
     
     def save_settings(self) -> bool:
         """
         Sauvegarde les paramètres dans le fichier JSON.
         
+        Le contenu est sérialisé en une fois puis écrit via atomic_write_bytes.
+        
         Returns:
             True si la sauvegarde a réussi, False sinon
         """
+        payload = dumps_json(self.settings, pretty=True)
+        
         try:
-            with open(self.settings_file, 'w', encoding='utf-8') as f:
-                json.dump(self.settings, f, indent=4, ensure_ascii=False)
+            atomic_write_bytes(self.settings_file, payload)
+            
+            self._dirty = False
             print(f"[SETTINGS] Paramètres sauvegardés dans {self.settings_file}")
             return True
-        except IOError as e:
+        except OSError as e:
             print(f"[SETTINGS] Erreur lors de la sauvegarde : {e}")
             return False
     
+    def flush(self) -> bool:
+        """
+        Écrit les paramètres sur disque s'ils ont été modifiés.
+        
+        Appelée à la fermeture de l'écran des paramètres et à la sortie du
+        programme : glisser le curseur de volume ne touche pas le disque.
+        
+        Returns:
+            True si rien n'était à écrire ou si la sauvegarde a réussi
+        """
+        if not self._dirty:
+            return True
+        return self.save_settings()
+    
     def get_setting(self, category: str, key: str) -> Any:
         """
         Récupère une valeur de paramètre.
@@ -90,7 +131,7 @@ class SettingsManager:
     
     def update_setting(self, category: str, key: str, value: Any) -> None:
         """
-        Met à jour un paramètre et sauvegarde immédiatement.
+        Met à jour un paramètre en mémoire (écrit sur disque par flush).
         
         Args:
             category: Catégorie du paramètre
@@ -101,43 +142,77 @@ class SettingsManager:
             self.settings[category] = {}
         
         self.settings[category][key] = value
-        self.save_settings()
+        if category == "colors":
+            self._colors.clear()
+        self._dirty = True
         print(f"[SETTINGS] Paramètre mis à jour : {category}.{key} = {value}")
     
     def reset_to_defaults(self) -> None:
         """Réinitialise tous les paramètres aux valeurs par défaut."""
-        self.settings = self.DEFAULT_SETTINGS.copy()
-        self.save_settings()
+        self.settings = self._fresh_defaults()
+        self._colors.clear()
+        self._dirty = True
         print("[SETTINGS] Paramètres réinitialisés aux valeurs par défaut")
     
+    @staticmethod
+    def _fresh_defaults() -> Dict[str, Any]:
+        """
+        Retourne une copie modifiable des paramètres par défaut.
+        
+        Returns:
+            Nouveau dictionnaire (couleurs sous forme de listes RGB)
+        """
+        return json.loads(_DEFAULTS_JSON)
+    
     def _merge_settings(self, default: Dict, loaded: Dict) -> Dict:
         """
         Fusionne les paramètres chargés avec les paramètres par défaut.
         
+        Les paramètres n'ont que deux niveaux (catégorie, clé) : chaque
+        catégorie est fusionnée par un seul dépliage de dictionnaires.
+        
         Args:
-            default: Paramètres par défaut
+            default: Paramètres par défaut (copie modifiée sur place)
             loaded: Paramètres chargés depuis le fichier
         
         Returns:
             Dictionnaire fusionné
         """
-        for key, value in loaded.items():
-            if isinstance(value, dict) and key in default:
-                default[key] = self._merge_settings(default[key], value)
+        for category, values in loaded.items():
+            if isinstance(values, dict) and isinstance(default.get(category), dict):
+                default[category] = {**default[category], **values}
             else:
-                default[key] = value
+                default[category] = values
         return default
     
     def get_color(self, color_key: str) -> tuple[int, int, int]:
         """
         Récupère une couleur.
         
+        Appelée à chaque image par la vue : la couleur validée est mémorisée
+        par clé, les appels suivants se réduisent à une lecture de dictionnaire.
+        
         Args:
             color_key: Clé de la couleur (player1, player2, grid, etc.)
         
         Returns:
             Tuple RGB de la couleur
         """
+        color = self._colors.get(color_key)
+        if color is None:
+            color = self._colors[color_key] = self._resolve_color(color_key)
+        return color
+    
+    def _resolve_color(self, color_key: str) -> tuple[int, int, int]:
+        """
+        Lit et valide une couleur dans les paramètres.
+        
+        Args:
+            color_key: Clé de la couleur
+        
+        Returns:
+            Tuple RGB de la couleur, ou la valeur par défaut si invalide
+        """
         color = self.get_setting("colors", color_key)
         if color and isinstance(color, (list, tuple)) and len(color) == 3:
             return tuple(color)
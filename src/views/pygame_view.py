@@ -3,6 +3,7 @@ Module de la vue Pygame pour l'interface graphique du jeu.
 Gère l'affichage du plateau, des pions et des animations.
 """
 
+from functools import lru_cache
 from typing import Optional
 import pygame
 import numpy as np
@@ -17,6 +18,68 @@ from ..utils.constants import (
 from ..utils.settings_manager import SettingsManager
 
 
+# Couleurs converties une seule fois en pygame.Color au chargement du module :
+# les appels de dessin reçoivent directement la couleur SDL, sans convertir
+# un tuple RGB à chaque pion ou bouton dessiné
+BLUE, BLACK, RED, YELLOW, WHITE, GREEN = (
+    pygame.Color(color) for color in (BLUE, BLACK, RED, YELLOW, WHITE, GREEN)
+)
+
+
+@lru_cache(maxsize=None)
+def _font(size: int, bold: bool = False) -> pygame.font.Font:
+    """
+    Retourne la police monospace d'une taille donnée.
+    
+    Construire une police (recherche et lecture du fichier de police) est
+    coûteux : chaque combinaison taille / graisse n'est créée qu'une fois.
+    
+    Args:
+        size: Taille de la police
+        bold: Police grasse
+    
+    Returns:
+        Police Pygame partagée
+    """
+    return pygame.font.SysFont("monospace", size, bold=bold)
+
+
+@lru_cache(maxsize=256)
+def _render_cached(text: str, size: int, color: tuple[int, ...], bold: bool) -> pygame.Surface:
+    """
+    Rend un texte fixe une seule fois (voir _render).
+    
+    Args:
+        text: Texte à afficher
+        size: Taille de la police
+        color: Couleur RGB(A) sous forme de tuple (clé de cache)
+        bold: Police grasse
+    
+    Returns:
+        Surface du texte, partagée : ne pas la modifier
+    """
+    return _font(size, bold).render(text, True, color)
+
+
+def _render(text: str, size: int, color, bold: bool = False) -> pygame.Surface:
+    """
+    Retourne la surface pré-rendue d'un libellé statique (titres, boutons).
+    
+    Les glyphes ne sont rastérisés qu'au premier affichage : les images
+    suivantes du menu ou de l'écran de fin se réduisent à des blits.
+    
+    Args:
+        text: Texte à afficher
+        size: Taille de la police monospace
+        color: Couleur (tuple RGB ou pygame.Color)
+        bold: Police grasse
+    
+    Returns:
+        Surface du texte, partagée : ne pas la modifier
+    """
+    return _render_cached(text, size, tuple(color), bold)
+
+
 class PygameView:
     """
     Vue graphique utilisant Pygame pour afficher le jeu Puissance 4.
@@ -68,8 +131,8 @@ class PygameView:
         pygame.display.set_caption("Puissance 4 - Connect Four")
         
         # Police pour les textes (tailles adaptées)
-        self.font: pygame.font.Font = pygame.font.SysFont("monospace", 55)
-        self.small_font: pygame.font.Font = pygame.font.SysFont("monospace", 30)
+        self.font: pygame.font.Font = _font(55)
+        self.small_font: pygame.font.Font = _font(30)
         
         # Rectangles des boutons pour détection des clics
         self.undo_button_rect: Optional[pygame.Rect] = None
@@ -77,6 +140,15 @@ class PygameView:
         self.load_button_rect: Optional[pygame.Rect] = None
         self.restart_button_rect: Optional[pygame.Rect] = None
         self.menu_button_rect: Optional[pygame.Rect] = None
+        
+        # Bande verticale [haut, bas[ commune à tous les boutons du header
+        self.button_band: Optional[tuple[int, int]] = None
+        
+        # Disques pré-rendus par (couleur RGB, rayon), pour dessiner le plateau par blits
+        self._discs: dict[tuple[tuple[int, ...], int], pygame.Surface] = {}
+        
+        # Centres des cases et positions des disques, par dimensions de plateau
+        self._centers: dict[tuple[int, int], tuple[tuple[int, ...], tuple[int, ...], list[tuple[int, int]]]] = {}
     
     def _update_layout(self) -> None:
         """
@@ -112,6 +184,70 @@ class PygameView:
         self.grid_start_x = (game_width - grid_width) // 2
         self.grid_start_y = (self.height - grid_height) // 2
     
+    def _cell_centers(self, rows: int, cols: int) -> tuple[tuple[int, ...], tuple[int, ...], list[tuple[int, int]]]:
+        """
+        Retourne les coordonnées précalculées des cases d'un plateau rows x cols.
+        
+        Calculées une fois par dimensions (la géométrie de la grille est fixée
+        par _update_layout), puis simplement indexées à chaque image.
+        Convention : row=0 est en BAS du plateau, sous le header.
+        
+        Args:
+            rows: Nombre de lignes du plateau
+            cols: Nombre de colonnes du plateau
+        
+        Returns:
+            Tuple (X du centre par colonne, Y du centre par ligne, coin
+            supérieur gauche du disque de chaque case, dans l'ordre de
+            grid.ravel())
+        """
+        centers = self._centers.get((rows, cols))
+        if centers is None:
+            half = self.cell_size / 2
+            bottom = self.grid_start_y + self.cell_size + rows * self.cell_size  # Sous le header
+            
+            xs = (self.grid_start_x + np.arange(cols) * self.cell_size + half).astype(np.int32)
+            ys = (bottom - (np.arange(rows) * self.cell_size + half)).astype(np.int32)
+            
+            # Entiers Python : pygame les lit sans conversion de scalaires NumPy
+            center_x, center_y = tuple(xs.tolist()), tuple(ys.tolist())
+            radius = self.cell_radius
+            positions = [(x - radius, y - radius) for y in center_y for x in center_x]
+            
+            centers = self._centers[(rows, cols)] = (center_x, center_y, positions)
+        return centers
+    
+    def _disc(self, color: tuple[int, ...], radius: int) -> pygame.Surface:
+        """
+        Retourne un disque plein pré-rendu (fond transparent par couleur clé).
+        
+        Le disque est dessiné une fois par couleur et rayon, puis réutilisé :
+        le plateau entier est ensuite copié à l'écran en un seul appel blits.
+        Un disque de côté 2 * radius + 1 copié en (x - radius, y - radius)
+        donne exactement les pixels de pygame.draw.circle centré en (x, y).
+        
+        Args:
+            color: Couleur RGB du disque
+            radius: Rayon en pixels
+        
+        Returns:
+            Surface contenant le disque
+        """
+        key = (tuple(color), radius)
+        disc = self._discs.get(key)
+        if disc is None:
+            # Transparence par couleur clé (copie RLE, bien plus rapide qu'un
+            # canal alpha) : une couleur voisine, jamais égale à celle du disque
+            red, green, blue = key[0][:3]
+            colorkey = (red ^ 1, green, blue)
+            
+            disc = pygame.Surface((2 * radius + 1, 2 * radius + 1)).convert()
+            disc.fill(colorkey)
+            pygame.draw.circle(disc, color, (radius, radius), radius)
+            disc.set_colorkey(colorkey, pygame.RLEACCEL)
+            self._discs[key] = disc
+        return disc
+    
     def draw_board(self, board: Board, mouse_x: Optional[int] = None, current_player: int = PLAYER1, ai_scores: Optional[dict] = None, ai_player: int = 2, winning_line: Optional[list[tuple[int, int]]] = None) -> None:
         """
         Dessine le plateau de jeu avec tous les pions actuels en 3 couches distinctes.
@@ -150,11 +286,15 @@ class PygameView:
         # COUCHE 1 : PLATEAU + PIONS (DÉCALÉ)
         # ========================================
         
-        # Récupération des couleurs personnalisées
-        grid_color = self.settings_manager.get_color("grid")
-        player1_color = self.settings_manager.get_color("player1")
-        player2_color = self.settings_manager.get_color("player2")
-        empty_color = self.settings_manager.get_color("empty_slot")
+        # Récupération des couleurs personnalisées (converties une fois par
+        # image, réutilisées pour toutes les cases)
+        grid_rgb = self.settings_manager.get_color("grid")
+        player1_rgb = self.settings_manager.get_color("player1")
+        player2_rgb = self.settings_manager.get_color("player2")
+        empty_rgb = self.settings_manager.get_color("empty_slot")
+        grid_color = pygame.Color(grid_rgb)
+        player1_color = pygame.Color(player1_rgb)
+        player2_color = pygame.Color(player2_rgb)
         
         # Grand rectangle BLEU pour le plateau (décalé vers le bas)
         pygame.draw.rect(
@@ -163,32 +303,24 @@ class PygameView:
             (self.grid_start_x, self.grid_start_y + header_height, self.cell_size * COLS, self.cell_size * ROWS)
         )
         
-        # Dessin des cercles (pions et cases vides)
-        for row in range(board.rows):
-            for col in range(board.cols):
-                # Position centrale X (pas d'inversion)
-                center_x = int(self.grid_start_x + col * self.cell_size + self.cell_size / 2)
-                
-                # Position centrale Y - INVERSION OBLIGATOIRE + DÉCALAGE HEADER
-                # row=0 -> Y grand (bas du plateau, juste au-dessus du bord inférieur)
-                # row=rows-1 -> Y petit (haut du plateau, juste en dessous du header)
-                center_y = int(self.grid_start_y + header_height + (board.rows * self.cell_size) - (row * self.cell_size + self.cell_size / 2))
-                
-                # Récupération de la valeur de la case
-                cell_value = board.grid[row][col]
-                
-                # Choix de la couleur selon la valeur
-                if cell_value == EMPTY:
-                    color = empty_color  # Case vide
-                elif cell_value == PLAYER1:
-                    color = player1_color  # Joueur 1
-                elif cell_value == PLAYER2:
-                    color = player2_color  # Joueur 2
-                else:
-                    color = empty_color  # Sécurité
-                
-                # Dessin du cercle
-                pygame.draw.circle(self.screen, color, (center_x, center_y), self.cell_radius)
+        # Disque à dessiner selon la valeur de la case (valeur inconnue : case vide)
+        radius = self.cell_radius
+        empty_disc = self._disc(empty_rgb, radius)
+        discs = {
+            EMPTY: empty_disc,
+            PLAYER1: self._disc(player1_rgb, radius),
+            PLAYER2: self._disc(player2_rgb, radius),
+        }
+        
+        # Disque de chaque case, associé à sa position précalculée
+        center_x, _, positions = self._cell_centers(board.rows, board.cols)
+        sequence = list(zip(
+            [discs.get(value, empty_disc) for value in board.grid.ravel().tolist()],
+            positions
+        ))
+        
+        # Dessin de tous les pions et cases vides en un seul appel
+        self.screen.blits(sequence, doreturn=False)
         
         # ========================================
         # COUCHE 2 : PION FANTÔME (OPTIONNEL)
@@ -205,11 +337,10 @@ class PygameView:
                 
                 # Position centrale du pion fantôme au-dessus de la colonne
                 # Placé juste au-dessus du plateau (dans la partie basse du header)
-                center_x = int(self.grid_start_x + col * self.cell_size + self.cell_size / 2)
                 center_y = int(self.grid_start_y + header_height / 2)
                 
                 # Dessin du pion fantôme dans le header
-                pygame.draw.circle(self.screen, ghost_color, (center_x, center_y), self.cell_radius)
+                pygame.draw.circle(self.screen, ghost_color, (center_x[col], center_y), self.cell_radius)
         
         # ========================================
         # COUCHE 3 : UI FIXE (TOUJOURS EN DERNIER)
@@ -260,7 +391,7 @@ class PygameView:
         button_y = 10  # 10px de marge en haut (dans le header)
         
         # Police pour les boutons
-        button_font = pygame.font.SysFont("monospace", 16)
+        button_font = _font(16)
         
         # ========================================
         # BOUTON 1 : ANNULER
@@ -346,6 +477,9 @@ class PygameView:
         self.screen.blit(text_surface, text_rect)
         
         self.menu_button_rect = menu_rect
+        
+        # Les 5 boutons partagent la même bande verticale
+        self.button_band = (button_y, button_y + button_height)
     
     def draw_game_info(self, game_id: int, move_count: int) -> None:
         """
@@ -360,7 +494,7 @@ class PygameView:
             move_count: Nombre de coups joués dans la partie
         """
         # Police pour les infos
-        info_font = pygame.font.SysFont("monospace", 18, bold=True)
+        info_font = _font(18, bold=True)
         
         # Texte pour l'ID de partie
         id_text = f"Partie #{game_id}"
@@ -406,12 +540,25 @@ class PygameView:
         color = RED if player == PLAYER1 else YELLOW
         
         # Position centrale (relative à la grille)
-        center_x = int(self.grid_start_x + col * self.cell_size + self.cell_size / 2)
+        center_x = self._cell_centers(ROWS, COLS)[0][col]
         center_y = int(self.grid_start_y + header_height / 2)
         
         # Dessin du pion fantôme
         pygame.draw.circle(self.screen, color, (center_x, center_y), self.cell_radius)
     
+    def clear_ghost(self) -> None:
+        """
+        Efface le pion fantôme sans redessiner tout le plateau.
+        
+        Seule la bande de prévisualisation (au-dessus de la grille) est repeinte
+        puis rafraîchie à l'écran (dirty rect), le reste de l'image est conservé.
+        """
+        header_height = self.cell_size
+        ghost_rect = pygame.Rect(self.grid_start_x, self.grid_start_y, self.cell_size * COLS, header_height)
+        
+        pygame.draw.rect(self.screen, BLACK, ghost_rect)
+        pygame.display.update(ghost_rect)
+    
     def draw_winning_positions(self, winning_positions: list[tuple[int, int]], board: Optional[Board] = None) -> None:
         """
         Met en surbrillance les pions formant l'alignement gagnant.
@@ -427,18 +574,16 @@ class PygameView:
         
         # Si board n'est pas fourni, utiliser ROWS par défaut (compatibilité arrière)
         rows = board.rows if board else ROWS
-        header_height = self.cell_size
+        cols = board.cols if board else COLS
+        center_x, center_y, _ = self._cell_centers(rows, cols)
         
         for row, col in winning_positions:
-            # Calcul des coordonnées avec correction de l'axe Y + décalage header (relatif à la grille)
-            center_x = int(self.grid_start_x + col * self.cell_size + self.cell_size / 2)
-            center_y = int(self.grid_start_y + header_height + (rows * self.cell_size) - (row * self.cell_size + self.cell_size / 2))
-            
             # Dessin d'un cercle vert épais autour du pion
+            # (axe Y corrigé et décalage header inclus dans les tables)
             pygame.draw.circle(
                 self.screen,
                 GREEN,
-                (center_x, center_y),
+                (center_x[col], center_y[row]),
                 self.cell_radius + 5,
                 8  # Épaisseur du contour
             )
@@ -470,7 +615,7 @@ class PygameView:
             color = WHITE
         
         # Rendu du texte
-        label = self.font.render(text, True, color)
+        label = _render(text, 55, color)
         
         # Centrage du texte dans la zone de header
         grid_center_x = self.grid_start_x + (self.cell_size * COLS) // 2
@@ -485,7 +630,7 @@ class PygameView:
         Peut être utilisé pour aider les nouveaux joueurs.
         """
         instruction_text = "Cliquez pour jouer"
-        label = self.small_font.render(instruction_text, True, WHITE)
+        label = _render(instruction_text, 30, WHITE)
         
         # Position en bas de l'écran
         self.screen.blit(label, (10, self.height - 35))
@@ -520,16 +665,12 @@ class PygameView:
             sub_text = "Plateau rempli"
             text_color = WHITE
         
-        # Police pour le message principal (très grande)
-        big_font = pygame.font.SysFont("monospace", 60, bold=True)
-        medium_font = pygame.font.SysFont("monospace", 45, bold=True)
-        
-        # Rendu du texte principal
-        main_label = big_font.render(main_text, True, text_color)
+        # Rendu du texte principal (police très grande)
+        main_label = _render(main_text, 60, text_color, bold=True)
         main_rect = main_label.get_rect(center=(self.width // 2, self.height // 2 - 40))
         
         # Rendu du sous-texte
-        sub_label = medium_font.render(sub_text, True, text_color)
+        sub_label = _render(sub_text, 45, text_color, bold=True)
         sub_rect = sub_label.get_rect(center=(self.width // 2, self.height // 2 + 30))
         
         # Affichage des textes
@@ -544,16 +685,13 @@ class PygameView:
         - ECHAP pour retourner au menu
         - R pour recommencer une partie
         """
-        # Police pour les instructions
-        instruction_font = pygame.font.SysFont("monospace", 28, bold=True)
-        
         # Textes d'instructions
         esc_text = "ECHAP : Retour au menu"
         restart_text = "R : Recommencer"
         
         # Rendu des textes
-        esc_label = instruction_font.render(esc_text, True, WHITE)
-        restart_label = instruction_font.render(restart_text, True, WHITE)
+        esc_label = _render(esc_text, 28, WHITE, bold=True)
+        restart_label = _render(restart_text, 28, WHITE, bold=True)
         
         # Positionnement en bas de l'écran (centré)
         y_position = self.height // 2 + 100
@@ -607,21 +745,18 @@ class PygameView:
         self.screen.fill((20, 40, 80))
         
         # === TITRE ===
-        title_font = pygame.font.SysFont("monospace", 70, bold=True)
         title_text = "PUISSANCE 4"
-        title_label = title_font.render(title_text, True, YELLOW)
+        title_label = _render(title_text, 70, YELLOW, bold=True)
         title_rect = title_label.get_rect(center=(self.width // 2, 100))
         self.screen.blit(title_label, title_rect)
         
         # Sous-titre
-        subtitle_font = pygame.font.SysFont("monospace", 30)
         subtitle_text = "Connect Four"
-        subtitle_label = subtitle_font.render(subtitle_text, True, WHITE)
+        subtitle_label = _render(subtitle_text, 30, WHITE)
         subtitle_rect = subtitle_label.get_rect(center=(self.width // 2, 160))
         self.screen.blit(subtitle_label, subtitle_rect)
         
         # === BOUTONS ===
-        button_font = pygame.font.SysFont("monospace", 30, bold=True)
         button_width = 500
         button_height = 55
         button_spacing = 20
@@ -640,7 +775,7 @@ class PygameView:
         pygame.draw.rect(self.screen, WHITE, pvp_rect, 3)  # Contour blanc
         
         pvp_text = "Joueur vs Joueur"
-        pvp_label = button_font.render(pvp_text, True, WHITE)
+        pvp_label = _render(pvp_text, 30, WHITE, bold=True)
         pvp_text_rect = pvp_label.get_rect(center=pvp_rect.center)
         self.screen.blit(pvp_label, pvp_text_rect)
         
@@ -655,7 +790,7 @@ class PygameView:
         pygame.draw.rect(self.screen, WHITE, pvai_rect, 3)  # Contour blanc
         
         pvai_text = "Joueur vs IA"
-        pvai_label = button_font.render(pvai_text, True, BLACK)
+        pvai_label = _render(pvai_text, 30, BLACK, bold=True)
         pvai_text_rect = pvai_label.get_rect(center=pvai_rect.center)
         self.screen.blit(pvai_label, pvai_text_rect)
         
@@ -670,7 +805,7 @@ class PygameView:
         pygame.draw.rect(self.screen, WHITE, demo_rect, 3)  # Contour blanc
         
         demo_text = "MODE DEMO (IA vs IA)"
-        demo_label = button_font.render(demo_text, True, WHITE)
+        demo_label = _render(demo_text, 30, WHITE, bold=True)
         demo_text_rect = demo_label.get_rect(center=demo_rect.center)
         self.screen.blit(demo_label, demo_text_rect)
         
@@ -685,7 +820,7 @@ class PygameView:
         pygame.draw.rect(self.screen, WHITE, history_rect, 3)  # Contour blanc
         
         history_text = "Historique"
-        history_label = button_font.render(history_text, True, WHITE)
+        history_label = _render(history_text, 30, WHITE, bold=True)
         history_text_rect = history_label.get_rect(center=history_rect.center)
         self.screen.blit(history_label, history_text_rect)
         
@@ -700,7 +835,7 @@ class PygameView:
         pygame.draw.rect(self.screen, WHITE, settings_rect, 3)  # Contour blanc
         
         settings_text = "PARAMETRES"
-        settings_label = button_font.render(settings_text, True, WHITE)
+        settings_label = _render(settings_text, 30, WHITE, bold=True)
         settings_text_rect = settings_label.get_rect(center=settings_rect.center)
         self.screen.blit(settings_label, settings_text_rect)
         
@@ -715,7 +850,7 @@ class PygameView:
         pygame.draw.rect(self.screen, WHITE, import_rect, 3)  # Contour blanc
         
         import_text = "IMPORTER (.txt)"
-        import_label = button_font.render(import_text, True, WHITE)
+        import_label = _render(import_text, 30, WHITE, bold=True)
         import_text_rect = import_label.get_rect(center=import_rect.center)
         self.screen.blit(import_label, import_text_rect)
         
@@ -730,14 +865,13 @@ class PygameView:
         pygame.draw.rect(self.screen, WHITE, quit_rect, 3)  # Contour blanc
         
         quit_text = "QUITTER"
-        quit_label = button_font.render(quit_text, True, WHITE)
+        quit_label = _render(quit_text, 30, WHITE, bold=True)
         quit_text_rect = quit_label.get_rect(center=quit_rect.center)
         self.screen.blit(quit_label, quit_text_rect)
         
         # Instructions en bas
-        info_font = pygame.font.SysFont("monospace", 20)
         info_text = "Cliquez sur un mode pour commencer"
-        info_label = info_font.render(info_text, True, WHITE)
+        info_label = _render(info_text, 20, WHITE)
         info_rect = info_label.get_rect(center=(self.width // 2, self.height - 50))
         self.screen.blit(info_label, info_rect)
         
@@ -764,7 +898,7 @@ class PygameView:
         bg_color = colors.get(msg_type, colors["info"])
         
         # Police pour le message
-        msg_font = pygame.font.SysFont("monospace", 32, bold=True)
+        msg_font = _font(32, bold=True)
         
         # Découpage du message en lignes si trop long (word wrapping simple)
         max_width = self.width - 200
@@ -834,16 +968,16 @@ class PygameView:
         self.screen.fill((20, 40, 80))
         
         # Titre
-        title_font = pygame.font.SysFont("monospace", 60, bold=True)
+        title_font = _font(60, bold=True)
         title_text = "PARAMETRES"
         title_label = title_font.render(title_text, True, YELLOW)
         title_rect = title_label.get_rect(center=(self.width // 2, 80))
         self.screen.blit(title_label, title_rect)
         
         # Polices
-        label_font = pygame.font.SysFont("monospace", 35)
-        value_font = pygame.font.SysFont("monospace", 40, bold=True)
-        button_font = pygame.font.SysFont("monospace", 45, bold=True)
+        label_font = _font(35)
+        value_font = _font(40, bold=True)
+        button_font = _font(45, bold=True)
         
         # Dimensions des boutons
         button_size = 50
@@ -977,16 +1111,17 @@ class PygameView:
             return
         
         # Police pour les scores (plus grande pour être visible dans le header)
-        score_font = pygame.font.SysFont("monospace", 20, bold=True)
+        score_font = _font(20, bold=True)
         
         # Couleur selon le joueur IA
         score_color = RED if ai_player == 1 else YELLOW
         
         # Affichage au-dessus de chaque colonne dans le header
         header_height = self.cell_size
+        column_x = self._cell_centers(board.rows, board.cols)[0]
         for col, score in column_scores.items():
             # Position X centrée sur la colonne (relatif à la grille)
-            center_x = int(self.grid_start_x + col * self.cell_size + self.cell_size / 2)
+            center_x = column_x[col]
             # Position Y dans le header (légèrement en dessous du haut)
             y_pos = self.grid_start_y + header_height - 35
             
@@ -1012,8 +1147,8 @@ class PygameView:
             Dictionnaire contenant les Rects des boutons 'minus' et 'plus'
         """
         # Police
-        font = pygame.font.SysFont("monospace", 20, bold=True)
-        button_font = pygame.font.SysFont("monospace", 24, bold=True)
+        font = _font(20, bold=True)
+        button_font = _font(24, bold=True)
         
         # Position dans le coin supérieur droit
         right_margin = 20
@@ -1084,7 +1219,7 @@ class PygameView:
         pygame.draw.rect(self.screen, WHITE, (bar_x, bar_y, bar_width, bar_height), 2)
         
         # Message
-        message_font = pygame.font.SysFont("monospace", 22, bold=True)
+        message_font = _font(22, bold=True)
         text_surface = message_font.render(message, True, YELLOW)
         text_rect = text_surface.get_rect(center=(self.width // 2, bar_y - 20))
         self.screen.blit(text_surface, text_rect)
@@ -1115,7 +1250,7 @@ class PygameView:
         # Couleur dorée avec effet de brillance
         GOLD = (255, 215, 0)
         WHITE = (255, 255, 255)
-        header_height = self.cell_size
+        center_xs, center_ys, _ = self._cell_centers(board.rows, board.cols)
         
         for coord in winning_line:
             # Vérification du format
@@ -1130,11 +1265,10 @@ class PygameView:
                 print(f"[VIEW WARNING] Coordonnée hors limites ignorée: ({row}, {col}) pour grille {board.rows}x{board.cols}")
                 continue
             
-            # Calcul de la position centrale du pion (relatif à la grille centrée)
+            # Position centrale du pion (relatif à la grille centrée)
             # col = position X (horizontal)
             # row = position Y (vertical, avec inversion car row=0 est en BAS)
-            center_x = int(self.grid_start_x + col * self.cell_size + self.cell_size / 2)
-            center_y = int(self.grid_start_y + header_height + (board.rows * self.cell_size) - (row * self.cell_size + self.cell_size / 2))
+            center_x, center_y = center_xs[col], center_ys[row]
             
             # Dessin de plusieurs cercles concentriques pour effet de brillance
             pygame.draw.circle(self.screen, GOLD, (center_x, center_y), self.cell_radius + 8, 6)
@@ -1166,8 +1300,8 @@ class PygameView:
         pygame.draw.rect(self.screen, (255, 215, 0), box_rect, 5)
         
         # Texte principal
-        title_font = pygame.font.SysFont("monospace", 48, bold=True)
-        subtitle_font = pygame.font.SysFont("monospace", 24)
+        title_font = _font(48, bold=True)
+        subtitle_font = _font(24)
         
         if winner is not None:
             # Message de victoire
@@ -1193,7 +1327,7 @@ class PygameView:
         self.screen.blit(subtitle_surface, subtitle_rect)
         
         # Instructions
-        instructions_font = pygame.font.SysFont("monospace", 20)
+        instructions_font = _font(20)
         
         restart_text = "[R] Recommencer"
         menu_text = "[ECHAP] Menu Principal"
@@ -1230,19 +1364,19 @@ class PygameView:
         self.screen.fill(BLACK)
         
         # Titre
-        title_font = pygame.font.SysFont("monospace", 42, bold=True)
+        title_font = _font(42, bold=True)
         title_text = title_font.render("HISTORIQUE DES PARTIES", True, (255, 215, 0))
         title_rect = title_text.get_rect(center=(self.width // 2, 40))
         self.screen.blit(title_text, title_rect)
         
         # Sous-titre avec nombre de parties
-        subtitle_font = pygame.font.SysFont("monospace", 20)
+        subtitle_font = _font(20)
         subtitle_text = subtitle_font.render(f"{len(games)} partie(s) enregistrée(s)", True, WHITE)
         subtitle_rect = subtitle_text.get_rect(center=(self.width // 2, 85))
         self.screen.blit(subtitle_text, subtitle_rect)
         
         # Liste des parties (scrollable)
-        game_font = pygame.font.SysFont("monospace", 16)
+        game_font = _font(16)
         start_y = 130
         item_height = 60
         rects = {}
@@ -1274,7 +1408,7 @@ class PygameView:
         pygame.draw.rect(self.screen, (100, 50, 50), back_button)
         pygame.draw.rect(self.screen, WHITE, back_button, 3)
         
-        back_text = pygame.font.SysFont("monospace", 22, bold=True).render("RETOUR", True, WHITE)
+        back_text = _font(22, bold=True).render("RETOUR", True, WHITE)
         back_text_rect = back_text.get_rect(center=back_button.center)
         self.screen.blit(back_text, back_text_rect)
         
@@ -1319,14 +1453,14 @@ class PygameView:
         info_size = max(10, min(14, panel_width // 20))
         
         # Titre du panneau
-        title_font = pygame.font.SysFont("monospace", title_size, bold=True)
+        title_font = _font(title_size, bold=True)
         mode_text = "MODE MIROIR" if show_symmetric else "MODE REPLAY"
         title_surface = title_font.render(mode_text, True, (255, 215, 0))
         title_rect = title_surface.get_rect(centerx=panel_x + panel_width // 2, y=panel_y + 10)
         self.screen.blit(title_surface, title_rect)
         
         # Informations de la partie
-        info_font = pygame.font.SysFont("monospace", info_size)
+        info_font = _font(info_size)
         info_y = panel_y + 50
         
         infos = [
@@ -1425,15 +1559,15 @@ class PygameView:
         self.screen.fill((20, 40, 80))
         
         # Titre
-        title_font = pygame.font.SysFont("monospace", 60, bold=True)
+        title_font = _font(60, bold=True)
         title_text = "PARAMETRES"
         title_label = title_font.render(title_text, True, YELLOW)
         title_rect = title_label.get_rect(center=(self.width // 2, 80))
         self.screen.blit(title_label, title_rect)
         
         # Police pour les labels
-        label_font = pygame.font.SysFont("monospace", 24, bold=True)
-        value_font = pygame.font.SysFont("monospace", 22)
+        label_font = _font(24, bold=True)
+        value_font = _font(22)
         
         # Dictionnaire pour stocker les rectangles et sliders
         rects = {}
@@ -1442,7 +1576,7 @@ class PygameView:
         section_spacing = 80
         
         # === SECTION COULEURS ===
-        section_title_font = pygame.font.SysFont("monospace", 30, bold=True)
+        section_title_font = _font(30, bold=True)
         colors_title = section_title_font.render("COULEURS", True, WHITE)
         self.screen.blit(colors_title, (80, start_y))
         
@@ -1575,7 +1709,7 @@ class PygameView:
         pygame.draw.rect(self.screen, YELLOW, dialog_rect, 4)
         
         # Message
-        msg_font = pygame.font.SysFont("monospace", 26, bold=True)
+        msg_font = _font(26, bold=True)
         
         # Word wrapping simple
         words = message.split()
@@ -1614,7 +1748,7 @@ class PygameView:
         pygame.draw.rect(self.screen, (50, 180, 50), yes_button)
         pygame.draw.rect(self.screen, WHITE, yes_button, 3)
         
-        yes_font = pygame.font.SysFont("monospace", 32, bold=True)
+        yes_font = _font(32, bold=True)
         yes_text = yes_font.render("OUI", True, WHITE)
         yes_text_rect = yes_text.get_rect(center=yes_button.center)
         self.screen.blit(yes_text, yes_text_rect)
@@ -1646,7 +1780,7 @@ class PygameView:
         x, y = position
         rects = {}
         
-        slider_font = pygame.font.SysFont("monospace", 20)
+        slider_font = _font(20)
         slider_width = 200
         slider_height = 20
         spacing = 40
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Script de test pour le modèle Board.
+Teste le cycle de base : placement, détection de victoire, annulation.
+"""
+
+import sys
+import os
+
+# Ajout du chemin parent pour les imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.models import Board, Game
+from src.utils.constants import EMPTY, PLAYER1, PLAYER2
+from src.utils.enums import GameState
+
+
+def print_separator(title: str = ""):
+    """Affiche un séparateur visuel."""
+    print("\n" + "=" * 70)
+    if title:
+        print(f"  {title}")
+        print("=" * 70)
+
+
+def _report(checks: list[tuple[str, bool]]) -> bool:
+    """
+    Affiche le résultat de chaque vérification.
+    
+    Args:
+        checks: Liste de tuples (libellé, succès)
+    
+    Returns:
+        True si toutes les vérifications ont réussi
+    """
+    for label, ok in checks:
+        print(f"{'✅' if ok else '❌'} {label}")
+    
+    return all(ok for _, ok in checks)
+
+
+def test_drop_piece():
+    """Test du placement avec gravité."""
+    print_separator("TEST 1 : PLACEMENT D'UN PION")
+    
+    board = Board()
+    row = board.get_next_open_row(3)
+    board.drop_piece(row, 3, PLAYER1)
+    
+    checks = [
+        ("Premier pion en bas (row=0)", row == 0),
+        ("Case occupée par PLAYER1", board.grid[0, 3] == PLAYER1),
+        ("Prochaine ligne libre = 1", board.get_next_open_row(3) == 1),
+        ("Historique d'un coup", board.hist_len == 1),
+    ]
+    
+    assert _report(checks)
+
+
+def test_check_win():
+    """Test de la détection de victoire (horizontale et verticale)."""
+    print_separator("TEST 2 : DÉTECTION DE VICTOIRE")
+    
+    horizontal = Board()
+    for col in range(4):
+        horizontal.drop_piece(0, col, PLAYER1)
+    
+    vertical = Board()
+    for row in range(3):
+        vertical.drop_piece(row, 6, PLAYER2)
+    
+    checks = [
+        ("Victoire horizontale PLAYER1", horizontal.check_win(PLAYER1)),
+        ("Pas de victoire PLAYER2", not horizontal.check_win(PLAYER2)),
+        ("Ligne gagnante", horizontal.get_winning_positions(PLAYER1) == [(0, 0), (0, 1), (0, 2), (0, 3)]),
+        ("3 pions verticaux : pas de victoire", not vertical.check_win(PLAYER2)),
+    ]
+    
+    vertical.drop_piece(3, 6, PLAYER2)
+    checks.append(("4 pions verticaux : victoire", vertical.check_win(PLAYER2)))
+    checks.append(("Victoire via le dernier pion", vertical.check_win_last(3, 6, PLAYER2)))
+    
+    assert _report(checks)
+
+
+def test_undo():
+    """Test de l'annulation d'un coup."""
+    print_separator("TEST 3 : ANNULATION")
+    
+    board = Board()
+    for col in range(4):
+        board.drop_piece(0, col, PLAYER1)
+    
+    undone = board.undo_last_move()
+    
+    checks = [
+        ("undo_last_move réussi", undone),
+        ("Case remise à EMPTY", board.grid[0, 3] == EMPTY),
+        ("Plus de victoire après annulation", not board.check_win(PLAYER1)),
+        ("Colonne rejouable en row=0", board.get_next_open_row(3) == 0),
+        ("Annulation des 3 coups restants", board.undo_last_moves(10) == 3),
+        ("Historique vide : undo impossible", not board.undo_last_move()),
+    ]
+    
+    assert _report(checks)
+
+
+def test_undo_redo():
+    """Test du rétablissement des coups annulés (Game.redo)."""
+    print_separator("TEST 4 : UNDO / REDO")
+    
+    game = Game()
+    for col in (3, 3, 4):
+        game.play_turn(col)
+    coups, player = game.get_coups(), game.current_player
+    
+    game.undo(2)
+    undone_player = game.current_player
+    redone = game.redo(2)
+    
+    checks = [
+        ("Après undo(2) : joueur du plus ancien coup annulé", undone_player == PLAYER2),
+        ("redo(2) rejoue 2 coups", redone == 2),
+        ("Coups restaurés", game.get_coups() == coups),
+        ("Joueur courant restauré", game.current_player == player),
+        ("Pile de rétablissement vide", not game.can_redo()),
+    ]
+    
+    # Un nouveau coup vide la pile de rétablissement
+    game.undo()
+    checks.append(("Coup annulé rétablissable", game.can_redo()))
+    game.play_turn(0)
+    checks.append(("play_turn vide la pile de rétablissement", not game.can_redo() and game.redo() == 0))
+    
+    # Annulation puis rétablissement d'un coup gagnant
+    winning = Game()
+    for col in (0, 6, 1, 6, 2, 6, 3):
+        winning.play_turn(col)
+    winning.undo()
+    checks.append(("Undo du coup gagnant : partie en cours", winning.state is GameState.IN_PROGRESS and winning.winner is None))
+    winning.redo()
+    checks.append(("Redo du coup gagnant : victoire restaurée", winning.state is GameState.FINISHED and winning.winner == PLAYER1))
+    checks.append(("Ligne gagnante restaurée", winning.winning_line == [(0, 0), (0, 1), (0, 2), (0, 3)]))
+    
+    assert _report(checks)
+
+
+def test_zobrist_hash():
+    """Test du hash Zobrist (transpositions et undo/redo)."""
+    print_separator("TEST 5 : HASH ZOBRIST")
+    
+    first = Game()
+    for col in (0, 1, 2, 3):
+        first.play_turn(col)
+    
+    second = Game()
+    for col in (2, 3, 0, 1):
+        second.play_turn(col)
+    
+    different = Game()
+    for col in (1, 0, 2, 3):
+        different.play_turn(col)
+    
+    before = first.get_hash()
+    first.undo(3)
+    undone = first.get_hash()
+    first.redo(3)
+    
+    checks = [
+        ("Ordres [0,1,2,3] et [2,3,0,1] : même hash", first.get_hash() == second.get_hash()),
+        ("Position différente : hash différent", different.get_hash() != before),
+        ("undo(3) modifie le hash", undone != before),
+        ("undo(3) puis redo(3) : hash restauré", first.get_hash() == before),
+    ]
+    
+    first.undo(4)
+    checks.append(("Plateau vide après undo(4) : hash nul", first.get_hash() == 0))
+    
+    assert _report(checks)
+
+
+def play_moves(moves: list[int]) -> Game:
+    """Crée une partie et joue la séquence de colonnes donnée."""
+    game = Game()
+    for col in moves:
+        game.play_turn(col)
+    return game
+
+
+def test_best_move():
+    """Test de la recherche Alpha-Beta sur bitboards (Game.best_move)."""
+    print_separator("TEST 6 : RECHERCHE SUR BITBOARDS")
+    
+    # Rouge : pions en 0, 1, 2 sur la ligne du bas, à lui de jouer
+    immediate_win = play_moves([0, 0, 1, 1, 2, 2])
+    # Jaune doit bloquer trois pions rouges empilés en colonne 6
+    vertical_threat = play_moves([6, 0, 6, 1, 6])
+    # Rouge en 2 et 3 : jouer 1 ou 4 crée une double menace imparable
+    double_threat = play_moves([2, 2, 3, 3])
+    finished = play_moves([0, 6, 1, 6, 2, 6, 3])
+    
+    threat_col = double_threat.best_move()
+    forced = threat_col in (1, 4)
+    if forced:
+        double_threat.play_turn(threat_col)
+        # Quelle que soit la réponse de Jaune, Rouge gagne au coup suivant
+        for reply in double_threat.get_valid_moves():
+            double_threat.play_turn(reply)
+            reply_col = double_threat.best_move()
+            double_threat.play_turn(reply_col)
+            forced = forced and double_threat.winner == PLAYER1
+            double_threat.undo(2)
+    
+    checks = [
+        ("Victoire immédiate jouée (colonne 3)", immediate_win.best_move() == 3),
+        ("Menace verticale bloquée (colonne 6)", vertical_threat.best_move() == 6),
+        ("Double menace jouée et gagnante", forced),
+        ("Plateau vide : colonne centrale", Game().best_move() == 3),
+        ("Partie terminée : None", finished.best_move() is None),
+    ]
+    
+    assert _report(checks)
+
+
+def test_make_unmake():
+    """Test de la paire make_move / unmake_move (simulation en place)."""
+    print_separator("TEST 7 : MAKE / UNMAKE")
+    
+    game = play_moves([3, 3, 4])
+    grid = game.board.grid.copy()
+    hist_len = game.board.hist_len
+    player = game.current_player
+    zobrist = game.get_hash()
+    
+    moves = [game.make_move(col) for col in (3, 0, 6)]
+    simulated = game.get_hash() != zobrist and game.board.hist_len == hist_len + 3
+    for row, col in reversed(moves):
+        game.unmake_move(row, col)
+    
+    checks = [
+        ("Coups simulés posés", simulated),
+        ("Grille inchangée", (game.board.grid == grid).all()),
+        ("hist_len inchangé", game.board.hist_len == hist_len),
+        ("Joueur courant inchangé", game.current_player == player),
+        ("Hash inchangé", game.get_hash() == zobrist),
+    ]
+    
+    assert _report(checks)
+
+
+def run_all_tests():
+    """Exécute tous les tests."""
+    print("\n" + "█" * 70)
+    print("  SUITE DE TESTS - PLATEAU DE JEU")
+    print("█" * 70)
+    
+    tests = [
+        ("Placement", test_drop_piece),
+        ("Victoire", test_check_win),
+        ("Annulation", test_undo),
+        ("Undo / Redo", test_undo_redo),
+        ("Hash Zobrist", test_zobrist_hash),
+        ("Recherche bitboards", test_best_move),
+        ("Make / Unmake", test_make_unmake),
+    ]
+    
+    results = []
+    
+    for name, test_func in tests:
+        try:
+            test_func()
+            results.append((name, True))
+        except AssertionError:
+            results.append((name, False))
+        except Exception as e:
+            print(f"\n❌ ERREUR CRITIQUE dans {name} : {e}")
+            results.append((name, False))
+    
+    # Résumé
+    print_separator("RÉSUMÉ DES TESTS")
+    
+    passed = sum(1 for _, result in results if result)
+    total = len(results)
+    
+    for name, result in results:
+        status = "✅ PASS" if result else "❌ FAIL"
+        print(f"  {status} - {name}")
+    
+    print(f"\n  SCORE : {passed}/{total} tests réussis")
+    
+    if passed == total:
+        print("\n  🎉 TOUS LES TESTS SONT PASSÉS ! 🎉")
+    else:
+        print(f"\n  ⚠️ {total - passed} test(s) ont échoué")
+    
+    print("=" * 70 + "\n")
+
+
+if __name__ == "__main__":
+    run_all_tests()
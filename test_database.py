@@ -10,7 +10,7 @@ import os
 # Ajout du chemin parent pour les imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from src.utils.db_manager import DatabaseManager
+from src.utils.db_manager import DatabaseManager, GameRow
 
 
 def print_separator(title: str = ""):
@@ -21,6 +21,22 @@ def print_separator(title: str = ""):
         print("=" * 70)
 
 
+def _report(checks: list[tuple[str, bool]]) -> bool:
+    """
+    Affiche le résultat de chaque vérification.
+    
+    Args:
+        checks: Liste de tuples (libellé, succès)
+    
+    Returns:
+        True si toutes les vérifications ont réussi
+    """
+    for label, ok in checks:
+        print(f"{'✅' if ok else '❌'} {label}")
+    
+    return all(ok for _, ok in checks)
+
+
 def test_connection():
     """Test de connexion à la base de données."""
     print_separator("TEST 1 : CONNEXION À LA BASE DE DONNÉES")
@@ -293,6 +309,105 @@ def test_deletion():
     return True
 
 
+def test_columnar_read():
+    """Test de la lecture en colonnes (get_all_games_columnar)."""
+    print_separator("TEST 8 : LECTURE EN COLONNES")
+    
+    db = DatabaseManager()
+    
+    if not db.connect():
+        print("❌ Impossible de se connecter")
+        return False
+    
+    db.create_tables()
+    db.insert_games([
+        ('1312', 'PvP', 'TERMINEE', None),
+        ('1323', 'PvAI', 'EN_COURS', None),
+    ])
+    
+    games = db.get_all_games(order_by='id')
+    data = db.get_all_games_columnar()
+    db.disconnect()
+    
+    checks = [
+        ("Nombre de lignes", len(data['id']) == len(games)),
+        ("IDs identiques", data['id'].tolist() == [g['id'] for g in games]),
+        ("Coups identiques", data['coups'].tolist() == [g['coups'] for g in games]),
+        ("Modes identiques", data['mode_jeu'].tolist() == [g['mode_jeu'] for g in games]),
+        ("Statuts identiques", data['statut'].tolist() == [g['statut'] for g in games]),
+    ]
+    
+    return _report(checks)
+
+
+def test_streaming_read():
+    """Test de la lecture en flux interrompue (iter_games)."""
+    print_separator("TEST 9 : LECTURE EN FLUX (iter_games)")
+    
+    db = DatabaseManager()
+    
+    if not db.connect():
+        print("❌ Impossible de se connecter")
+        return False
+    
+    db.create_tables()
+    db.insert_games([
+        ('1412', 'PvP', 'TERMINEE', None),
+        ('1423', 'PvP', 'TERMINEE', None),
+        ('1434', 'PvP', 'TERMINEE', None),
+    ])
+    
+    expected = [g['id'] for g in db.get_all_games(order_by='id')]
+    
+    # Arrêt après la première partie : le générateur fermé doit vider
+    # les lignes non lues et rendre la connexion utilisable
+    games = db.iter_games(order_by='id')
+    first = next(games, None)
+    games.close()
+    
+    count = db.get_game_count()
+    streamed = [g['id'] for g in db.iter_games(order_by='id')]
+    db.disconnect()
+    
+    checks = [
+        ("Première partie lue", first is not None and first['id'] == expected[0]),
+        ("Requête suivante sur la même connexion", count == len(expected)),
+        ("Parcours complet identique à get_all_games", streamed == expected),
+    ]
+    
+    return _report(checks)
+
+
+def test_paged_read():
+    """Test de la lecture par pages (iter_all_games)."""
+    print_separator("TEST 10 : LECTURE PAR PAGES (iter_all_games)")
+    
+    db = DatabaseManager()
+    
+    if not db.connect():
+        print("❌ Impossible de se connecter")
+        return False
+    
+    db.create_tables()
+    sequences = ['1512', '1523', '1534', '1545', '1556']
+    db.insert_games([(coups, 'PvP', 'TERMINEE', None) for coups in sequences])
+    
+    expected = [g['id'] for g in db.get_all_games(order_by='id')]
+    
+    # Pages de 2 parties : au moins 3 pages, dont une incomplète ou vide
+    rows = list(db.iter_all_games(batch_size=2))
+    db.disconnect()
+    
+    checks = [
+        ("Au moins 5 parties lues", len(rows) >= 5),
+        ("Lignes de type GameRow", all(isinstance(row, GameRow) for row in rows)),
+        ("Tous les IDs, dans l'ordre", [row.id for row in rows] == expected),
+        ("Parties insérées présentes", set(sequences) <= {row.coups for row in rows}),
+    ]
+    
+    return _report(checks)
+
+
 def run_all_tests():
     """Exécute tous les tests."""
     print("\n" + "█" * 70)
@@ -307,6 +422,9 @@ def run_all_tests():
         ("Détection de doublons", test_duplicate_detection),
         ("Opérations de lecture", test_read_operations),
         ("Suppression", test_deletion),
+        ("Lecture en colonnes", test_columnar_read),
+        ("Lecture en flux", test_streaming_read),
+        ("Lecture par pages", test_paged_read),
     ]
     
     results = []